@@ -16,7 +16,7 @@ Support for music search and metadata.
 from typing import Optional, Dict, List, Any
 import aiohttp
 
-from sok.apis.base_api import BaseAPI
+from sok.apis.base_api import BaseAPI, json_loads
 from sok.core.interfaces import MediaType, ContentType
 from sok.core.exceptions import APIError
 
@@ -82,17 +82,13 @@ class DeezerApi(BaseAPI):
         Raises:
             APIError: If the request fails or returns an error.
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-
+        session = await self._ensure_session()
         url = f"{self.BASE_URL}/{endpoint}"
-        session = self.session
-        assert session is not None
 
         try:
             async with session.get(url, params=params) as response:
                 response.raise_for_status()
-                response_data: Dict[str, Any] = await response.json()
+                response_data: Dict[str, Any] = await response.json(loads=json_loads)
 
                 if "error" in response_data:
                     raise APIError(
@@ -111,12 +107,12 @@ class DeezerApi(BaseAPI):
         Args:
             query: Search query string.
             content_type: Type of content (ALBUM, ARTIST, TRACK).
-            **kwargs: Additional parameters (limit).
+            **kwargs: Additional parameters (max_results or limit).
 
         Returns:
             Dictionary containing search results.
         """
-        limit = kwargs.get("limit", 20)
+        limit = kwargs.get("max_results", kwargs.get("limit", 20))
         results = []
 
         if content_type == ContentType.ALBUM:
@@ -16,7 +16,7 @@ Support for music search and metadata.
 from typing import Optional, Dict, List, Any
 import aiohttp
 
-from sok.apis.base_api import BaseAPI
+from sok.apis.base_api import BaseAPI, json_loads
 from sok.core.interfaces import MediaType, ContentType
 from sok.core.exceptions import APIError
 
@@ -92,8 +92,7 @@ class LastFMApi(BaseAPI):
         Raises:
             APIError: If the request fails.
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        session = await self._ensure_session()
 
         if params is None:
             params = {}
@@ -104,13 +103,10 @@ class LastFMApi(BaseAPI):
         if endpoint:
             params["method"] = endpoint
 
-        session = self.session
-        assert session is not None
-
         try:
             async with session.get(self.BASE_URL, params=params) as response:
                 response.raise_for_status()
-                response_data: Dict[str, Any] = await response.json()
+                response_data: Dict[str, Any] = await response.json(loads=json_loads)
 
                 if "error" in response_data:
                     raise APIError(
@@ -173,12 +169,12 @@ class LastFMApi(BaseAPI):
         Args:
             query: Search query.
             content_type: Type of content (ALBUM, ARTIST, TRACK).
-            **kwargs: Additional parameters including 'limit'.
+            **kwargs: Additional parameters including 'max_results' or 'limit'.
 
         Returns:
             Dictionary with 'results' key containing search results.
         """
-        limit = kwargs.get("limit", 20)
+        limit = kwargs.get("max_results", kwargs.get("limit", 20))
         results = []
 
         if content_type == ContentType.ALBUM:
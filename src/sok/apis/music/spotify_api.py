@@ -169,7 +169,7 @@ class SpotifyApi(BaseAPI):
         Args:
             query: Search query string.
             content_type: Type to search (ALBUM, TRACK, ARTIST).
-            **kwargs: Additional parameters including 'limit'.
+            **kwargs: Additional parameters including 'max_results' or 'limit'.
 
         Returns:
             Dictionary with 'results' list of matches.
@@ -182,7 +182,8 @@ class SpotifyApi(BaseAPI):
 
         spotify_type = type_mapping.get(content_type, "album")
 
-        params = {"q": query, "type": spotify_type, "limit": kwargs.get("limit", 20)}
+        limit = kwargs.get("max_results", kwargs.get("limit", 20))
+        params = {"q": query, "type": spotify_type, "limit": limit}
 
         data = await self._make_request("search", params)
         results = []
@@ -140,10 +140,12 @@ class TMDBApi(BaseAPI):
         Raises:
             ValueError: If content_type is not supported.
         """
+        # TMDB pages are fixed at 20 results, so only the language applies
+        language = kwargs.get("language", "en")
         if content_type == ContentType.MOVIE:
-            return await self.search_movie(query, **kwargs)
+            return await self.search_movie(query, language)
         elif content_type == ContentType.TV_SERIES:
-            return await self.search_tv(query, **kwargs)
+            return await self.search_tv(query, language)
         else:
             raise ValueError(f"Unsupported content type: {content_type}")
 
@@ -18,7 +18,7 @@ Documentation: https://thetvdb.github.io/v4-api/
 import aiohttp
 import logging
 from typing import Dict, List, Any, Optional
-from sok.apis.base_api import BaseAPI
+from sok.apis.base_api import BaseAPI, json_loads
 from sok.core.exceptions import APIError
 from sok.core.interfaces import MediaType, ContentType
 
@@ -77,18 +77,14 @@ class TVDBApi(BaseAPI):
 
         auth_data = {"apikey": self.api_key}
 
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-
-        session = self.session
-        assert session is not None
+        session = await self._ensure_session()
 
         async with session.post(
             f"{self.base_url}login",
             json=auth_data,
             headers={"Content-Type": "application/json"},
         ) as response:
-            data = await response.json()
+            data = await response.json(loads=json_loads)
             self.token = data.get("data", {}).get("token", "")
             return self.token
 
@@ -124,7 +120,7 @@ class TVDBApi(BaseAPI):
         Args:
             query: Search term
             content_type: Content type
-            **kwargs: Additional arguments (language, year, etc.)
+            **kwargs: Additional arguments (language, year, max_results, etc.)
 
         Returns:
             Search results in standardized format
@@ -153,6 +149,8 @@ class TVDBApi(BaseAPI):
 
         if kwargs.get("year"):
             params["year"] = kwargs["year"]
+        if kwargs.get("max_results"):
+            params["limit"] = kwargs["max_results"]
 
         try:
             data = await self._make_authenticated_request("search", params)
@@ -192,6 +190,9 @@ class TVDBApi(BaseAPI):
         """
         params = {"query": query, "type": "movie"}
 
+        if kwargs.get("max_results"):
+            params["limit"] = kwargs["max_results"]
+
         try:
             data = await self._make_authenticated_request("search", params)
 
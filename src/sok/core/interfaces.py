@@ -16,12 +16,15 @@ and media items that all implementations must follow.
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
-from enum import Enum
+from enum import StrEnum
 
 
-class MediaType(Enum):
+class MediaType(StrEnum):
     """Supported media type categories.
 
+    Members are str subclasses, so they hash and compare in C when used
+    as dictionary keys and format as their plain value.
+
     Attributes:
         VIDEO: Movies, TV series, documentaries.
         MUSIC: Albums, tracks, artists, playlists.
@@ -35,11 +38,12 @@ class MediaType(Enum):
     GAME = "game"
 
 
-class ContentType(Enum):
+class ContentType(StrEnum):
     """Specific content types within media categories.
 
     Used to specify the exact type of content when searching
-    or retrieving details from media APIs.
+    or retrieving details from media APIs. Members are str subclasses,
+    like MediaType.
     """
 
     MOVIE = "movie"
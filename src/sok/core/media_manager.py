@@ -14,10 +14,11 @@ Provides a unified interface to search and retrieve media metadata from
 multiple API sources (TMDB, Spotify, IGDB, etc.) based on media type.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Hashable, Optional, Tuple
 import logging
 import asyncio
 from .interfaces import MediaAPI, MediaType, ContentType
+from .response_cache import ResponseCache
 from sok.core.constants import (
     SERVICE_TMDB,
     SERVICE_TVDB,
@@ -67,6 +68,22 @@ logger = logging.getLogger(__name__)
 # Singleton instance
 _manager_instance: "UniversalMediaManager | None" = None
 
+# Seconds a cached details response stays valid
+DETAILS_CACHE_TTL = 3600.0
+# Maximum number of details responses kept in memory
+DETAILS_CACHE_SIZE = 128
+# Seconds cached search results stay valid, in memory and on disk
+SEARCH_CACHE_TTL = 6 * 3600.0
+# Maximum number of search result lists kept in memory
+SEARCH_CACHE_SIZE = 256
+# Default seconds a UI search may wait for its API (config: search_timeout)
+SEARCH_TIMEOUT = 5.0
+
+# Details responses shared by all workers
+_details_cache = ResponseCache(DETAILS_CACHE_SIZE, DETAILS_CACHE_TTL)
+# Search results shared by all workers, created on first use
+_search_cache: ResponseCache | None = None
+
 
 def get_media_manager() -> "UniversalMediaManager":
     """
@@ -85,6 +102,61 @@ def reset_media_manager() -> None:
     """Reset the singleton (useful for testing)."""
     global _manager_instance
     _manager_instance = None
+    clear_details_cache()
+    if _search_cache is not None:
+        _search_cache.clear()
+
+
+def get_search_cache() -> ResponseCache:
+    """
+    Get the cache shared by all searches.
+
+    Results are kept in memory and in a SQLite file next to the
+    configuration, so repeated queries skip the network across sessions.
+
+    Returns:
+        ResponseCache: The shared search cache.
+    """
+    global _search_cache
+    if _search_cache is None:
+        db_path = get_config_manager().config_path.parent / "search_cache.sqlite3"
+        _search_cache = ResponseCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL, db_path)
+    return _search_cache
+
+
+def get_cached_details(key: Tuple[Hashable, ...]) -> Optional[Dict[str, Any]]:
+    """
+    Get a details response stored by cache_details.
+
+    Args:
+        key: Cache key, e.g. (media_id, content_type, language, episodes).
+
+    Returns:
+        A shallow copy of the cached details, or None if missing or expired.
+    """
+    details = _details_cache.get(key)
+    return None if details is None else dict(details)
+
+
+def cache_details(
+    key: Tuple[Hashable, ...],
+    details: Dict[str, Any],
+    ttl: float = DETAILS_CACHE_TTL,
+) -> None:
+    """
+    Store a details response for later get_cached_details calls.
+
+    Args:
+        key: Cache key, e.g. (media_id, content_type, language, episodes).
+        details: Details dictionary; a shallow copy is stored.
+        ttl: Seconds before the entry expires.
+    """
+    _details_cache.set(key, dict(details), ttl)
+
+
+def clear_details_cache() -> None:
+    """Drop every cached details response."""
+    _details_cache.clear()
 
 
 class UniversalMediaManager:
@@ -313,13 +385,18 @@ class UniversalMediaManager:
         return self.apis[self.current_apis[media_type]]
 
     async def search(
-        self, query: str, content_type: ContentType, **kwargs: Any
+        self,
+        query: str,
+        content_type: ContentType,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
     ) -> Dict[str, Any]:
         """Search for media using the appropriate API.
 
         Args:
             query: Search query string.
             content_type: Type of content to search for.
+            timeout: Seconds to wait for the API, or None to wait indefinitely.
             **kwargs: Additional API-specific parameters (e.g., language, year).
 
         Returns:
@@ -335,7 +412,9 @@ class UniversalMediaManager:
         api = self.get_current_api(media_type)
         api_name = self.current_apis.get(media_type, "unknown")
         try:
-            raw = await api.search(query, content_type, **kwargs)
+            raw = await asyncio.wait_for(
+                api.search(query, content_type, **kwargs), timeout
+            )
             results = raw.get("results", []) if isinstance(raw, dict) else []
             return adapt_search_results(content_type, results)
         except asyncio.TimeoutError as exc:
@@ -0,0 +1,299 @@
+# ===----------------------------------------------------------------------=== #
+#
+# This source file is part of the S.O.K open source project
+#
+# Copyright (c) 2026 S.O.K Team
+# Licensed under the MIT License
+#
+# See LICENSE for license information
+#
+# ===----------------------------------------------------------------------=== #
+"""
+Expiring caches for API responses.
+
+Workers run on their own threads, so every cache here is guarded by a lock.
+An optional SQLite file keeps JSON-serializable responses across sessions.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional, Tuple
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[Hashable, ...]
+
+
+class ResponseCache:
+    """Thread-safe LRU cache whose entries expire after a TTL.
+
+    Lookups check memory first, then the optional SQLite file; disk hits
+    are promoted to memory. Keys are tuples whose first item is the tag
+    used by invalidate() (e.g. the search query). Coroutines should use
+    aget() and aset(), which run the SQLite tier on a worker thread.
+
+    Attributes:
+        max_size: Maximum number of entries kept in memory.
+        ttl: Default lifetime of an entry in seconds.
+        db_path: SQLite file for the persistent tier, or None.
+    """
+
+    def __init__(self, max_size: int, ttl: float, db_path: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept in memory.
+            ttl: Default lifetime of an entry in seconds.
+            db_path: SQLite file for the persistent tier, or None for memory only.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.db_path = db_path
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Separate lock so memory hits never wait behind a disk query
+        self._db_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value, or None if missing or expired.
+        """
+        value = self._get_memory(key)
+        if value is None and self.db_path is not None:
+            value = self._get_disk(key)
+        return value
+
+    async def aget(self, key: CacheKey) -> Optional[Any]:
+        """Get a cached value without blocking the event loop on disk.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value, or None if missing or expired.
+        """
+        value = self._get_memory(key)
+        if value is None and self.db_path is not None:
+            value = await asyncio.to_thread(self._get_disk, key)
+        return value
+
+    def set(self, key: CacheKey, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value.
+
+        Values that cannot be serialized to JSON are kept in memory only.
+
+        Args:
+            key: Cache key.
+            value: Value to cache; callers must not mutate it afterwards.
+            ttl: Lifetime in seconds (defaults to the cache TTL).
+        """
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._remember(key, value, ttl)
+        if self.db_path is not None:
+            self._db_set(key, value, ttl)
+
+    async def aset(
+        self, key: CacheKey, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        """Store a value without blocking the event loop on disk.
+
+        Args:
+            key: Cache key.
+            value: Value to cache; callers must not mutate it afterwards.
+            ttl: Lifetime in seconds (defaults to the cache TTL).
+        """
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._remember(key, value, ttl)
+        if self.db_path is not None:
+            await asyncio.to_thread(self._db_set, key, value, ttl)
+
+    def invalidate(self, tag: Hashable) -> None:
+        """Drop every entry whose key starts with a tag.
+
+        Args:
+            tag: First item of the keys to drop.
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k and k[0] == tag]:
+                del self._entries[key]
+        if self.db_path is not None:
+            self._db_execute("DELETE FROM responses WHERE tag = ?", (str(tag),))
+
+    def clear(self) -> None:
+        """Drop every in-memory entry; the SQLite file is left untouched."""
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        """Close the SQLite connection; it is reopened on next use."""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _get_memory(self, key: CacheKey) -> Optional[Any]:
+        """Get an unexpired value from the memory tier.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+            return None
+
+    def _get_disk(self, key: CacheKey) -> Optional[Any]:
+        """Get a value from the SQLite tier and promote it to memory.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value, or None if missing or expired.
+        """
+        found = self._db_get(key)
+        if found is None:
+            return None
+        remaining, value = found
+        with self._lock:
+            self._remember(key, value, remaining)
+        return value
+
+    def _remember(self, key: CacheKey, value: Any, ttl: float) -> None:
+        """Insert an entry in memory, evicting the least recently used ones.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            ttl: Lifetime in seconds.
+        """
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _db_key(key: CacheKey) -> str:
+        """Serialize a key for the SQLite tier.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Stable string form of the key.
+        """
+        return json.dumps([str(part) for part in key])
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the shared connection, opening the SQLite file on first use.
+
+        Opening creates the table and purges the rows that expired since
+        the last session. The caller must hold _db_lock.
+
+        Returns:
+            Open connection, kept until close().
+        """
+        if self._conn is None:
+            assert self.db_path is not None
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=1.0, check_same_thread=False)
+            try:
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS responses ("
+                        "key TEXT PRIMARY KEY, tag TEXT, value TEXT, expires_at REAL)"
+                    )
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS responses_tag ON responses(tag)"
+                    )
+                    conn.execute(
+                        "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+                    )
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def _db_execute(self, sql: str, params: tuple) -> list:
+        """Run a statement on the SQLite tier, logging failures.
+
+        Args:
+            sql: SQL statement.
+            params: Statement parameters.
+
+        Returns:
+            Fetched rows, or an empty list on error.
+        """
+        with self._db_lock:
+            try:
+                conn = self._connection()
+                with conn:
+                    return conn.execute(sql, params).fetchall()
+            except (sqlite3.Error, OSError) as exc:
+                logger.warning("Response cache unavailable: %s", exc, exc_info=exc)
+                return []
+
+    def _db_get(self, key: CacheKey) -> Optional[Tuple[float, Any]]:
+        """Read an unexpired entry from the SQLite tier.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            (remaining seconds, value), or None if missing or expired.
+        """
+        rows = self._db_execute(
+            "SELECT value, expires_at FROM responses WHERE key = ?",
+            (self._db_key(key),),
+        )
+        if not rows:
+            return None
+        raw, expires_at = rows[0]
+        remaining = expires_at - time.time()
+        if remaining <= 0:
+            return None
+        try:
+            return remaining, json.loads(raw)
+        except ValueError:
+            return None
+
+    def _db_set(self, key: CacheKey, value: Any, ttl: float) -> None:
+        """Write an entry to the SQLite tier if it serializes to JSON.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl: Lifetime in seconds.
+        """
+        try:
+            raw = json.dumps(value)
+        except (TypeError, ValueError):
+            return
+        self._db_execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+            (self._db_key(key), str(key[0]) if key else "", raw, time.time() + ttl),
+        )
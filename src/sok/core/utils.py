@@ -28,6 +28,9 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     return logger
 
 
+_EPISODE_RE = re.compile(r"(?P<name>.*)S(?P<season>\d+)E(?P<episode>\d+)(?P<rest>.*)")
+
+
 def format_name(name: str) -> str:
     """Formats a filename by removing forbidden characters"""
     return re.sub(" +", " ", re.sub(r'[<>:"/\\|?*]', "", name))
@@ -35,9 +38,7 @@ def format_name(name: str) -> str:
 
 def extract_episode_info(filename: str) -> Optional[dict]:
     """Extracts episode information from a filename"""
-    match = re.search(
-        r"(?P<name>.*)S(?P<season>\d+)E(?P<episode>\d+)(?P<rest>.*)", filename
-    )
+    match = _EPISODE_RE.search(filename)
     if match:
         return {
             "name": match.group("name").strip(),
@@ -22,9 +22,15 @@ parsing and validation mixins with concrete file operations:
 
 import os
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import shutil
 import logging
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
+
+try:
+    import xxhash
+except ImportError:  # Optional speedup, see _new_hasher()
+    xxhash = None
 
 from .mixins import (
     FileParsingMixin,
@@ -40,6 +46,11 @@ from .mixins import (
 
 logger = logging.getLogger(__name__)
 
+# Read size used when hashing files for duplicate detection
+DUPLICATE_HASH_CHUNK = 1 << 20
+# Files hashed at the same time during duplicate detection
+DUPLICATE_HASH_WORKERS = 8
+
 __all__ = [
     "BaseFileOperations",
     "FileParsingMixin",
@@ -53,6 +64,25 @@ __all__ = [
 ]
 
 
+def _new_hasher(algorithm: str):
+    """Create a hash object for an algorithm name.
+
+    'xxh3' uses xxhash when installed and falls back to BLAKE2b, the
+    fastest hashlib algorithm on 64-bit machines.
+
+    Args:
+        algorithm: 'xxh3' or any hashlib algorithm name.
+
+    Returns:
+        Object with update() and hexdigest().
+    """
+    if algorithm == "xxh3":
+        if xxhash is not None:
+            return xxhash.xxh3_64()
+        return hashlib.blake2b(digest_size=16)
+    return hashlib.new(algorithm)
+
+
 class BaseFileOperations(FileParsingMixin, FileValidationMixin):
     """Base class with common utilities for file operations.
 
@@ -68,13 +98,13 @@ class BaseFileOperations(FileParsingMixin, FileValidationMixin):
 
         Args:
             file_path: Path to the file.
-            algorithm: Hash algorithm ('md5', 'sha1', 'sha256').
+            algorithm: Hash algorithm ('md5', 'sha1', 'sha256', 'xxh3').
             chunk_size: Chunk size for reading in bytes.
 
         Returns:
             File hash in hexadecimal, or empty string on error.
         """
-        hash_obj = hashlib.new(algorithm)
+        hash_obj = _new_hasher(algorithm)
 
         try:
             with open(file_path, "rb") as f:
@@ -93,55 +123,113 @@ class BaseFileOperations(FileParsingMixin, FileValidationMixin):
         recursive: bool = True,
         by_hash: bool = True,
         by_size: bool = False,
+        hash_algo: str = "xxh3",
     ) -> Dict[str, List[str]]:
         """Find duplicate files in a directory.
 
+        The default 'xxh3' hash is not cryptographic, which is fine for
+        spotting identical files: an accidental collision between two
+        different files is far less likely than a disk error. Pass
+        'sha256' when the keys must resist deliberate collisions.
+
         Args:
             directory: Directory path to analyze.
             extensions: File extensions to consider.
             recursive: Whether to search recursively.
             by_hash: Compare by file hash (more accurate).
             by_size: Compare by file size (faster).
+            hash_algo: Hash used when by_hash is set ('xxh3', 'sha256', ...).
 
         Returns:
             Dictionary mapping keys to lists of duplicate file paths.
         """
         files_map: Dict[str, List[str]] = {}
-
-        files_to_check = []
-        if recursive:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if any(file.lower().endswith(ext) for ext in extensions):
-                        files_to_check.append(os.path.join(root, file))
+        sized_files = BaseFileOperations._scan_sized_files(
+            directory, extensions, recursive
+        )
+
+        if by_hash:
+            # Only files sharing a size can be identical, so the others are
+            # never read
+            by_length: Dict[int, List[str]] = {}
+            for file_path, size in sized_files:
+                by_length.setdefault(size, []).append(file_path)
+            files_to_hash = [
+                file_path
+                for group in by_length.values()
+                if len(group) > 1
+                for file_path in group
+            ]
+            # File reads and hashing release the GIL, so a few threads keep
+            # several reads in flight instead of waiting on one file at a time
+            with ThreadPoolExecutor(max_workers=DUPLICATE_HASH_WORKERS) as pool:
+                digests = pool.map(
+                    lambda path: BaseFileOperations.calculate_file_hash(
+                        path, hash_algo, DUPLICATE_HASH_CHUNK
+                    ),
+                    files_to_hash,
+                )
+                keyed = list(zip(digests, files_to_hash))
+        elif by_size:
+            keyed = [(str(size), file_path) for file_path, size in sized_files]
         else:
-            for file in os.listdir(directory):
-                if any(file.lower().endswith(ext) for ext in extensions):
-                    files_to_check.append(os.path.join(directory, file))
+            keyed = [
+                (os.path.basename(file_path).lower(), file_path)
+                for file_path, _size in sized_files
+            ]
 
-        for file_path in files_to_check:
-            try:
-                if by_hash:
-                    key = BaseFileOperations.calculate_file_hash(file_path)
-                elif by_size:
-                    key = str(os.path.getsize(file_path))
-                else:
-                    key = os.path.basename(file_path).lower()
-
-                if key:
-                    if key not in files_map:
-                        files_map[key] = []
-                    files_map[key].append(file_path)
-
-            except OSError as exc:
-                logger.exception(
-                    "Duplicate scan failed for %s", file_path, exc_info=exc
-                )
+        for key, file_path in keyed:
+            if key:
+                files_map.setdefault(key, []).append(file_path)
 
         duplicates = {k: v for k, v in files_map.items() if len(v) > 1}
 
         return duplicates
 
+    @staticmethod
+    def _scan_sized_files(
+        directory: str, extensions: List[str], recursive: bool
+    ) -> List[Tuple[str, int]]:
+        """List files with matching extensions along with their sizes.
+
+        Uses os.scandir so the size comes from the entry scanned, without
+        a separate getsize() call per file. Unreadable directories and
+        files are logged and skipped.
+
+        Args:
+            directory: Directory path to analyze.
+            extensions: File extensions to consider.
+            recursive: Whether to search recursively.
+
+        Returns:
+            List of (file path, size in bytes) tuples.
+        """
+        # str.endswith takes a tuple, so each name is matched in a single C call
+        suffixes = tuple(ext.lower() for ext in extensions)
+        sized_files: List[Tuple[str, int]] = []
+        pending = [directory]
+
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if recursive and entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.lower().endswith(suffixes) and entry.is_file():
+                            try:
+                                sized_files.append((entry.path, entry.stat().st_size))
+                            except OSError as exc:
+                                logger.exception(
+                                    "Duplicate scan failed for %s",
+                                    entry.path,
+                                    exc_info=exc,
+                                )
+            except OSError as exc:
+                logger.exception("Duplicate scan failed for %s", current, exc_info=exc)
+
+        return sized_files
+
     @staticmethod
     def safe_move(
         source: str, destination: str, overwrite: bool = False, create_dirs: bool = True
@@ -322,17 +410,23 @@ class BaseFileOperations(FileParsingMixin, FileValidationMixin):
             Total size in bytes.
         """
         total_size = 0
+        pending = [directory]
 
-        try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if os.path.exists(file_path):
-                        total_size += os.path.getsize(file_path)
-        except OSError as exc:
-            logger.exception(
-                "Directory size calculation failed for %s", directory, exc_info=exc
-            )
+        # DirEntry caches its type, so each file costs one stat call
+        # instead of the exists() + getsize() pair
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            total_size += entry.stat().st_size
+            except OSError as exc:
+                logger.exception(
+                    "Directory size calculation failed for %s", current, exc_info=exc
+                )
 
         return total_size
 
@@ -14,11 +14,11 @@ UI Components package.
 This package contains reusable UI components for the S.O.K application, such as base widgets, dialogs, input fields, layouts, preview panels, search bars, sidebars, and window elements.
 """
 
-from sok.ui.components.base import Card, Row, Toggle, ActionButton
+from sok.ui.components.base import Card, Row, Toggle, ActionButton, ShadowHost
 from sok.ui.components.dialogs import SearchResultCard, SearchResultsDialog
 from sok.ui.components.inputs import ModernComboBox, SearchBar, FileItemRow, DropZone
 from sok.ui.components.layouts import FlowLayout
-from sok.ui.components.preview import FileRow
+from sok.ui.components.preview import FileRow, FileRowDelegate, PreviewModel
 from sok.ui.components.search import (
     ImageLoaderWorker,
     SearchResultRow,
@@ -32,6 +32,7 @@ __all__ = [
     "Row",
     "Toggle",
     "ActionButton",
+    "ShadowHost",
     "SearchResultCard",
     "SearchResultsDialog",
     "ModernComboBox",
@@ -40,6 +41,8 @@ __all__ = [
     "DropZone",
     "FlowLayout",
     "FileRow",
+    "FileRowDelegate",
+    "PreviewModel",
     "ImageLoaderWorker",
     "SearchResultRow",
     "SelectedMediaWidget",
@@ -12,11 +12,27 @@
 Base UI Components - Cards, Rows, Toggles and Buttons
 """
 
-from PySide6.QtWidgets import QFrame, QVBoxLayout, QWidget, QPushButton
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, Property, QRect
+from PySide6.QtWidgets import (
+    QFrame,
+    QPushButton,
+    QStyle,
+    QStyleOption,
+    QVBoxLayout,
+    QWidget,
+)
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QEvent,
+    QPropertyAnimation,
+    QEasingCurve,
+    Property,
+    QRect,
+)
 from PySide6.QtGui import QPainter, QColor, QFont
 
-from sok.ui.theme import Theme
+from sok.ui.theme import Theme, paint_card_shadow
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,28 +43,35 @@ def parse_color(value) -> QColor:
     if isinstance(value, QColor):
         return value
     if isinstance(value, str):
-        value = value.strip()
-        if value.startswith("rgba"):
-            try:
-                # rgba(255, 255, 255, 0.15)
-                content = value[value.find("(") + 1 : value.find(")")]
-                parts = content.split(",")
-                if len(parts) == 4:
-                    r = int(parts[0].strip())
-                    g = int(parts[1].strip())
-                    b = int(parts[2].strip())
-                    a_str = parts[3].strip()
-                    if "." in a_str:
-                        a = int(float(a_str) * 255)
-                    else:
-                        a = int(a_str)
-                    return QColor(r, g, b, a)
-            except (ValueError, TypeError) as exc:
-                logger.debug("Failed to parse rgba color %s", value, exc_info=exc)
-        return QColor(value)
+        # Copy so callers may setAlpha() without corrupting the cache
+        return QColor(_parse_color_str(value))
     return QColor()
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_color_str(value: str) -> QColor:
+    """Parse a color string once; theme palettes only hold a few dozen."""
+    value = value.strip()
+    if value.startswith("rgba"):
+        try:
+            # rgba(255, 255, 255, 0.15)
+            content = value[value.find("(") + 1 : value.find(")")]
+            parts = content.split(",")
+            if len(parts) == 4:
+                r = int(parts[0].strip())
+                g = int(parts[1].strip())
+                b = int(parts[2].strip())
+                a_str = parts[3].strip()
+                if "." in a_str:
+                    a = int(float(a_str) * 255)
+                else:
+                    a = int(a_str)
+                return QColor(r, g, b, a)
+        except (ValueError, TypeError) as exc:
+            logger.debug("Failed to parse rgba color %s", value, exc_info=exc)
+    return QColor(value)
+
+
 class Card(QFrame):
     """Card container widget.
 
@@ -85,6 +108,105 @@ class Card(QFrame):
         self._layout.addWidget(widget)
 
 
+class ShadowHost(QWidget):
+    """Container that paints card shadows behind its child Card widgets.
+
+    Replaces one QGraphicsDropShadowEffect per card, which re-renders and
+    blurs the card offscreen on every paint, with a shadow tile blurred
+    once and blitted by the parent. Other children opt in with
+    add_shadow().
+
+    The host can only paint inside its own rect, so its layout must keep
+    SHADOW_MARGIN free around the cards; cards that touch their parent's
+    edges keep card_shadow() instead.
+    """
+
+    # Blur radius plus offset, rounded up: how far a shadow reaches past a card
+    SHADOW_MARGIN = 24
+    _SHADOW_EVENTS = frozenset(
+        {
+            QEvent.Type.Move,
+            QEvent.Type.Resize,
+            QEvent.Type.Show,
+            QEvent.Type.Hide,
+        }
+    )
+
+    @staticmethod
+    def add_shadow(widget: QWidget) -> None:
+        """Have the host paint a card shadow behind a child that is not a Card.
+
+        Args:
+            widget: Direct child of a ShadowHost.
+        """
+        widget.setProperty("cardShadow", True)
+
+    @staticmethod
+    def _casts_shadow(widget) -> bool:
+        """Check whether a child gets a shadow painted behind it.
+
+        Args:
+            widget: Child object.
+
+        Returns:
+            True for Card children and children passed to add_shadow().
+        """
+        return isinstance(widget, Card) or (
+            isinstance(widget, QWidget) and bool(widget.property("cardShadow"))
+        )
+
+    def event(self, e):
+        """Track children so moved or hidden cards repaint their shadow.
+
+        Args:
+            e: Event.
+
+        Returns:
+            Result of the base implementation.
+        """
+        if e.type() == QEvent.Type.ChildAdded and isinstance(e.child(), QWidget):
+            e.child().installEventFilter(self)
+        return super().event(e)
+
+    def eventFilter(self, obj, e):
+        """Repaint when a child changes geometry or visibility.
+
+        Args:
+            obj: Watched child.
+            e: Event.
+
+        Returns:
+            False, so the child still receives the event.
+        """
+        if e.type() in self._SHADOW_EVENTS and self._casts_shadow(obj):
+            self.update()
+        return False
+
+    def paintEvent(self, e):
+        """Paint the styled background, then a shadow behind every card.
+
+        Args:
+            e: Paint event.
+        """
+        p = QPainter(self)
+        opt = QStyleOption()
+        opt.initFrom(self)
+        self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget, opt, p, self)
+        dirty = e.rect()
+        for child in self.children():
+            if self._casts_shadow(child) and child.isVisible():
+                rect = child.geometry()
+                if dirty.intersects(
+                    rect.adjusted(
+                        -self.SHADOW_MARGIN,
+                        -self.SHADOW_MARGIN,
+                        self.SHADOW_MARGIN,
+                        self.SHADOW_MARGIN,
+                    )
+                ):
+                    paint_card_shadow(p, rect)
+
+
 class Row(QWidget):
     """Simple data row for settings and info display.
 
@@ -121,6 +121,14 @@ class OAuthManager(QObject):
             lambda err: self._on_error(service, err),
         )
 
+    def is_busy(self) -> bool:
+        """Check whether an authentication flow is in progress.
+
+        Returns:
+            True while the authentication worker is running.
+        """
+        return self._runner.is_running()
+
     def _on_success(self, service: str, data: dict):
         """Handle authentication success.
 
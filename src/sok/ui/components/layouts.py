@@ -155,8 +155,10 @@ class FlowLayout(QLayout):
         Returns:
             Total height used.
         """
-        x = rect.x()
-        y = rect.y()
+        left, top, right, bottom = self.getContentsMargins()
+        area = rect.adjusted(left, top, -right, -bottom)
+        x = area.x()
+        y = area.y()
         line_height = 0
         spacing = self.spacing()
 
@@ -169,7 +171,7 @@ class FlowLayout(QLayout):
             w = size.width()
             h = size.height()
 
-            if current_row and (current_row_width + w + spacing > rect.width()):
+            if current_row and (current_row_width + w + spacing > area.width()):
                 rows.append((current_row, current_row_width, line_height))
                 current_row = []
                 current_row_width = 0
@@ -190,7 +192,7 @@ class FlowLayout(QLayout):
 
             actual_used_width = row_width - spacing
 
-            available_width = rect.width()
+            available_width = area.width()
             extra_space = max(0, available_width - actual_used_width)
 
             add_per_item = extra_space / len(row_items)
@@ -207,4 +209,6 @@ class FlowLayout(QLayout):
 
             y_off += row_height + spacing
 
-        return y_off - rect.y()
+        if not rows:
+            return 0
+        return y_off - rect.y() + bottom
@@ -38,7 +38,7 @@ class LogLevel(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """Log entry for organization operations.
 
@@ -88,9 +88,7 @@ class MovieRow(QWidget):
         left = QVBoxLayout()
         left.setSpacing(2)
         self._original_lbl = QLabel(file.name)
-        self._original_lbl.setStyleSheet(
-            f"color: {Theme.DARK['secondary']}; font-size: 11px;"
-        )
+        self._original_lbl.setObjectName("MovieOriginalName")
         self._original_lbl.setSizePolicy(
             QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred
         )
@@ -130,32 +128,7 @@ class MovieRow(QWidget):
 
         self._match_combo = QComboBox()
         self._match_combo.setFixedHeight(24)
-        self._match_combo.setStyleSheet(
-            f"""
-            QComboBox {{
-                background: {Theme.DARK["input_bg"]};
-                border: 1px solid {Theme.DARK["separator"]};
-                border-radius: 6px;
-                padding: 2px 8px;
-                color: {Theme.DARK["text"]};
-            }}
-            QComboBox QAbstractItemView {{
-                background: {Theme.DARK["dropdown_bg"]};
-                border: 1px solid {Theme.DARK["separator"]};
-                border-radius: 6px;
-                padding: 4px;
-                color: {Theme.DARK["text"]};
-                outline: none;
-                selection-background-color: {Theme.DARK["accent"]};
-                selection-color: {Theme.DARK["accent_text"]};
-            }}
-            QComboBox QAbstractItemView::item {{
-                min-height: 24px;
-                padding-left: 8px;
-                color: {Theme.DARK["text"]};
-            }}
-            """
-        )
+        self._match_combo.setObjectName("MovieMatchCombo")
         self._match_combo.currentIndexChanged.connect(self._on_match_changed)
         mid.addWidget(self._match_combo)
         layout.addLayout(mid, 3)
@@ -227,6 +227,22 @@ class OptionsPanel(QWidget):
         """
         self._create_folders_btn.setText(text)
 
+    def reset_create_folders_ui(self, text: str, hide_progress: bool = True) -> None:
+        """Restore the create folders button after a run, in one repaint.
+
+        Args:
+            text: Button text.
+            hide_progress: Whether to also hide the progress display.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            if hide_progress:
+                self.set_progress(False)
+            self._create_folders_btn.setEnabled(True)
+            self._create_folders_btn.setText(text)
+        finally:
+            self.setUpdatesEnabled(True)
+
     def retranslate_ui(self):
         """Updates texts after a language change."""
         self._lbl_source.setText(tr("source_folders", "SOURCE FOLDERS"))
@@ -64,6 +64,9 @@ class SearchPanel(QWidget):
             - str: Content type ('tv', 'movie', 'album', 'artist', 'book', 'game')
         search_started(str): Emitted when a search is started.
             - str: Search query text
+        refresh_requested(str): Emitted before a search started from the
+            search button, so cached results for the query are dropped.
+            - str: Search query text
         type_changed(str): Emitted when content type changes.
             - str: New selected content type
 
@@ -76,6 +79,7 @@ class SearchPanel(QWidget):
 
     media_selected = Signal(dict, str)
     search_started = Signal(str)
+    refresh_requested = Signal(str)
     type_changed = Signal(str)
 
     def __init__(self, media_type: str, parent: Optional[QWidget] = None):
@@ -229,8 +233,11 @@ class SearchPanel(QWidget):
             self._status_label.setText("")
 
     def _on_manual_search(self):
-        """Handle manual search via button click."""
+        """Handle manual search via button click, bypassing cached results."""
         self._auto_select = False
+        query = self._search_input.text().strip()
+        if query:
+            self.refresh_requested.emit(query)
         self._emit_search()
 
     def _emit_search(self):
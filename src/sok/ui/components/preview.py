@@ -12,8 +12,21 @@
 Preview Components - File rows for organization preview
 """
 
-from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QSizePolicy
+from pathlib import Path
+from typing import Iterable, Mapping, Sequence
 
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt
+from PySide6.QtGui import QFont, QFontMetrics, QPainter
+from PySide6.QtWidgets import (
+    QWidget,
+    QHBoxLayout,
+    QLabel,
+    QSizePolicy,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+)
+
+from sok.ui.components.base import parse_color
 from sok.ui.theme import Theme, svg_icon
 
 
@@ -26,10 +39,10 @@ class FileRow(QWidget):
     Attributes:
         filename: Original filename.
         new_name: New filename after processing.
-        info: Additional file information dictionary.
+        info: Additional file information mapping (treated as read-only).
     """
 
-    def __init__(self, filename: str, new_name: str, info: dict, parent=None):
+    def __init__(self, filename: str, new_name: str, info: Mapping, parent=None):
         """Initialize the file row.
 
         Args:
@@ -109,3 +122,229 @@ class FileRow(QWidget):
             event: Resize event (unused).
         """
         pass
+
+
+class PreviewModel(QAbstractListModel):
+    """List model of previewed files and their computed new names.
+
+    Backs the organize preview list; rows are painted by FileRowDelegate
+    instead of being built from one FileRow widget each.
+
+    Attributes:
+        NewNameRole: Item data role holding the computed new name.
+    """
+
+    NewNameRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        """Initialize an empty model.
+
+        Args:
+            parent: Parent object.
+        """
+        super().__init__(parent)
+        self._files: tuple[Path, ...] = ()
+        self._new_names: list[str] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Return the number of previewed files.
+
+        Args:
+            parent: Parent index; only the invalid root has rows.
+
+        Returns:
+            Row count.
+        """
+        return 0 if parent.isValid() else len(self._files)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the original filename or the computed new name of a row.
+
+        Args:
+            index: Model index of the row.
+            role: Qt.DisplayRole for the filename, NewNameRole for the new name.
+
+        Returns:
+            Requested string, or None for other roles.
+        """
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._files[index.row()].name
+        if role == self.NewNameRole:
+            return self._new_names[index.row()]
+        return None
+
+    @property
+    def files(self) -> tuple[Path, ...]:
+        """Get the previewed file paths.
+
+        Returns:
+            Tuple of file paths in row order.
+        """
+        return self._files
+
+    @property
+    def new_names(self) -> Sequence[str]:
+        """Get the computed new names.
+
+        The model's own list is returned without a copy; do not mutate it.
+
+        Returns:
+            New names in row order, empty strings when unknown.
+        """
+        return self._new_names
+
+    def set_files(self, files: Iterable[Path]) -> None:
+        """Replace the previewed files, clearing their new names.
+
+        Args:
+            files: File paths to preview.
+        """
+        self.beginResetModel()
+        self._files = tuple(files)
+        self._new_names = [""] * len(self._files)
+        self.endResetModel()
+
+    def set_new_names(self, names: Iterable[str]) -> None:
+        """Set new names in row order and notify views once.
+
+        Args:
+            names: One name per row; rows beyond the names are left as is.
+        """
+        current = self._new_names
+        changed = []
+        for row, name in zip(range(len(current)), names):
+            if current[row] != name:
+                current[row] = name
+                changed.append(row)
+        self._emit_names_changed(changed)
+
+    def apply_names(self, names: Mapping[Path, str]) -> None:
+        """Set new names by file path and notify views once.
+
+        Args:
+            names: Mapping of file path to new name; other rows are kept.
+        """
+        current = self._new_names
+        changed = []
+        for row, file_path in enumerate(self._files):
+            name = names.get(file_path)
+            if name is not None and current[row] != name:
+                current[row] = name
+                changed.append(row)
+        self._emit_names_changed(changed)
+
+    def _emit_names_changed(self, rows: list[int]) -> None:
+        """Signal views that the new names of some rows changed.
+
+        Emits nothing when no name changed, so unchanged rows are not
+        repainted.
+
+        Args:
+            rows: Changed rows, in ascending order.
+        """
+        if rows:
+            self.dataChanged.emit(
+                self.index(rows[0]), self.index(rows[-1]), [self.NewNameRole]
+            )
+
+
+class FileRowDelegate(QStyledItemDelegate):
+    """Paints PreviewModel rows with the FileRow layout and colors.
+
+    Rows after the first include the 1 px separator Card.add() used to
+    insert between row widgets.
+    """
+
+    _ROW_HEIGHT = 36
+    _MARGIN_X = 12
+    _MARGIN_Y = 8
+    _SPACING = 10
+    _ICON_BOX = 16
+    _ICON_SIZE = 14
+
+    def sizeHint(self, option: QStyleOptionViewItem, index) -> QSize:
+        """Return the fixed row height, plus the separator after row 0.
+
+        Args:
+            option: Style options (unused).
+            index: Model index of the row.
+
+        Returns:
+            Row size hint.
+        """
+        return QSize(0, self._ROW_HEIGHT + (1 if index.row() else 0))
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index) -> None:
+        """Paint icon, original name, arrow and new name of one row.
+
+        Args:
+            painter: Painter of the view viewport.
+            option: Style options holding the row rectangle and font.
+            index: Model index of the row.
+        """
+        c = Theme.DARK
+        rect = QRect(option.rect)
+        painter.save()
+        if index.row():
+            painter.fillRect(
+                QRect(rect.left() + self._MARGIN_X, rect.top(), rect.width(), 1),
+                parse_color(Theme.current_palette["separator"]),
+            )
+            rect.setTop(rect.top() + 1)
+
+        body = rect.adjusted(
+            self._MARGIN_X, self._MARGIN_Y, -self._MARGIN_X, -self._MARGIN_Y
+        )
+        filename = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        new_name = index.data(PreviewModel.NewNameRole) or ""
+        changed = bool(new_name) and new_name != filename
+
+        icon = svg_icon("file", "#B3B3B3", self._ICON_SIZE)
+        painter.drawPixmap(
+            body.left(), body.center().y() - self._ICON_SIZE // 2 + 1, icon
+        )
+
+        name_font = QFont(option.font)
+        name_font.setPixelSize(12)
+        arrow_font = QFont(option.font)
+        arrow_font.setBold(changed)
+        new_font = QFont(name_font)
+        new_font.setBold(changed)
+        new_font.setItalic(not changed)
+
+        x = body.left() + self._ICON_BOX + self._SPACING
+        arrow_width = QFontMetrics(arrow_font).horizontalAdvance("→")
+        text_width = max(
+            0, (body.right() + 1 - x - arrow_width - 2 * self._SPACING) // 2
+        )
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+        painter.setFont(name_font)
+        painter.setPen(parse_color(c["secondary"]))
+        name_rect = QRect(x, body.top(), text_width, body.height())
+        painter.drawText(
+            name_rect,
+            align,
+            QFontMetrics(name_font).elidedText(
+                filename, Qt.TextElideMode.ElideRight, text_width
+            ),
+        )
+
+        x += text_width + self._SPACING
+        accent = parse_color(c["green"] if changed else c["tertiary"])
+        painter.setFont(arrow_font)
+        painter.setPen(accent)
+        painter.drawText(QRect(x, body.top(), arrow_width, body.height()), align, "→")
+
+        x += arrow_width + self._SPACING
+        painter.setFont(new_font)
+        painter.drawText(
+            QRect(x, body.top(), text_width, body.height()),
+            align,
+            QFontMetrics(new_font).elidedText(
+                new_name or "...", Qt.TextElideMode.ElideRight, text_width
+            ),
+        )
+        painter.restore()
@@ -10,13 +10,47 @@
 # ===----------------------------------------------------------------------=== #
 """Helpers for OrganizePage preview/detection logic."""
 
+from itertools import islice
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterable, List, Mapping, Tuple, Optional
 
 from PySide6.QtWidgets import QLabel
 from PySide6.QtCore import Qt
 
-from sok.ui.components.preview import FileRow
+
+def _detect_video(info: Mapping) -> Tuple[str, Optional[str]]:
+    """Return query and content type for a parsed video filename."""
+    return info.get("title", ""), info.get("type", "")
+
+
+def _detect_music(info: Mapping) -> Tuple[str, Optional[str]]:
+    """Return query and content type for a parsed audio filename."""
+    artist = info.get("artist", "")
+    album = info.get("album", "")
+    if artist and album:
+        return f"{artist} {album}", "album"
+    if artist:
+        return artist, "artist"
+    return info.get("title", ""), None
+
+
+def _detect_book(info: Mapping) -> Tuple[str, Optional[str]]:
+    """Return query and content type for a parsed book filename."""
+    title = info.get("title", "")
+    author = info.get("author")
+    if author:
+        return f"{title} {author}", None
+    return title, None
+
+
+def _detect_game(info: Mapping) -> Tuple[str, Optional[str]]:
+    """Return query and content type for a parsed game filename."""
+    return info.get("title", ""), None
+
+
+def _detect_default(info: Mapping) -> Tuple[str, Optional[str]]:
+    """Return an empty detection for unknown media types."""
+    return "", None
 
 
 class OrganizePreviewController:
@@ -26,6 +60,15 @@ class OrganizePreviewController:
     building preview rows for the organization UI.
     """
 
+    __slots__ = ("_ops", "_tr", "_max_preview_files")
+
+    _HANDLERS = {
+        "video": _detect_video,
+        "music": _detect_music,
+        "book": _detect_book,
+        "game": _detect_game,
+    }
+
     def __init__(self, ops, tr_fn, max_preview_files: int = 15):
         """Initialize the preview controller.
 
@@ -50,60 +93,39 @@ class OrganizePreviewController:
         Returns:
             Tuple of (detected query, detected content type).
         """
-        detected_query = ""
-        detected_type = None
         if not hasattr(self._ops, "extract_info_from_filename"):
-            return detected_query, detected_type
+            return "", None
 
         info = self._ops.extract_info_from_filename(file_name)
-        if media_type == "video":
-            detected_query = info.get("title", "")
-            detected_type = info.get("type", "")
-        elif media_type == "music":
-            artist = info.get("artist", "")
-            album = info.get("album", "")
-            if artist and album:
-                detected_query = f"{artist} {album}"
-                detected_type = "album"
-            elif artist:
-                detected_query = artist
-                detected_type = "artist"
-            else:
-                detected_query = info.get("title", "")
-        elif media_type == "book":
-            detected_query = info.get("title", "")
-            if info.get("author"):
-                detected_query = f"{info['title']} {info['author']}"
-        elif media_type == "game":
-            detected_query = info.get("title", "")
-        return detected_query, detected_type
+        handler = self._HANDLERS.get(media_type, _detect_default)
+        return handler(info)
 
     def build_preview(
-        self, files: List[Path]
-    ) -> Tuple[List[Tuple[Path, FileRow]], Optional[QLabel]]:
-        """Build preview rows for files.
+        self, files: Iterable[Path], total: Optional[int] = None
+    ) -> Tuple[List[Path], Optional[QLabel]]:
+        """Select the files shown as preview rows.
+
+        Only the first max_preview_files paths are consumed, so callers can
+        pass a lazy iterator over a large file list.
 
         Args:
-            files: List of file paths to preview.
+            files: File paths to preview.
+            total: Total number of files, required when files has no len().
 
         Returns:
-            Tuple of (list of (path, FileRow) tuples, optional "more" label).
+            Tuple of (list of previewed paths, optional "more" label).
         """
-        file_rows: List[Tuple[Path, FileRow]] = []
-        for f in files[: self._max_preview_files]:
-            info = {}
-            if hasattr(self._ops, "extract_info_from_filename"):
-                info = self._ops.extract_info_from_filename(f.name)
-            row = FileRow(f.name, "", info)
-            file_rows.append((f, row))
+        if total is None:
+            total = len(files)  # type: ignore[arg-type]
+        preview_files = list(islice(files, self._max_preview_files))
 
         more_label: Optional[QLabel] = None
-        if len(files) > self._max_preview_files:
+        if total > self._max_preview_files:
             more_label = QLabel(
-                f"+ {len(files) - self._max_preview_files} {self._tr('others', 'others')}..."
+                f"+ {total - self._max_preview_files} {self._tr('others', 'others')}..."
             )
             more_label.setObjectName("EmptyState")
             more_label.setFixedHeight(28)
             more_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        return file_rows, more_label
+        return preview_files, more_label
@@ -10,39 +10,97 @@
 # ===----------------------------------------------------------------------=== #
 """Helpers to scan source folders using available file operation methods."""
 
+import os
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional
 
 
-def scan_sources(ops, paths: Iterable[Path]) -> List[Path]:
-    """Return all matching files for provided paths using the ops helpers.
+def scan_sources(
+    ops, paths: Iterable[Path], should_stop: Optional[Callable[[], bool]] = None
+) -> List[Path]:
+    """Return all files matching the ops' supported extensions.
 
-    Uses the unified `find_files` method if available,
-    otherwise falls back to type-specific methods.
+    Each source tree is walked once with scandir; files found under
+    several sources are listed once, in discovery order.
+
+    Args:
+        ops: File operations handler for the media type.
+        paths: Source folders to scan.
+        should_stop: Polled once per directory; the walk ends early, with
+            the files found so far, once it returns True.
+
+    Returns:
+        Matching file paths.
     """
-    files: list[Path] = []
+    return scan_sources_multi({"": ops}, paths, should_stop=should_stop)[""]
+
+
+def _iter_files(
+    root: str, should_stop: Optional[Callable[[], bool]] = None
+) -> Iterator[os.DirEntry]:
+    """Yield every regular file below root, reading each directory once.
+
+    Uses an explicit stack of pending directories instead of recursion so
+    deep trees do not hit the interpreter recursion limit.
+    """
+    stack = [root]
+    while stack:
+        if should_stop is not None and should_stop():
+            return
+        current = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        # Reversed so subdirectories are visited in listing order, like os.walk
+        stack.extend(reversed(subdirs))
+
+
+def scan_sources_multi(
+    ops_by_type: Mapping[str, Any],
+    paths: Iterable[Path],
+    media_types: Optional[Iterable[str]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> Dict[str, List[Path]]:
+    """Return matching files for several media types in a single walk.
+
+    Each source tree is traversed once and every file is dispatched to the
+    bucket of the media type claiming its extension. When two media types
+    declare the same extension, the first one in iteration order wins.
+
+    Args:
+        ops_by_type: Mapping of media type to its file operations handler.
+        paths: Source folders to scan.
+        media_types: Optional subset of media types to collect.
+        should_stop: Polled once per directory; the walk ends early, with
+            the files found so far, once it returns True.
+
+    Returns:
+        Dictionary mapping each media type to its list of files.
+    """
+    wanted = list(media_types) if media_types is not None else list(ops_by_type)
+    ext_to_media: Dict[str, str] = {}
+    for media_type in wanted:
+        ops = ops_by_type[media_type]
+        for ext in getattr(ops, "supported_extensions", ()):
+            ext_to_media.setdefault(ext.lower(), media_type)
+
+    buckets: Dict[str, List[Path]] = {media_type: [] for media_type in wanted}
     seen = set()
     for path in paths:
-        path_str = str(path)
-        found: list = []
-
-        if hasattr(ops, "find_files"):
-            found = ops.find_files(path_str)
-        elif hasattr(ops, "find_video_files"):
-            found = ops.find_video_files(path_str)
-        elif hasattr(ops, "find_audio_files"):
-            found = ops.find_audio_files(path_str)
-        elif hasattr(ops, "find_book_files"):
-            found = ops.find_book_files(path_str)
-        elif hasattr(ops, "find_game_files"):
-            found = ops.find_game_files(path_str)
-        elif hasattr(ops, "supported_extensions"):
-            for ext in ops.supported_extensions:
-                found.extend(path.rglob(f"*{ext}"))
-
-        for f in found:
-            pf = Path(f)
-            if pf not in seen:
-                seen.add(pf)
-                files.append(pf)
-    return files
+        for entry in _iter_files(str(path), should_stop):
+            media_type = ext_to_media.get(os.path.splitext(entry.name)[1].lower())
+            if media_type is None or entry.path in seen:
+                continue
+            seen.add(entry.path)
+            buckets[media_type].append(Path(entry.path))
+    return buckets
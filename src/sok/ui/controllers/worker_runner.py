@@ -10,14 +10,42 @@
 # ===----------------------------------------------------------------------=== #
 """Utility to run PySide6 workers in a QThread safely."""
 
+import functools
 import logging
-from PySide6.QtCore import QThread
+from PySide6.QtCore import QObject, QThread, Slot
 from PySide6.QtWidgets import QMessageBox, QWidget
 from sok.ui.i18n import tr
 
 logger = logging.getLogger(__name__)
 
 
+class _ProgressRelay(QObject):
+    """Forwards a worker's latest progress state to a GUI callback.
+
+    Lives in the GUI thread, so ticks emitted by the worker thread are
+    queued and the callback always runs on the GUI thread.
+    """
+
+    def __init__(self, read_latest, callback, parent=None):
+        """Initialize the relay.
+
+        Args:
+            read_latest: Returns the latest (percent, message) or None.
+            callback: Called with (percent, message) on each tick.
+            parent: Owner deleting the relay with the worker thread.
+        """
+        super().__init__(parent)
+        self._read_latest = read_latest
+        self._callback = callback
+
+    @Slot()
+    def forward(self):
+        """Pass the latest progress state to the callback."""
+        latest = self._read_latest()
+        if latest is not None:
+            self._callback(*latest)
+
+
 class WorkerRunner:
     """Utility to run PySide6 workers in a QThread safely.
 
@@ -25,6 +53,14 @@ class WorkerRunner:
     for background tasks.
     """
 
+    # __weakref__ lets Qt connect signals to the bound methods
+    __slots__ = (
+        "_thread",
+        "_current_worker",
+        "_parent",
+        "__weakref__",
+    )
+
     def __init__(self, parent=None):
         """Initialize the worker runner.
 
@@ -35,6 +71,18 @@ class WorkerRunner:
         self._current_worker = None
         self._parent = parent
 
+    def is_running(self) -> bool:
+        """Check whether a worker thread is still running.
+
+        Returns:
+            True while the current thread has not finished.
+        """
+        try:
+            return self._thread is not None and self._thread.isRunning()
+        except RuntimeError:
+            # The QThread was already deleted
+            return False
+
     def stop(self):
         """Stop the current worker and thread."""
         try:
@@ -75,20 +123,14 @@ class WorkerRunner:
             worker.finished.connect(on_finished)
             worker.finished.connect(self._thread.quit)
         if hasattr(worker, "error"):
-
-            def _handle_error(err):
-                """Handle worker error signal.
-
-                Args:
-                    err: Error message from worker.
-                """
-                if on_error:
-                    on_error(err)
-                self._show_error(err)
-
-            worker.error.connect(_handle_error)
+            # Bound per worker: a queued error from a replaced worker still
+            # reaches that worker's callback, not the current one's
+            worker.error.connect(functools.partial(self._dispatch_error, on_error))
             worker.error.connect(self._thread.quit)
-        if on_progress and hasattr(worker, "progress"):
+        if on_progress and hasattr(worker, "progress_tick"):
+            relay = _ProgressRelay(worker.latest_progress, on_progress, self._thread)
+            worker.progress_tick.connect(relay.forward)
+        elif on_progress and hasattr(worker, "progress"):
             worker.progress.connect(on_progress)
 
         thread_ref = self._thread
@@ -108,6 +150,17 @@ class WorkerRunner:
         self._thread.start()
         return worker
 
+    def _dispatch_error(self, on_error, err):
+        """Handle worker error signal.
+
+        Args:
+            on_error: Error callback of the worker that failed.
+            err: Error message from worker.
+        """
+        if on_error:
+            on_error(err)
+        self._show_error(err)
+
     def _clear_refs(self):
         """Clear thread and worker references."""
         self._thread = None
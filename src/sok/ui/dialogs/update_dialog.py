@@ -101,6 +101,32 @@ class UpdateDialog(QDialog):
         btn_update: Download and install button.
     """
 
+    _QSS_HEADER = f"font-size: 16px; font-weight: bold; color: {Theme.LIGHT['accent']};"
+
+    _QSS_CHANGELOG = """
+        QTextBrowser {
+            background-color: #2b2b2b;
+            color: #ffffff;
+            border: 1px solid #3d3d3d;
+            border-radius: 5px;
+            padding: 10px;
+        }
+    """
+
+    _QSS_PROGRESS = f"""
+        QProgressBar {{
+            border: 1px solid #3d3d3d;
+            border-radius: 5px;
+            text-align: center;
+            background-color: #1e1e1e;
+            color: white;
+        }}
+        QProgressBar::chunk {{
+            background-color: {Theme.LIGHT["accent"]};
+            border-radius: 4px;
+        }}
+    """
+
     def __init__(
         self,
         parent=None,
@@ -138,9 +164,7 @@ class UpdateDialog(QDialog):
                 "update_available_header", "A new version (v{version}) is available!"
             ).format(version=new_version)
         )
-        header.setStyleSheet(
-            f"font-size: 16px; font-weight: bold; color: {Theme.LIGHT['accent']};"
-        )
+        header.setStyleSheet(self._QSS_HEADER)
         layout.addWidget(header)
 
         self.changelog = QTextBrowser()
@@ -148,36 +172,12 @@ class UpdateDialog(QDialog):
             self.update_manager.get_release_notes() if self.update_manager else ""
         )
         self.changelog.setHtml(release_notes.replace("\n", "<br>"))
-        self.changelog.setStyleSheet(
-            """
-            QTextBrowser {
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """
-        )
+        self.changelog.setStyleSheet(self._QSS_CHANGELOG)
         layout.addWidget(self.changelog)
 
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet(
-            f"""
-            QProgressBar {{
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                text-align: center;
-                background-color: #1e1e1e;
-                color: white;
-            }}
-            QProgressBar::chunk {{
-                background-color: {Theme.LIGHT["accent"]};
-                border-radius: 4px;
-            }}
-        """,
-        )
+        self.progress_bar.setStyleSheet(self._QSS_PROGRESS)
         layout.addWidget(self.progress_bar)
 
         btn_layout = QHBoxLayout()
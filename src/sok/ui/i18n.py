@@ -13,6 +13,7 @@ Internationalization (i18n) helper for S.O.K.
 Provides a simple mechanism to load and retrieve translations.
 """
 
+import functools
 import logging
 import threading
 from typing import Dict, Optional
@@ -46,7 +47,7 @@ class Translator:
                 config = get_config_manager()
                 self._translations = config.load_language()
                 self._loaded = True
-                logger.debug(f"Translations loaded: {len(self._translations)} keys.")
+                logger.debug("Translations loaded: %d keys.", len(self._translations))
             except (OSError, ValueError, KeyError) as e:
                 logger.exception("Error loading translations", exc_info=e)
                 if self._translations is None:
@@ -77,6 +78,15 @@ class Translator:
 
 _translator_instance = Translator()
 
+# Bumped on every language reload so cached lookups never outlive a language
+_language_version = 0
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_translate(key: str, default: Optional[str], version: int) -> str:
+    """Memoized translator lookup keyed on the active language version."""
+    return _translator_instance.translate(key, default)
+
 
 def tr(key: str, default: Optional[str] = None) -> str:
     """
@@ -89,11 +99,14 @@ def tr(key: str, default: Optional[str] = None) -> str:
     Returns:
         str: Translated text.
     """
-    return _translator_instance.translate(key, default)
+    return _cached_translate(key, default, _language_version)
 
 
 def reload_language() -> None:
     """
     Forces a reload of the translation files (e.g. after language setting change).
     """
+    global _language_version
     _translator_instance.reload()
+    _language_version += 1
+    _cached_translate.cache_clear()
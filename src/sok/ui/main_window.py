@@ -13,8 +13,11 @@ S.O.K - Main Interface
 Orange / Frameless / Modern Style
 """
 
+import functools
 import sys
+from ctypes import c_uint
 from ctypes.wintypes import MSG
+from typing import NamedTuple
 
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -22,22 +25,21 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QStackedWidget,
     QFrame,
     QApplication,
     QSizePolicy,
-    QGraphicsOpacityEffect,
 )
 from PySide6.QtCore import (
     Qt,
     QTimer,
-    QVariantAnimation,
+    QThreadPool,
+    QParallelAnimationGroup,
     QPropertyAnimation,
     QEasingCurve,
 )
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache
 
-from sok.ui.theme import Theme, ASSETS_DIR
+from sok.ui.theme import Theme, ASSETS_DIR, build_app_qss
 from sok.ui.components.sidebar import SidebarButton
 from sok.ui.components.window import WindowControlButton
 from sok.ui.controllers.window_chrome import hit_test_resize
@@ -50,6 +52,57 @@ from sok.ui.components.integrations.updates import check_and_show_updates
 from sok.config import get_config_manager
 from sok.ui.i18n import tr, reload_language
 
+_MSG_ID_OFFSET = MSG.message.offset
+
+
+@functools.lru_cache(maxsize=32)
+def _load_icon(path_str: str) -> QIcon:
+    """Load an icon file once per path.
+
+    Args:
+        path_str: Path of the icon file.
+
+    Returns:
+        Cached QIcon instance.
+    """
+    return QIcon(path_str)
+
+
+def _icon_pixmap(path_str: str, size: int) -> QPixmap:
+    """Return a pixmap rendered from an icon, cached in QPixmapCache.
+
+    Args:
+        path_str: Path of the icon file.
+        size: Edge length of the square pixmap in pixels.
+
+    Returns:
+        Rendered pixmap.
+    """
+    key = f"sok-icon:{path_str}:{size}"
+    pixmap = QPixmap()
+    if not QPixmapCache.find(key, pixmap):
+        pixmap = _load_icon(path_str).pixmap(size, size)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class _SidebarEntry(NamedTuple):
+    """One row of the sidebar: a section label, a page button or the stretch.
+
+    Attributes:
+        kind: "section", "btn" or "stretch".
+        key: Translation key of the label.
+        text: Default label text.
+        icon: Icon name of a page button.
+        page: Stack index opened by a page button.
+    """
+
+    kind: str
+    key: str = ""
+    text: str = ""
+    icon: str = ""
+    page: int = -1
+
 
 class MainWindow(QMainWindow):
     """Main application window for S.O.K.
@@ -63,6 +116,26 @@ class MainWindow(QMainWindow):
         rpc: Discord Rich Presence instance (if enabled).
     """
 
+    # Pages without user state (settings reload from config) are released
+    # after staying off-screen this long; others keep selections and workers.
+    _PAGE_RELEASE_MS = 30_000
+    _RELEASABLE_PAGES = frozenset({6})
+
+    # Sidebar layout: sections, navigation buttons (key, default text,
+    # icon, page index) and the stretch separating the two groups.
+    _SIDEBAR_SPEC = (
+        _SidebarEntry("section", "library", "Library"),
+        _SidebarEntry("btn", "home", "Home", "home", 0),
+        _SidebarEntry("btn", "tv_shows", "TV Shows", "video", 1),
+        _SidebarEntry("btn", "movies", "Movies", "video", 2),
+        _SidebarEntry("btn", "music", "Music", "music", 3),
+        _SidebarEntry("btn", "books", "Books", "book", 4),
+        _SidebarEntry("btn", "games", "Games", "game", 5),
+        _SidebarEntry("stretch"),
+        _SidebarEntry("section", "general", "General"),
+        _SidebarEntry("btn", "settings", "Settings", "settings", 6),
+    )
+
     def __init__(self):
         """Initialize the main application window.
 
@@ -75,10 +148,18 @@ class MainWindow(QMainWindow):
 
         self.dark = theme_pref == "dark"
         self.c = Theme.DARK if self.dark else Theme.LIGHT
+        Theme.current_palette = self.c
         self._theme_name = theme_pref
 
         self._drag_pos = None
-        self._restore_rect = None
+        self._pending_drag_pos = None
+        self._frame_geometry = None
+
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setInterval(8)
+        self._drag_timer.timeout.connect(self._apply_pending_drag)
+
+        self._cached_nav_titles = self._nav_titles()
 
         self._setup_window()
         self._build()
@@ -94,27 +175,34 @@ class MainWindow(QMainWindow):
         self.resize(950, 680)
         self.setMinimumSize(850, 550)
 
+        # Frameless only: WindowStaysOnTopHint would put every move/resize
+        # through the compositor's topmost z-order path.
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
         icon = ASSETS_DIR / "logo.ico"
         if icon.exists():
-            self.setWindowIcon(QIcon(str(icon)))
+            self.setWindowIcon(_load_icon(str(icon)))
 
     def _setup_services(self):
         """Initialize optional services.
 
         Sets up Discord Rich Presence and update checker if enabled.
+        The Discord handshake runs on the global thread pool so it never
+        delays the first paint.
         """
+        self.rpc = None
         if self._config.get("use_discord_rpc"):
-            self.rpc = setup_discord_rpc(
-                self._config.get("client_id_discord"), auto_connect=True
-            )
-        else:
-            self.rpc = None
+            QThreadPool.globalInstance().start(self._connect_discord_rpc)
 
-        if self._config.get("check_updates"):
-            QTimer.singleShot(2000, lambda: check_and_show_updates(self))
+        # The update check is launched from the first showEvent.
+        self._updates_pending = bool(self._config.get("check_updates"))
+
+    def _connect_discord_rpc(self):
+        """Connect to Discord Rich Presence (runs on a pool thread)."""
+        self.rpc = setup_discord_rpc(
+            self._config.get("client_id_discord"), auto_connect=True
+        )
 
     def _build(self):
         """Build the main window layout.
@@ -134,7 +222,7 @@ class MainWindow(QMainWindow):
         right_col = self._build_right_column()
         main_layout.addWidget(right_col, 1)
 
-        self._nav[0].setChecked(True)
+        self._current_nav_idx = -1
         self._go(0)
 
         self.setMouseTracking(True)
@@ -153,7 +241,6 @@ class MainWindow(QMainWindow):
         sidebar.setObjectName("Sidebar")
         sidebar.setFixedWidth(220)
         self._sidebar_expanded = True
-        self._sidebar_labels = []
         self._nav = []
 
         sb_layout = QVBoxLayout(sidebar)
@@ -164,52 +251,26 @@ class MainWindow(QMainWindow):
         self._menu_btn.clicked.connect(self._toggle_sidebar)
         sb_layout.addWidget(self._menu_btn)
 
-        self.lbl_library = QLabel(tr("library", "Library"))
-        self.lbl_library.setObjectName("SidebarSection")
-        section1_effect = QGraphicsOpacityEffect(self.lbl_library)
-        section1_effect.setOpacity(1.0)
-        self.lbl_library.setGraphicsEffect(section1_effect)
-        self._sidebar_labels.append(section1_effect)
-        sb_layout.addWidget(self.lbl_library)
-
-        home_btn = SidebarButton(tr("home", "Home"), "home")
-        home_btn.clicked.connect(lambda: self._go(0))
-        sb_layout.addWidget(home_btn)
-        self._nav.append(home_btn)
-
-        for text_key, icon_name, idx in [
-            ("tv_shows", "video", 1),
-            ("movies", "video", 2),
-            ("music", "music", 3),
-            ("books", "book", 4),
-            ("games", "game", 5),
-        ]:
-            default_text = {
-                "tv_shows": "TV Shows",
-                "movies": "Movies",
-                "music": "Music",
-                "books": "Books",
-                "games": "Games",
-            }[text_key]
-            btn = SidebarButton(tr(text_key, default_text), icon_name)
-            btn.clicked.connect(lambda _, i=idx: self._go(i))
-            sb_layout.addWidget(btn)
-            self._nav.append(btn)
-
-        sb_layout.addStretch()
-
-        self.lbl_general = QLabel(tr("general", "General"))
-        self.lbl_general.setObjectName("SidebarSection")
-        section2_effect = QGraphicsOpacityEffect(self.lbl_general)
-        section2_effect.setOpacity(1.0)
-        self.lbl_general.setGraphicsEffect(section2_effect)
-        self._sidebar_labels.append(section2_effect)
-        sb_layout.addWidget(self.lbl_general)
-
-        settings_btn = SidebarButton(tr("settings", "Settings"), "settings")
-        settings_btn.clicked.connect(lambda: self._go(6))
-        sb_layout.addWidget(settings_btn)
-        self._nav.append(settings_btn)
+        section_labels = {}
+        for entry in self._SIDEBAR_SPEC:
+            if entry.kind == "stretch":
+                sb_layout.addStretch()
+            elif entry.kind == "section":
+                label = QLabel(tr(entry.key, entry.text))
+                label.setObjectName("SidebarSection")
+                policy = label.sizePolicy()
+                policy.setRetainSizeWhenHidden(True)
+                label.setSizePolicy(policy)
+                section_labels[entry.key] = label
+                sb_layout.addWidget(label)
+            else:
+                btn = SidebarButton(tr(entry.key, entry.text), entry.icon)
+                btn.clicked.connect(functools.partial(self._go, entry.page))
+                sb_layout.addWidget(btn)
+                self._nav.append(btn)
+
+        self.lbl_library = section_labels["library"]
+        self.lbl_general = section_labels["general"]
 
         return sidebar
 
@@ -228,8 +289,11 @@ class MainWindow(QMainWindow):
         header = self._build_header()
         right_layout.addWidget(header)
 
-        self._pages = QStackedWidget()
+        self._pages = QWidget()
         self._pages.setObjectName("Content")
+        self._pages_layout = QVBoxLayout(self._pages)
+        self._pages_layout.setContentsMargins(0, 0, 0, 0)
+        self._pages_layout.setSpacing(0)
         self._add_pages()
         right_layout.addWidget(self._pages, 1)
 
@@ -258,11 +322,11 @@ class MainWindow(QMainWindow):
         self._logo_label = QLabel()
         logo_icon = ASSETS_DIR / "logo.ico"
         if logo_icon.exists():
-            self._logo_label.setPixmap(QIcon(str(logo_icon)).pixmap(28, 28))
+            self._logo_label.setPixmap(_icon_pixmap(str(logo_icon), 28))
         else:
             logo_png = ASSETS_DIR / "logo.png"
             if logo_png.exists():
-                self._logo_label.setPixmap(QIcon(str(logo_png)).pixmap(28, 28))
+                self._logo_label.setPixmap(_icon_pixmap(str(logo_png), 28))
         self._logo_label.setFixedSize(36, 42)
         self._logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header_layout.addWidget(self._logo_label)
@@ -294,23 +358,125 @@ class MainWindow(QMainWindow):
         return header
 
     def _add_pages(self):
-        """Add all application pages to the stack widget.
+        """Register all application pages.
 
-        Creates home, organize, and settings pages.
+        Only the home page is created upfront. The organize and settings
+        pages are built on first navigation from the factories registered
+        here; the content area holds a single visible page at a time.
         """
         home_page = HomePage()
         home_page.navigate.connect(self._go)
-        self._pages.addWidget(home_page)
+        self._page_factories = {
+            1: lambda: OrganizePage("video"),
+            2: MoviesPage,
+            3: lambda: OrganizePage("music"),
+            4: lambda: OrganizePage("book"),
+            5: lambda: OrganizePage("game"),
+            6: self._create_settings_page,
+        }
+        self._page_list: list[QWidget | None] = [home_page]
+        self._page_list.extend(None for _ in self._page_factories)
+        self._stoppable_pages: list[QWidget] = []
+        self._release_timers: dict[int, QTimer] = {}
+        self._track_page(home_page)
+        home_page.setParent(self._pages)
+        home_page.hide()
+
+    def _track_page(self, page: QWidget):
+        """Remember whether a page owns workers to stop on close.
+
+        Args:
+            page: Page widget added to the content area.
+        """
+        if hasattr(page, "stop_workers"):
+            self._stoppable_pages.append(page)
 
-        self._pages.addWidget(OrganizePage("video"))
-        self._pages.addWidget(MoviesPage())
-        self._pages.addWidget(OrganizePage("music"))
-        self._pages.addWidget(OrganizePage("book"))
-        self._pages.addWidget(OrganizePage("game"))
+    def _create_settings_page(self) -> QWidget:
+        """Create the settings page and wire its signals.
 
+        Returns:
+            Settings page widget.
+        """
         settings_page = SettingsPage(self._toggle_theme)
         settings_page.language_changed.connect(self._on_language_changed)
-        self._pages.addWidget(settings_page)
+        return settings_page
+
+    def _ensure_page(self, idx: int) -> QWidget:
+        """Return the page at an index, building it on first use.
+
+        Args:
+            idx: Page index about to be shown.
+
+        Returns:
+            Page widget.
+        """
+        page = self._page_list[idx]
+        if page is None:
+            page = self._page_factories[idx]()
+            page.setParent(self._pages)
+            page.hide()
+            self._page_list[idx] = page
+            self._track_page(page)
+        return page
+
+    def _show_page(self, idx: int):
+        """Swap the page shown in the content area.
+
+        The outgoing page is hidden and, when it holds no user state,
+        scheduled for release after ``_PAGE_RELEASE_MS`` off-screen.
+
+        Args:
+            idx: Page index to show.
+        """
+        previous = self._current_nav_idx
+        if 0 <= previous < len(self._page_list):
+            old = self._page_list[previous]
+            if old is not None:
+                self._pages_layout.removeWidget(old)
+                old.hide()
+                if previous in self._RELEASABLE_PAGES:
+                    self._schedule_release(previous)
+
+        timer = self._release_timers.get(idx)
+        if timer is not None:
+            timer.stop()
+        page = self._ensure_page(idx)
+        self._pages_layout.addWidget(page)
+        page.show()
+
+    def _schedule_release(self, idx: int):
+        """Start (or restart) the release countdown of a hidden page.
+
+        Args:
+            idx: Page index that just left the screen.
+        """
+        timer = self._release_timers.get(idx)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(self._PAGE_RELEASE_MS)
+            timer.timeout.connect(functools.partial(self._release_page, idx))
+            self._release_timers[idx] = timer
+        timer.start()
+
+    def _release_page(self, idx: int):
+        """Destroy a hidden page; it is rebuilt on the next visit.
+
+        Args:
+            idx: Page index to release.
+        """
+        page = self._page_list[idx]
+        if page is None or idx == self._current_nav_idx:
+            return
+        if getattr(page, "is_busy", None) and page.is_busy():  # type: ignore[attr-defined]
+            # Work that cannot be stopped is running; try again later
+            self._schedule_release(idx)
+            return
+        self._page_list[idx] = None
+        if page in self._stoppable_pages:
+            self._stoppable_pages.remove(page)
+            page.stop_workers()  # type: ignore[attr-defined]
+        page.deleteLater()
 
     def _on_language_changed(self, lang_code):
         """Handle language change from settings.
@@ -321,10 +487,10 @@ class MainWindow(QMainWindow):
             lang_code: New language code.
         """
         reload_language()
+        self._cached_nav_titles = self._nav_titles()
         self.retranslateUi()
 
-        for i in range(self._pages.count()):
-            page = self._pages.widget(i)
+        for page in self._iter_pages():
             if hasattr(page, "retranslateUi"):
                 page.retranslateUi()  # type: ignore[union-attr]
 
@@ -335,13 +501,27 @@ class MainWindow(QMainWindow):
         """
         self.lbl_library.setText(tr("library", "Library"))
         self.lbl_general.setText(tr("general", "General"))
-        titles = self._nav_titles()
+        titles = self._cached_nav_titles
 
         for i, btn in enumerate(self._nav):
             if i < len(titles):
                 btn.setText(titles[i])
 
-        self._update_title_by_index(self._pages.currentIndex())
+        self._update_title_by_index(self._current_nav_idx)
+
+    def showEvent(self, event):
+        """Launch the update check once the window is first shown.
+
+        The check is queued behind the first paint instead of waiting
+        on a fixed delay.
+
+        Args:
+            event: Show event.
+        """
+        super().showEvent(event)
+        if self._updates_pending:
+            self._updates_pending = False
+            QTimer.singleShot(0, lambda: check_and_show_updates(self))
 
     def changeEvent(self, event):
         """Re-apply styles when the maximized state flips.
@@ -372,66 +552,54 @@ class MainWindow(QMainWindow):
             Tuple of (handled, result) or parent result.
         """
         if eventType == b"windows_generic_MSG":
-            msg = MSG.from_address(message.__int__())
-
-            if msg.message == 0x0084:  # WM_NCHITTEST
-                x = msg.lParam & 0xFFFF
-                y = msg.lParam >> 16
-
-                hit = hit_test_resize(x, y, self.frameGeometry())
-                if hit is not None:
-                    return True, hit
+            address = message.__int__()
+            # Peek at the message id alone; most messages are not hit tests.
+            if c_uint.from_address(address + _MSG_ID_OFFSET).value != 0x0084:
+                return False, 0
+
+            msg = MSG.from_address(address)  # WM_NCHITTEST
+            x = msg.lParam & 0xFFFF
+            y = msg.lParam >> 16
+
+            if self._frame_geometry is None:
+                self._frame_geometry = self.frameGeometry()
+            hit = hit_test_resize(x, y, self._frame_geometry)
+            if hit is not None:
+                return True, hit
             return False, 0
         return False, 0
 
-    def _toggle_maximize(self):
-        """Toggle between maximized and normal window states.
+    def moveEvent(self, event):
+        """Invalidate the cached frame geometry used for hit testing.
 
-        Animates the transition smoothly.
+        Args:
+            event: Move event.
         """
-        screen = self.screen().availableGeometry()
-        start_rect = self.geometry()
+        self._frame_geometry = None
+        super().moveEvent(event)
 
-        if self.isMaximized():
-            end_rect = (
-                self._restore_rect if self._restore_rect else self.normalGeometry()
-            )
-
-            self._anim_geo = QPropertyAnimation(self, b"geometry")
-            self._anim_geo.setDuration(250)
-            self._anim_geo.setStartValue(start_rect)
-            self._anim_geo.setEndValue(end_rect)
-            self._anim_geo.setEasingCurve(QEasingCurve.Type.OutCubic)
-
-            def on_restore_finished():
-                """Handle animation completion for window restore."""
-                self.showNormal()
-                self._max_btn._icon_name = "square"
-                self._max_btn.update()
-                self._style(is_maximized=False)
-
-            self._anim_geo.finished.connect(on_restore_finished)
-            self._anim_geo.start()
-
-        else:
-            self._restore_rect = self.geometry()
-            end_rect = screen
+    def resizeEvent(self, event):
+        """Invalidate the cached frame geometry used for hit testing.
 
-            self._anim_geo = QPropertyAnimation(self, b"geometry")
-            self._anim_geo.setDuration(250)
-            self._anim_geo.setStartValue(start_rect)
-            self._anim_geo.setEndValue(end_rect)
-            self._anim_geo.setEasingCurve(QEasingCurve.Type.OutCubic)
+        Args:
+            event: Resize event.
+        """
+        self._frame_geometry = None
+        super().resizeEvent(event)
 
-            def on_max_finished():
-                """Handle animation completion for window maximize."""
-                self.showMaximized()
-                self._max_btn._icon_name = "restore"
-                self._max_btn.update()
-                self._style(is_maximized=True)
+    def _toggle_maximize(self):
+        """Toggle between maximized and normal window states.
 
-            self._anim_geo.finished.connect(on_max_finished)
-            self._anim_geo.start()
+        Uses the native maximize/restore transition; ``changeEvent``
+        re-applies the window radii once the state flips.
+        """
+        if self.isMaximized():
+            self.showNormal()
+            self._max_btn._icon_name = "square"
+        else:
+            self.showMaximized()
+            self._max_btn._icon_name = "restore"
+        self._max_btn.update()
 
     def mouseDoubleClickEvent(self, event):
         """Handle double-click to toggle maximize.
@@ -446,24 +614,31 @@ class MainWindow(QMainWindow):
     def mousePressEvent(self, event):
         """Handle mouse press for window dragging.
 
+        Hands the drag to the window manager when the platform supports it,
+        so no Python runs per mouse move. Falls back to the coalesced
+        manual drag otherwise.
+
         Args:
             event: Mouse event.
         """
         if event.button() == Qt.MouseButton.LeftButton:
             if event.position().y() < 42:
                 if not self.isMaximized():
+                    handle = self.windowHandle()
+                    if handle is not None and handle.startSystemMove():
+                        return
                     self._drag_pos = event.globalPosition().toPoint()
+                    self._pending_drag_pos = None
+                    self._drag_timer.start()
 
     def mouseMoveEvent(self, event):
-        """Handle mouse move for window dragging.
+        """Record the latest drag position for the next coalesced move.
 
         Args:
             event: Mouse event.
         """
         if self._drag_pos is not None:
-            delta = event.globalPosition().toPoint() - self._drag_pos
-            self.move(self.pos() + delta)
-            self._drag_pos = event.globalPosition().toPoint()
+            self._pending_drag_pos = event.globalPosition().toPoint()
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release to end dragging.
@@ -471,8 +646,23 @@ class MainWindow(QMainWindow):
         Args:
             event: Mouse event.
         """
+        self._drag_timer.stop()
+        self._apply_pending_drag()
         self._drag_pos = None
 
+    def _apply_pending_drag(self):
+        """Move the window once to the most recent drag position.
+
+        Mouse moves can arrive faster than the compositor presents frames,
+        so they are folded into at most one ``move`` per timer tick.
+        """
+        if self._drag_pos is None or self._pending_drag_pos is None:
+            return
+        delta = self._pending_drag_pos - self._drag_pos
+        self.move(self.pos() + delta)
+        self._drag_pos = self._pending_drag_pos
+        self._pending_drag_pos = None
+
     def closeEvent(self, event):
         """Handle window close.
 
@@ -481,40 +671,54 @@ class MainWindow(QMainWindow):
         Args:
             event: Close event.
         """
-        for page in self._iter_pages():
-            if hasattr(page, "stop_workers"):
-                page.stop_workers()
+        for page in self._stoppable_pages:
+            page.stop_workers()  # type: ignore[attr-defined]
         event.accept()
 
     def _iter_pages(self):
-        """Iterate over all pages in the stack.
+        """Iterate over the pages built so far.
 
-        Yields:
-            Each page widget.
+        Returns:
+            Iterator over the pages built so far, in navigation order.
         """
-        for i in range(self._pages.count()):
-            yield self._pages.widget(i)
+        return (page for page in self._page_list if page is not None)
 
     def _go(self, idx: int):
         """Navigate to a page by index.
 
+        Only the previously and newly selected sidebar buttons are touched,
+        and navigating to the current page is a no-op.
+
         Args:
             idx: Page index to navigate to.
         """
-        self._pages.setCurrentIndex(idx)
+        if idx == self._current_nav_idx:
+            # Clicking the checked button toggles it off; restore it.
+            self._nav[idx].setChecked(True)
+            return
+
+        self._show_page(idx)
         self._update_title_by_index(idx)
 
-        for i, btn in enumerate(self._nav):
-            btn.setChecked(i == idx)
+        previous = self._current_nav_idx
+        if 0 <= previous < len(self._nav):
+            self._nav[previous].blockSignals(True)
+            self._nav[previous].setChecked(False)
+            self._nav[previous].blockSignals(False)
+        self._nav[idx].setChecked(True)
+        self._current_nav_idx = idx
 
         if idx == 0:
-            page = self._pages.widget(0)
+            page = self._page_list[0]
             if hasattr(page, "refresh"):
                 page.refresh()  # type: ignore[union-attr]
 
     def _nav_titles(self):
         """Get translated navigation button titles.
 
+        The result is cached in ``_cached_nav_titles`` and only rebuilt
+        when the language changes.
+
         Returns:
             List of translated title strings for sidebar buttons.
         """
@@ -534,50 +738,54 @@ class MainWindow(QMainWindow):
         Args:
             idx: Current page index.
         """
-        titles = self._nav_titles()
+        titles = self._cached_nav_titles
         if 0 <= idx < len(titles):
             self._title_label.setText(f"S.O.K - {titles[idx]}")
 
     def _toggle_sidebar(self):
         """Toggle sidebar between expanded and collapsed states.
 
-        Animates the width transition and fades labels in/out.
+        Animates the width and the buttons' ``sidebarProgress`` property
+        with property animations driven by Qt, and shows/hides the
+        section labels at the ends of the transition.
         """
         if hasattr(self, "_sidebar_anim") and self._sidebar_anim:
             self._sidebar_anim.stop()
 
-        self._sidebar_anim = QVariantAnimation(self)
-        self._sidebar_anim.setDuration(250)
-        self._sidebar_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._sidebar_expanded = not self._sidebar_expanded
+        end_width = 220 if self._sidebar_expanded else 72
+        end_progress = 1.0 if self._sidebar_expanded else 0.0
 
+        self._sidebar_anim = QParallelAnimationGroup(self)
+        targets = [
+            (self._sidebar, b"minimumWidth", self._sidebar.width(), end_width),
+            (self._sidebar, b"maximumWidth", self._sidebar.width(), end_width),
+        ]
+        for btn in [self._menu_btn, *self._nav]:
+            targets.append((btn, b"sidebarProgress", btn.progress(), end_progress))
+
+        for target, prop, start, end in targets:
+            anim = QPropertyAnimation(target, prop, self._sidebar_anim)
+            anim.setDuration(250)
+            anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+            anim.setStartValue(start)
+            anim.setEndValue(end)
+            self._sidebar_anim.addAnimation(anim)
+
+        # Section labels are hidden as soon as the sidebar starts collapsing
+        # and shown again once it is fully expanded.
         if self._sidebar_expanded:
-            self._sidebar_anim.setStartValue(1.0)
-            self._sidebar_anim.setEndValue(0.0)
-            self._sidebar_expanded = False
+            self._sidebar_anim.finished.connect(self._show_sidebar_labels)
         else:
-            self._sidebar_anim.setStartValue(0.0)
-            self._sidebar_anim.setEndValue(1.0)
-            self._sidebar_expanded = True
-
-        def on_value_changed(value):
-            """Handle sidebar animation progress update.
-
-            Args:
-                value: Animation progress value (0.0 to 1.0).
-            """
-            width = int(72 + 148 * value)
-            self._sidebar.setFixedWidth(width)
-
-            for btn in self._nav:
-                btn.set_progress(value)
-            self._menu_btn.set_progress(value)
-
-            for effect in self._sidebar_labels:
-                effect.setOpacity(value)
-
-        self._sidebar_anim.valueChanged.connect(on_value_changed)
+            self.lbl_library.setVisible(False)
+            self.lbl_general.setVisible(False)
         self._sidebar_anim.start()
 
+    def _show_sidebar_labels(self):
+        """Show the sidebar section labels after expansion."""
+        self.lbl_library.setVisible(True)
+        self.lbl_general.setVisible(True)
+
     def _toggle_theme(self, dark: bool):
         """Switch between light and dark themes.
 
@@ -589,6 +797,7 @@ class MainWindow(QMainWindow):
         self.dark = dark
         self._theme_name = "dark" if dark else "orange"
         self.c = Theme.DARK if dark else Theme.LIGHT
+        Theme.current_palette = self.c
 
         if hasattr(self, "_config"):
             self._config.set("theme", self._theme_name)
@@ -599,15 +808,15 @@ class MainWindow(QMainWindow):
     def _style(self, is_maximized: bool | None = None):
         """Apply current theme stylesheet to the window.
 
-        Generates and applies CSS based on current color theme.
+        Generates and applies CSS based on current color theme. The rendered
+        stylesheet is cached per theme and window radius, and only pushed to
+        Qt when it differs from the one already applied.
 
         Args:
             is_maximized: Optional explicit override. When None, falls back
                 to ``self.isMaximized()`` — but during animated transitions
                 that flag is not reliable, so callers should pass it.
         """
-        c = self.c
-        font = Theme.FONT
         if is_maximized is None:
             is_maximized = self.isMaximized()
         outer_radius = 0 if is_maximized else 12
@@ -615,257 +824,13 @@ class MainWindow(QMainWindow):
             self._close_btn.top_right_radius = outer_radius
             self._close_btn.update()
 
-        self.setStyleSheet(
-            f"""
-            * {{
-                font-family: '{font}';
-                outline: none;
-            }}
-
-            QMainWindow, #Central {{
-                background: transparent;
-            }}
-
-            /* Sidebar */
-            #Sidebar {{
-                background: {c["card"]};
-                border-right: 1px solid {c["separator"]};
-                border-top-left-radius: {outer_radius}px;
-                border-bottom-left-radius: {outer_radius}px;
-            }}
-
-            #SidebarSection {{
-                font-size: 11px;
-                font-weight: 600;
-                color: {c["secondary"]};
-                padding: 16px 20px 6px 20px;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }}
-
-            /* Right Column (Background + Radius) */
-            #RightCol {{
-                background: {c["bg"]};
-                border-top-right-radius: {outer_radius}px;
-                border-bottom-right-radius: {outer_radius}px;
-            }}
-
-            /* Header */
-            #Header {{
-                background: transparent;
-                /* Optional bottom border */
-                /* border-bottom: 1px solid {c["separator"]}; */
-            }}
-
-            #AppTitle {{
-                font-size: 13px;
-                font-weight: 600;
-                color: {c["text"]};
-                padding-left: 4px;
-            }}
-
-            /* Content Area (Transparent to show RightCol background) */
-            #Content {{
-                background: transparent;
-            }}
-
-            #Page {{
-                background: transparent;
-                border: none;
-            }}
-
-            #PageContent {{
-                background: transparent;
-            }}
-
-            #PageTitle {{
-                font-size: 28px;
-                font-weight: 700;
-                color: {c["text"]};
-                margin-bottom: 10px;
-            }}
-
-            #SectionLabel, #CategoryLabel {{
-                font-size: 11px;
-                font-weight: 600;
-                color: {c["secondary"]};
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                margin-top: 10px;
-                margin-bottom: 4px;
-            }}
-
-            #EmptyState {{
-                color: {c["secondary"]};
-                font-size: 13px;
-            }}
-
-            /* Common Widgets Stylesheet overrides for Card/Input */
-
-            #Card {{
-                background: {c.get("card_bg", c["card"])};
-                border: 1px solid {c["separator"]};
-                border-radius: {Theme.R}px;
-            }}
-
-            #Separator {{
-                background: {c["separator"]};
-                margin-left: 12px;
-            }}
-
-            /* Inputs */
-            #SearchBar, #SettingsInput, #SettingsFormatInput {{
-                background: {c.get("input_bg", c["card"])};
-                border: 1px solid {c["separator"]};
-                border-radius: 8px;
-                padding: 4px 12px;
-                color: {c["text"]};
-                font-size: 13px;
-            }}
-
-            #SearchBar:focus, #SettingsInput:focus {{
-                border-color: {c["accent"]};
-            }}
-
-            /* Combos */
-            QComboBox {{
-                background: {c.get("input_bg", c["card"])};
-                border: 1px solid {c["separator"]};
-                border-radius: 8px;
-                padding: 4px 12px;
-                color: {c["text"]};
-            }}
-
-            QComboBox:hover {{
-                border-color: {c["accent"]};
-            }}
-
-            QComboBox::drop-down {{
-                border: none;
-                width: 24px;
-            }}
-
-            QComboBox QAbstractItemView {{
-                background: {c.get("dropdown_bg", c["card"])};
-                border: 1px solid {c["separator"]};
-                border-radius: 12px;
-                padding: 4px;
-                outline: none;
-
-                /* Force palette colors for Fusion style */
-                selection-background-color: {c["accent"]};
-                selection-color: {c["accent_text"]};
-            }}
-
-            QComboBox QAbstractItemView::item {{
-                min-height: 32px;
-                padding-left: 10px;
-                border-radius: 6px;
-                margin: 2px 0;
-                color: {c["text"]};
-            }}
-
-            QComboBox QAbstractItemView::item:selected,
-            QComboBox QAbstractItemView::item:hover {{
-                background: {c["accent"]};
-                color: {c["accent_text"]};
-            }}
-
-            /* Buttons */
-            #ActionBtn {{
-                background: {c["accent"]};
-                border-radius: 16px;
-                color: {c["accent_text"]};
-                font-weight: 600;
-                font-size: 13px;
-                padding: 0 16px;
-                border: none;
-            }}
-
-            #ActionBtn:hover {{
-                background: {c["accent"]};
-                opacity: 0.9;
-            }}
-
-            #ActionBtn:pressed {{
-                background: {c["accent"]};
-                margin-top: 1px;
-                margin-bottom: -1px;
-            }}
-
-            #ActionBtn:disabled {{
-                background: {c["separator"]};
-                color: {c["secondary"]};
-            }}
-
-            #SmallBtn {{
-                background: {c["accent"]};
-                border-radius: 6px;
-                color: {c["accent_text"]};
-                font-weight: 600;
-            }}
-
-            #SmallBtn:hover {{
-                background: {c["accent"]};
-                opacity: 0.9;
-            }}
-
-            #SmallBtn:pressed {{
-                background: {c["accent"]};
-            }}
-
-            #DestructiveBtn {{
-                background: {c.get("red", "#FF5555")};
-                border-radius: 16px;
-                color: white;
-                font-weight: 600;
-            }}
-
-            #DestructiveBtn:hover {{
-                background: #FF6B6B;
-            }}
-
-            #DestructiveBtn:pressed {{
-                background: #EE4444;
-                margin-top: 1px;
-                margin-bottom: -1px;
-            }}
-
-            /* ScrollBar */
-            QScrollBar:vertical {{
-                background: transparent;
-                width: 14px;
-                margin: 0;
-            }}
-
-            QScrollBar::handle:vertical {{
-                background: {c.get("tertiary", "rgba(255,255,255,0.3)")};
-                border-radius: 4px;
-                min-height: 40px;
-                margin: 2px 3px; /* Handle width = 14 - 6 = 8px. Radius 4px makes it fully round */
-            }}
-
-            QScrollBar::handle:vertical:hover {{
-                background: {c.get("secondary", "rgba(255,255,255,0.5)")};
-            }}
-
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0;
-                background: none;
-            }}
-
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: none;
-            }}
-        """
-        )
+        qss = build_app_qss(self.dark, outer_radius)
+        if self.styleSheet() != qss:
+            self.setStyleSheet(qss)
 
+        # Qt re-polishes descendants on setStyleSheet; repainting the root
+        # covers the custom-painted children without a per-widget sweep.
         self.update()
-        for w in self.findChildren(QWidget):
-            try:
-                w.update()
-            except TypeError:
-                pass
 
 
 def main():
@@ -16,10 +16,16 @@ import sys
 
 import shutil
 import ctypes
+from ctypes import POINTER, byref, c_bool, c_uint, c_ulong, c_ulonglong, c_wchar_p
 import string
 import os
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, wait
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QScrollArea,
@@ -29,46 +35,275 @@ from PySide6.QtWidgets import (
     QLabel,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt, Signal, QObject
+from PySide6.QtCore import Qt, Signal, QObject, QEvent, QRect, QRunnable, QThreadPool
 from PySide6.QtGui import QPixmap, QPainter, QFont
 
-from sok.ui.theme import Theme, card_shadow, ASSETS_DIR, svg_icon
-from sok.ui.components.base import Card, parse_color
+from sok.ui.theme import Theme, ASSETS_DIR, svg_icon
+from sok.ui.components.base import Card, ShadowHost, parse_color
 from sok.ui.components.layouts import FlowLayout
 from sok.config import get_config_manager
 from sok.ui.i18n import tr
-from sok.ui.controllers.worker_runner import WorkerRunner
 from sok.ui.controllers.ui_helpers import make_section_label
 
 logger = logging.getLogger(__name__)
 
+if sys.platform == "win32":
+    # Private kernel32 handle so argtypes do not leak into ctypes.windll
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _GetDiskFreeSpaceExW = _kernel32.GetDiskFreeSpaceExW
+    _GetDiskFreeSpaceExW.argtypes = [
+        c_wchar_p,
+        POINTER(c_ulonglong),
+        POINTER(c_ulonglong),
+        POINTER(c_ulonglong),
+    ]
+    _GetDiskFreeSpaceExW.restype = c_bool
+    _GetLogicalDriveStringsW = _kernel32.GetLogicalDriveStringsW
+    _GetLogicalDriveStringsW.argtypes = [c_ulong, c_wchar_p]
+    _GetLogicalDriveStringsW.restype = c_ulong
+    _GetDriveTypeW = _kernel32.GetDriveTypeW
+    _GetDriveTypeW.argtypes = [c_wchar_p]
+    _GetDriveTypeW.restype = c_uint
+else:
+    _GetDiskFreeSpaceExW = None
+    _GetLogicalDriveStringsW = None
+    _GetDriveTypeW = None
+
+_MIN_DRIVE_SIZE = 1024**3
+_DRIVE_STRINGS_BUFLEN = 256
+_MAX_DRIVE_QUERIES = 8
+_DRIVE_QUERY_TIMEOUT = 3.0
+
+# (free fraction above which the color applies, color), highest first
+_FREE_COLOR_STEPS = ((0.20, "#50FA7B"), (0.10, "#FFB86C"))
+_LOW_SPACE_COLOR = "#FF5555"
+
+# DRIVE_REMOVABLE and DRIVE_CDROM: querying them can stall on spin-up or
+# fail with "media not present", so they are left out of the dashboard
+_SKIPPED_DRIVE_TYPES = frozenset({2, 5})
+
+
+def _query_drive(drive_path: str) -> Optional[Tuple[str, int, int]]:
+    """Query size and free space of a single drive root.
+
+    Args:
+        drive_path: Drive root path.
+
+    Returns:
+        (drive_path, total, free) tuple, or None if the drive is skipped.
+    """
+    try:
+        if _GetDiskFreeSpaceExW is not None:
+            if _GetDriveTypeW(drive_path) in _SKIPPED_DRIVE_TYPES:
+                return None
+            total_bytes = c_ulonglong()
+            free_bytes = c_ulonglong()
+            if not _GetDiskFreeSpaceExW(
+                drive_path, None, byref(total_bytes), byref(free_bytes)
+            ):
+                raise ctypes.WinError(ctypes.get_last_error())
+            total = total_bytes.value
+            if total < _MIN_DRIVE_SIZE:
+                return None
+            free = free_bytes.value
+        else:
+            total, _used, free = shutil.disk_usage(drive_path)
+            if total < _MIN_DRIVE_SIZE:
+                return None
+    except OSError as e:
+        logger.debug("Drive scan error for %s: %s", drive_path, e, exc_info=e)
+        return None
+    return drive_path, total, free
+
+
+class _DriveQueryPool:
+    """Bounded pool of long-lived daemon threads querying drives.
+
+    Daemon threads let a query stalled on a dead mount be abandoned
+    without holding up interpreter exit. A drive whose previous query is
+    still pending is not queried again; callers share its future, so a
+    stuck drive occupies at most one thread.
+    """
 
-class StatsWorker(QObject):
-    """Background worker for drive statistics collection.
+    def __init__(self, max_workers: int):
+        """Initialize the pool; threads start on demand.
+
+        Args:
+            max_workers: Maximum number of query threads.
+        """
+        self._max_workers = max_workers
+        self._workers = 0
+        self._idle = 0
+        self._queued = 0
+        self._tasks: "queue.SimpleQueue[Tuple[str, Future]]" = queue.SimpleQueue()
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, drive_path: str) -> Future:
+        """Queue a drive query, or join the one already pending.
+
+        Args:
+            drive_path: Drive root path.
+
+        Returns:
+            Future resolving to the _query_drive() result.
+        """
+        with self._lock:
+            future = self._pending.get(drive_path)
+            if future is not None:
+                return future
+            future = self._pending[drive_path] = Future()
+            self._queued += 1
+            if self._queued > self._idle and self._workers < self._max_workers:
+                self._workers += 1
+                threading.Thread(
+                    target=self._work, name="sok-drive", daemon=True
+                ).start()
+        self._tasks.put((drive_path, future))
+        return future
+
+    def _work(self) -> None:
+        """Run queued drive queries for the life of the process."""
+        while True:
+            with self._lock:
+                self._idle += 1
+            drive_path, future = self._tasks.get()
+            with self._lock:
+                self._idle -= 1
+                self._queued -= 1
+            try:
+                future.set_result(_query_drive(drive_path))
+            except BaseException as exc:
+                future.set_exception(exc)
+            finally:
+                with self._lock:
+                    self._pending.pop(drive_path, None)
 
-    Collects disk space information for all available drives
-    using QObject + WorkerRunner pattern.
+
+_drive_pool = _DriveQueryPool(_MAX_DRIVE_QUERIES)
+
+
+def _query_drives_concurrently(
+    drives: List[str],
+) -> Dict[int, Optional[Tuple[str, int, int]]]:
+    """Query several drives in parallel, giving up on the slow ones.
+
+    Args:
+        drives: Drive root paths.
+
+    Returns:
+        Mapping of drive index to its _query_drive() result, for the drives
+        that answered within _DRIVE_QUERY_TIMEOUT.
+    """
+    futures = {index: _drive_pool.submit(path) for index, path in enumerate(drives)}
+    wait(futures.values(), timeout=_DRIVE_QUERY_TIMEOUT)
+
+    answered: Dict[int, Optional[Tuple[str, int, int]]] = {}
+    for index, future in futures.items():
+        if future.done():
+            answered[index] = None if future.exception() else future.result()
+    return answered
+
+
+def _format_drives(usage: List[Tuple[str, int, int]]) -> List[dict]:
+    """Build translated card entries from raw drive usage.
+
+    Args:
+        usage: List of (drive_path, total, free) tuples.
+
+    Returns:
+        List of drive dictionaries for HomePage._on_stats_ready.
+    """
+    drive_text = tr("drive", "Drive")
+    tb_free = tr("tb_free", "TB Free")
+    gb_free = tr("gb_free", "GB Free")
+    mb_free = tr("mb_free", "MB Free")
+
+    drives = []
+    for drive_path, total, free in usage:
+        percent_free = free / total
+        label = f"{drive_text} {drive_path[0]}"
+
+        if free > 1024**4:
+            free_str = f"{free / (1024**4):.2f} {tb_free}"
+        elif free > 1024**3:
+            free_str = f"{free / (1024**3):.0f} {gb_free}"
+        else:
+            free_str = f"{free / (1024**2):.0f} {mb_free}"
+
+        drives.append(
+            {
+                "key": drive_path,
+                "label": label,
+                "free_str": free_str,
+                "percent_free": percent_free,
+                "usage": (drive_path, total, free),
+            }
+        )
+    return drives
+
+
+def _logical_drive_strings() -> List[str]:
+    """Return all drive roots with a single GetLogicalDriveStringsW call.
+
+    Returns:
+        Drive root paths such as ``C:\\``.
+
+    Raises:
+        OSError: If the call fails.
+    """
+    if sys.platform != "win32":
+        raise OSError("GetLogicalDriveStringsW is only available on Windows")
+    buflen = _DRIVE_STRINGS_BUFLEN
+    buf = ctypes.create_unicode_buffer(buflen)
+    n = _GetLogicalDriveStringsW(buflen, buf)
+    if n > buflen:
+        buflen = n + 1
+        buf = ctypes.create_unicode_buffer(buflen)
+        n = _GetLogicalDriveStringsW(buflen, buf)
+    if n == 0 or n > buflen:
+        raise ctypes.WinError(ctypes.get_last_error())
+    # n excludes the final terminator: "C:\<NUL>D:\<NUL>"
+    return ctypes.wstring_at(buf, n).split("\x00")[:-1]
+
+
+class StatsSignals(QObject):
+    """Signals emitted by StatsWorker.
+
+    QRunnable is not a QObject, so the worker carries its signals on
+    this holder, which lives in the thread that created the worker.
 
     Attributes:
-        stats_ready: Signal emitted with stats dictionary.
-        finished: Signal emitted when work completes.
+        finished: Signal emitted when work completes, with the stats
+            dictionary, or None if the worker was stopped or failed.
         error: Signal emitted on error with message.
     """
 
-    stats_ready = Signal(dict)
     finished = Signal(object)
     error = Signal(str)
 
-    def __init__(self, video_path=None, music_path=None):
-        """Initialize the stats worker.
 
-        Args:
-            video_path: Optional video folder path.
-            music_path: Optional music folder path.
-        """
+class StatsWorker(QRunnable):
+    """Background worker for drive statistics collection.
+
+    Collects disk space information for all available drives on the
+    global QThreadPool, so repeated refreshes reuse pooled threads.
+
+    Attributes:
+        signals: StatsSignals holder for finished and error.
+    """
+
+    # Raw (drive_path, total, free) results shared by refresh bursts; labels
+    # are formatted per run so a language switch still picks up new strings.
+    _CACHE_TTL = 2.0
+    _cache: Optional[Tuple[float, List[Tuple[str, int, int]]]] = None
+
+    def __init__(self):
+        """Initialize the stats worker."""
         super().__init__()
-        self.video_path = Path(video_path) if video_path else None
-        self.music_path = Path(music_path) if music_path else None
+        # HomePage keeps a reference until finished, the pool must not delete it
+        self.setAutoDelete(False)
+        self.signals = StatsSignals()
         self._is_running = True
 
     def stop(self):
@@ -78,73 +313,94 @@ class StatsWorker(QObject):
     def run(self):
         """Execute drive statistics collection."""
         try:
-            drives = []
+            usage = self._cached_usage()
+            if usage is None:
+                usage = self._scan_drives()
+                if usage is None:
+                    self.signals.finished.emit(None)
+                    return
+                StatsWorker._cache = (time.monotonic(), usage)
+
+            drives = _format_drives(usage)
+            self.signals.finished.emit({"drives": drives} if self._is_running else None)
+        except (OSError, RuntimeError, ValueError) as e:
+            logger.exception("Unexpected error in DriveStatsWorker", exc_info=e)
+            self.signals.error.emit(str(e))
+            self.signals.finished.emit(None)
 
-            available_drives = []
+    @classmethod
+    def _cached_usage(cls) -> Optional[List[Tuple[str, int, int]]]:
+        """Return the last drive scan if it is still fresh.
+
+        Returns:
+            List of (drive_path, total, free) tuples, or None when expired.
+        """
+        cached = cls._cache
+        if cached is None:
+            return None
+        timestamp, usage = cached
+        if time.monotonic() - timestamp >= cls._CACHE_TTL:
+            return None
+        return usage
+
+    def _scan_drives(self) -> Optional[List[Tuple[str, int, int]]]:
+        """Query size and free space of every available drive.
+
+        Returns:
+            List of (drive_path, total, free) tuples, or None if stopped.
+        """
+        available_drives = []
+        if _GetLogicalDriveStringsW is not None:
             try:
-                if sys.platform == "win32":
-                    bitmask = ctypes.windll.kernel32.GetLogicalDrives()
-                    for letter in string.ascii_uppercase:
-                        if not self._is_running:
-                            return
-                        if bitmask & 1:
-                            available_drives.append(f"{letter}:\\")
-                        bitmask >>= 1
+                available_drives = _logical_drive_strings()
             except OSError as exc:
-                logger.warning(
-                    "Drive detection failed, fallback to exists(): %s",
-                    exc,
-                    exc_info=exc,
+                logger.debug(
+                    "GetLogicalDriveStringsW failed, fallback to bitmask: %s", exc
                 )
-                for d in string.ascii_uppercase:
+        try:
+            if sys.platform == "win32" and not available_drives:
+                bitmask = ctypes.windll.kernel32.GetLogicalDrives()
+                for letter in string.ascii_uppercase:
                     if not self._is_running:
-                        return
-                    if os.path.exists(f"{d}:\\"):
-                        available_drives.append(f"{d}:\\")
+                        return None
+                    if bitmask & 1:
+                        available_drives.append(f"{letter}:\\")
+                    bitmask >>= 1
+        except OSError as exc:
+            logger.warning(
+                "Drive detection failed, fallback to exists(): %s",
+                exc,
+                exc_info=exc,
+            )
+            for d in string.ascii_uppercase:
+                if not self._is_running:
+                    return None
+                if os.path.exists(f"{d}:\\"):
+                    available_drives.append(f"{d}:\\")
 
-            if not available_drives:
-                available_drives.append(Path.cwd().anchor)
+        if not available_drives:
+            available_drives.append(Path.cwd().anchor)
 
-            for drive_path in available_drives:
-                if not self._is_running:
-                    return
-                try:
-                    total, used, free = shutil.disk_usage(drive_path)
-
-                    if total < 1024**3:
-                        continue
-
-                    percent_free = free / total
-                    label = f"{tr('drive', 'Drive')} {drive_path[0]}"
-
-                    if free > 1024**4:
-                        free_str = f"{free / (1024**4):.2f} {tr('tb_free', 'TB Free')}"
-                    elif free > 1024**3:
-                        free_str = f"{free / (1024**3):.0f} {tr('gb_free', 'GB Free')}"
-                    else:
-                        free_str = f"{free / (1024**2):.0f} {tr('mb_free', 'MB Free')}"
-
-                    drives.append(
-                        {
-                            "label": label,
-                            "free_str": free_str,
-                            "percent_free": percent_free,
-                        }
-                    )
-                except OSError as e:
-                    logger.debug(
-                        "Drive scan error for %s: %s", drive_path, e, exc_info=e
-                    )
-                    continue
-
-            if self._is_running:
-                payload = {"drives": drives}
-                self.stats_ready.emit(payload)
-                self.finished.emit(payload)
-        except (OSError, RuntimeError, ValueError) as e:
-            logger.exception("Unexpected error in DriveStatsWorker", exc_info=e)
-            self.error.emit(str(e))
-            self.finished.emit(None)
+        if len(available_drives) == 1:
+            result = _query_drive(available_drives[0])
+            return [result] if result is not None else []
+
+        # One stalled mount must not delay the others, so drives are queried
+        # concurrently and anything slower than the timeout is dropped.
+        answered = _query_drives_concurrently(available_drives)
+
+        if not self._is_running:
+            return None
+
+        usage = []
+        for index, drive_path in enumerate(available_drives):
+            if index not in answered:
+                logger.debug("Drive query timed out for %s", drive_path)
+                continue
+            result = answered[index]
+            if result is not None:
+                usage.append(result)
+        return usage
 
 
 class StatCard(Card):
@@ -159,6 +415,11 @@ class StatCard(Card):
         _color: Optional accent color.
     """
 
+    # Regions painted by paintEvent; text bands cover ascent and descent
+    _ICON_RECT = QRect(16, 20, 48, 48)
+    _TITLE_RECT = QRect(80, 20, 4096, 26)
+    _VALUE_RECT = QRect(80, 40, 4096, 40)
+
     def __init__(self, title, value, icon_name, color=None, parent=None):
         """Initialize the stat card.
 
@@ -186,9 +447,31 @@ class StatCard(Card):
             color: Optional new color.
         """
         self._value = str(value)
-        if color:
+        if color and color != self._color:
             self._color = color
-        self.update()
+            self.update()
+        else:
+            self.update(self._VALUE_RECT)
+
+    def set_icon(self, icon_name):
+        """Update the card icon.
+
+        Args:
+            icon_name: Name of the SVG icon.
+        """
+        if icon_name != self._icon_name:
+            self._icon_name = icon_name
+            self.update(self._ICON_RECT)
+
+    def set_title(self, title):
+        """Update the card title.
+
+        Args:
+            title: New title text.
+        """
+        if title != self._title:
+            self._title = title
+            self.update(self._TITLE_RECT)
 
     def paintEvent(self, e):
         """Paint the stat card.
@@ -199,26 +482,30 @@ class StatCard(Card):
         super().paintEvent(e)
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        c = self.window().c if hasattr(self.window(), "c") else Theme.DARK  # type: ignore[union-attr]
+        c = Theme.current_palette
+        dirty = e.rect()
 
-        icon_bg = parse_color(c["input_bg"])
-        p.setBrush(icon_bg)
-        p.setPen(Qt.PenStyle.NoPen)
-        p.drawRoundedRect(16, 20, 48, 48, 12, 12)
+        if dirty.intersects(self._ICON_RECT):
+            icon_bg = parse_color(c["input_bg"])
+            p.setBrush(icon_bg)
+            p.setPen(Qt.PenStyle.NoPen)
+            p.drawRoundedRect(self._ICON_RECT, 12, 12)
 
-        icon_col = self._color if self._color else c["accent"]
-        icon = svg_icon(self._icon_name, icon_col, 24)
-        p.drawPixmap(28, 32, icon)
+            icon_col = self._color if self._color else c["accent"]
+            icon = svg_icon(self._icon_name, icon_col, 24)
+            p.drawPixmap(28, 32, icon)
 
-        p.setPen(parse_color(c["secondary"]))
-        p.setFont(QFont(Theme.FONT, 13))
-        p.drawText(80, 40, self._title)
+        if dirty.intersects(self._TITLE_RECT):
+            p.setPen(parse_color(c["secondary"]))
+            p.setFont(QFont(Theme.FONT, 13))
+            p.drawText(80, 40, self._title)
 
-        p.setPen(parse_color(c["text"]))
-        font = QFont(Theme.FONT, 20)
-        font.setBold(True)
-        p.setFont(font)
-        p.drawText(80, 70, self._value)
+        if dirty.intersects(self._VALUE_RECT):
+            p.setPen(parse_color(c["text"]))
+            font = QFont(Theme.FONT, 20)
+            font.setBold(True)
+            p.setFont(font)
+            p.drawText(80, 70, self._value)
 
 
 class QuickActionCard(Card):
@@ -236,6 +523,10 @@ class QuickActionCard(Card):
 
     clicked = Signal()
 
+    # Regions painted by paintEvent; the text band covers both lines
+    _ICON_RECT = QRect(20, 20, 40, 40)
+    _TEXT_RECT = QRect(20, 64, 4096, 56)
+
     def __init__(self, title, subtitle, icon_name, parent=None):
         """Initialize the quick action card.
 
@@ -254,6 +545,36 @@ class QuickActionCard(Card):
         self._subtitle = subtitle
         self._icon_name = icon_name
         self._hover = False
+        self._inner_rect = self.rect().adjusted(1, 1, -1, -1)
+        self._update_fonts()
+
+    def _update_fonts(self):
+        """Derive the title and subtitle fonts from the widget font."""
+        self._title_font = QFont(self.font())
+        self._title_font.setPixelSize(16)
+        self._title_font.setBold(True)
+        self._subtitle_font = QFont(self.font())
+        self._subtitle_font.setPixelSize(13)
+        self._subtitle_font.setBold(False)
+
+    def changeEvent(self, e):
+        """Rebuild cached fonts when the stylesheet changes the widget font.
+
+        Args:
+            e: Change event.
+        """
+        if e.type() == QEvent.Type.FontChange:
+            self._update_fonts()
+        super().changeEvent(e)
+
+    def resizeEvent(self, e):
+        """Recompute the cached border rect.
+
+        Args:
+            e: Resize event.
+        """
+        self._inner_rect = self.rect().adjusted(1, 1, -1, -1)
+        super().resizeEvent(e)
 
     def enterEvent(self, e):
         """Handle mouse enter.
@@ -289,7 +610,7 @@ class QuickActionCard(Card):
         """
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        c = self.window().c if hasattr(self.window(), "c") else Theme.DARK  # type: ignore[union-attr]
+        c = Theme.current_palette
 
         rect = self.rect()
         bg = parse_color(c["card"])
@@ -301,36 +622,34 @@ class QuickActionCard(Card):
 
             p.setBrush(Qt.BrushStyle.NoBrush)
             p.setPen(parse_color(c["accent"]))
-            p.drawRoundedRect(rect.adjusted(1, 1, -1, -1), Theme.R, Theme.R)
+            p.drawRoundedRect(self._inner_rect, Theme.R, Theme.R)
         else:
             p.setBrush(bg)
             p.setPen(Qt.PenStyle.NoPen)
             p.drawRoundedRect(rect, Theme.R, Theme.R)
             p.setBrush(Qt.BrushStyle.NoBrush)
             p.setPen(parse_color(c["separator"]))
-            p.drawRoundedRect(rect.adjusted(1, 1, -1, -1), Theme.R, Theme.R)
+            p.drawRoundedRect(self._inner_rect, Theme.R, Theme.R)
 
-        circle_bg = parse_color(c["accent"])
-        p.setBrush(circle_bg)
-        p.setPen(Qt.PenStyle.NoPen)
-        p.drawEllipse(20, 20, 40, 40)
+        dirty = e.rect()
+        if dirty.intersects(self._ICON_RECT):
+            circle_bg = parse_color(c["accent"])
+            p.setBrush(circle_bg)
+            p.setPen(Qt.PenStyle.NoPen)
+            p.drawEllipse(self._ICON_RECT)
 
-        icon_col = c["accent_text"]
-        icon = svg_icon(self._icon_name, icon_col, 20)
-        p.drawPixmap(30, 30, icon)
+            icon_col = c["accent_text"]
+            icon = svg_icon(self._icon_name, icon_col, 20)
+            p.drawPixmap(30, 30, icon)
 
-        p.setPen(parse_color(c["text"]))
-        font = p.font()
-        font.setPixelSize(16)
-        font.setBold(True)
-        p.setFont(font)
-        p.drawText(20, 85, self._title)
+        if dirty.intersects(self._TEXT_RECT):
+            p.setPen(parse_color(c["text"]))
+            p.setFont(self._title_font)
+            p.drawText(20, 85, self._title)
 
-        p.setPen(parse_color(c["secondary"]))
-        font.setPixelSize(13)
-        font.setBold(False)
-        p.setFont(font)
-        p.drawText(20, 110, self._subtitle)
+            p.setPen(parse_color(c["secondary"]))
+            p.setFont(self._subtitle_font)
+            p.drawText(20, 110, self._subtitle)
 
 
 class HomePage(QScrollArea):
@@ -344,6 +663,9 @@ class HomePage(QScrollArea):
 
     navigate = Signal(int)
 
+    # Decoded on first use (needs a QApplication) and shared by later pages
+    _LOGO_PIXMAP: Optional[QPixmap] = None
+
     def __init__(self, parent=None):
         """Initialize the home page.
 
@@ -355,7 +677,11 @@ class HomePage(QScrollArea):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setObjectName("Page")
         self._config = get_config_manager()
-        self._worker_runner = WorkerRunner(self)
+        self._stats_workers: set[StatsWorker] = set()
+        self._status_cards: dict[str, StatCard] = {}
+        self._last_usage: List[Tuple[str, int, int]] = []
+        # Hidden StatCards kept for reuse when drives come and go
+        self._card_pool: List[StatCard] = []
 
         self._build()
         self.refresh()
@@ -371,6 +697,20 @@ class HomePage(QScrollArea):
         self.stop_workers()
         super().closeEvent(event)
 
+    @classmethod
+    def _logo_pixmap(cls) -> Optional[QPixmap]:
+        """Return the shared logo pixmap, loading it on first call.
+
+        Returns:
+            Logo pixmap, or None if the asset is missing.
+        """
+        if cls._LOGO_PIXMAP is None:
+            logo_path = ASSETS_DIR / "logo.png"
+            if not logo_path.exists():
+                return None
+            cls._LOGO_PIXMAP = QPixmap(str(logo_path))
+        return cls._LOGO_PIXMAP
+
     def _build(self):
         """Build the home page UI."""
         content = QWidget()
@@ -401,9 +741,8 @@ class HomePage(QScrollArea):
         logo = QLabel()
         logo.setFixedSize(80, 80)
         logo.setScaledContents(True)
-        logo_path = ASSETS_DIR / "logo.png"
-        if logo_path.exists():
-            pm = QPixmap(str(logo_path))
+        pm = self._logo_pixmap()
+        if pm is not None:
             logo.setPixmap(pm)
 
         header_layout.addWidget(logo)
@@ -413,36 +752,36 @@ class HomePage(QScrollArea):
         self.status_label = make_section_label("drive_monitors", "DRIVE MONITORS")
         layout.addWidget(self.status_label)
 
-        self.status_container = QWidget()
-        self.status_layout = FlowLayout(self.status_container, margin=0, spacing=24)
+        # The hosts paint card shadows only inside their own rect
+        self.status_container = ShadowHost()
+        self.status_layout = FlowLayout(
+            self.status_container, margin=ShadowHost.SHADOW_MARGIN, spacing=24
+        )
 
         layout.addWidget(self.status_container)
 
         self.actions_label = make_section_label("quick_access", "QUICK ACCESS")
         layout.addWidget(self.actions_label)
 
-        actions_container = QWidget()
-        actions_layout = FlowLayout(actions_container, margin=0, spacing=24)
+        actions_container = ShadowHost()
+        actions_layout = FlowLayout(
+            actions_container, margin=ShadowHost.SHADOW_MARGIN, spacing=24
+        )
 
         self.video_btn = QuickActionCard("", "", "video")
         self.video_btn.clicked.connect(lambda: self.navigate.emit(1))
-        self.video_btn.setGraphicsEffect(card_shadow())
 
         self.movie_btn = QuickActionCard("", "", "video")
         self.movie_btn.clicked.connect(lambda: self.navigate.emit(2))
-        self.movie_btn.setGraphicsEffect(card_shadow())
 
         self.music_btn = QuickActionCard("", "", "music")
         self.music_btn.clicked.connect(lambda: self.navigate.emit(3))
-        self.music_btn.setGraphicsEffect(card_shadow())
 
         self.book_btn = QuickActionCard("", "", "book")
         self.book_btn.clicked.connect(lambda: self.navigate.emit(4))
-        self.book_btn.setGraphicsEffect(card_shadow())
 
         self.game_btn = QuickActionCard("", "", "game")
         self.game_btn.clicked.connect(lambda: self.navigate.emit(5))
-        self.game_btn.setGraphicsEffect(card_shadow())
 
         actions_layout.addWidget(self.video_btn)
         actions_layout.addWidget(self.movie_btn)
@@ -491,7 +830,9 @@ class HomePage(QScrollArea):
         self.game_btn._subtitle = tr("organize_game_library", "Organize your ROMs")
         self.game_btn.update()
 
-        self.refresh()
+        # Relabel the current cards; a language switch does not rescan drives
+        if self._status_cards:
+            self._on_stats_ready({"drives": _format_drives(self._last_usage)})
 
     def refresh(self):
         """Refresh drive statistics.
@@ -500,12 +841,20 @@ class HomePage(QScrollArea):
         """
         self.stop_workers()
 
-        worker = StatsWorker(None, None)
-        worker.stats_ready.connect(self._on_stats_ready)
-        worker.error.connect(lambda e: logger.error("Stats worker error: %s", e))
-        self._worker_runner.run(
-            worker, lambda _: None, lambda e: logger.error("Stats worker error: %s", e)
+        worker = StatsWorker()
+        # Always emitted from a pool thread, so skip the auto-connection check
+        worker.signals.finished.connect(
+            self._on_stats_ready, Qt.ConnectionType.QueuedConnection
+        )
+        worker.signals.error.connect(
+            lambda e: logger.error("Stats worker error: %s", e)
         )
+        worker.signals.finished.connect(
+            lambda _: self._stats_workers.discard(worker),
+            Qt.ConnectionType.QueuedConnection,
+        )
+        self._stats_workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
 
     def _on_stats_ready(self, stats):
         """Handle stats worker completion.
@@ -513,49 +862,63 @@ class HomePage(QScrollArea):
         Updates drive status cards with collected data.
 
         Args:
-            stats: Dictionary containing drive statistics.
+            stats: Dictionary containing drive statistics, or None if the
+                worker was stopped or failed.
         """
-        self._clear_status_cards()
-
+        if stats is None:
+            return
         drives = stats.get("drives", [])
+        self._last_usage = [d["usage"] for d in drives]
 
         if not drives:
-            error_card = StatCard(
-                tr("error", "Error"),
-                tr("no_drive_detected", "No drive detected"),
-                "cross",
-                "#FF5555",
-            )
-            error_card.setGraphicsEffect(card_shadow())
-            self.status_layout.addWidget(error_card)
-            return
+            # The error card uses a key no drive root can have
+            specs = [
+                (
+                    "",
+                    tr("error", "Error"),
+                    tr("no_drive_detected", "No drive detected"),
+                    "cross",
+                    "#FF5555",
+                )
+            ]
+        else:
+            specs = []
+            for drive in drives:
+                pct = drive["percent_free"]
+                color = next(
+                    (col for limit, col in _FREE_COLOR_STEPS if pct > limit),
+                    _LOW_SPACE_COLOR,
+                )
+                specs.append(
+                    (drive["key"], drive["label"], drive["free_str"], "settings", color)
+                )
 
-        for drive in drives:
-            pct = drive["percent_free"]
-            if pct > 0.20:
-                color = "#50FA7B"
-            elif pct > 0.10:
-                color = "#FFB86C"
+        # Retire vanished cards first so this pass can reuse them
+        seen = {spec[0] for spec in specs}
+        for key in self._status_cards.keys() - seen:
+            card = self._status_cards.pop(key)
+            self.status_layout.removeWidget(card)
+            card.hide()
+            self._card_pool.append(card)
+
+        for key, title, value, icon_name, color in specs:
+            card = self._status_cards.get(key)
+            if card is None:
+                if self._card_pool:
+                    card = self._card_pool.pop()
+                    card.set_icon(icon_name)
+                    card.set_title(title)
+                    card.set_value(value, color)
+                    card.show()
+                else:
+                    card = StatCard(title, value, icon_name, color)
+                self.status_layout.addWidget(card)
+                self._status_cards[key] = card
             else:
-                color = "#FF5555"
-
-            card = StatCard(
-                drive["label"],
-                drive["free_str"],
-                "settings",
-                color,
-            )
-            card.setGraphicsEffect(card_shadow())
-            self.status_layout.addWidget(card)
-
-    def _clear_status_cards(self):
-        """Remove all status cards from the layout."""
-        while self.status_layout.count():
-            item = self.status_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+                card.set_title(title)
+                card.set_value(value, color)
 
     def stop_workers(self):
         """Stop all background workers."""
-        self._worker_runner.stop()
+        for worker in self._stats_workers:
+            worker.stop()
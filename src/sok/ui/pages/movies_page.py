@@ -22,7 +22,7 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -36,7 +36,7 @@ from PySide6.QtWidgets import (
 from sok.config import get_config_manager
 from sok.core.media_manager import get_media_manager
 from sok.file_operations import VideoFileOperations
-from sok.ui.components.base import ActionButton
+from sok.ui.components.base import ActionButton, ShadowHost
 from sok.ui.components.inputs import DropZone
 from sok.ui.components.organize.movie_batch_table import (
     MovieBatchTable,
@@ -47,7 +47,6 @@ from sok.ui.controllers.ui_state import set_progress
 from sok.ui.controllers.worker_runner import WorkerRunner
 from sok.ui.factories.media_factory import create_media_item
 from sok.ui.i18n import tr
-from sok.ui.theme import card_shadow
 from sok.ui.workers import (
     MovieBatchOrganizeWorker,
     MovieBatchSearchWorker,
@@ -79,7 +78,7 @@ class MoviesPage(QScrollArea):
     # ------------------------------------------------------------------ UI
 
     def _build(self) -> None:
-        content = QWidget()
+        content = ShadowHost()
         content.setObjectName("PageContent")
         layout = QVBoxLayout(content)
         layout.setContentsMargins(24, 20, 24, 24)
@@ -107,7 +106,7 @@ class MoviesPage(QScrollArea):
         layout.addWidget(self._lbl_dest)
         self._dest_drop = DropZone()
         self._dest_drop.files_dropped.connect(self._on_dest_changed)
-        self._dest_drop.setGraphicsEffect(card_shadow())
+        content.add_shadow(self._dest_drop)
         layout.addWidget(self._dest_drop)
 
         self._progress = QProgressBar()
@@ -184,6 +183,7 @@ class MoviesPage(QScrollArea):
         self._set_progress(True, tr("searching", "Searching..."), 0)
         self._rescan_all_btn.setEnabled(False)
         worker = MovieBatchSearchWorker(target)
+        worker.partial.connect(self._on_batch_search_partial)
         self._search_runner.run(
             worker,
             self._on_batch_search_done,
@@ -194,6 +194,13 @@ class MoviesPage(QScrollArea):
     def _on_search_progress(self, percent: int, filename: str) -> None:
         self._set_progress(True, filename, percent)
 
+    @Slot(dict)
+    def _on_batch_search_partial(self, result: Dict[str, Any]) -> None:
+        # partial is emitted from the shared asyncio thread, so the
+        # AutoConnection to this page is queued to the GUI thread and rows
+        # fill in as each file is matched
+        self._table.apply_search_result(result)
+
     def _on_batch_search_done(self, results: List[Dict[str, Any]]) -> None:
         self._set_progress(False)
         self._table.apply_results(results)
@@ -217,6 +224,7 @@ class MoviesPage(QScrollArea):
         if not query:
             return
         self._table.set_row_loading(file)
+        SearchWorker.invalidate(query)
         worker = SearchWorker(query, "movie")
         self._rescan_runner.run(
             worker,
@@ -12,7 +12,10 @@
 Organize Page
 """
 
+import functools
+import itertools
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from PySide6.QtWidgets import (
     QScrollArea,
@@ -23,7 +26,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from sok.file_operations import (
     VideoFileOperations,
     MusicFileOperations,
@@ -32,7 +35,6 @@ from sok.file_operations import (
 )
 from sok.ui.components.organize import SearchPanel, OptionsPanel
 from sok.ui.controllers.organize_preview import OrganizePreviewController
-from sok.ui.controllers.source_scanner import scan_sources
 from sok.ui.controllers.ui_helpers import make_section_label
 from sok.ui.controllers.worker_runner import WorkerRunner
 from sok.ui.workers import (
@@ -40,6 +42,8 @@ from sok.ui.workers import (
     OrganizeWorker,
     DetailsWorker,
     CreateFoldersWorker,
+    ScanSourcesWorker,
+    ComputeNamesWorker,
 )
 from sok.ui.factories.media_factory import create_media_item
 from sok.core.media_manager import get_media_manager
@@ -55,6 +59,86 @@ FileOperations = (
 logger = logging.getLogger(__name__)
 
 MAX_PREVIEW_FILES = 15
+# Up to this many rows, names are computed inline rather than on a worker
+SYNC_PREVIEW_NAMES = 5
+# Number of recent (query, content type) searches kept per page
+SEARCH_CACHE_SIZE = 32
+
+# File operations handler per page media type; unknown types fall back to video
+OPS_MAP: dict[str, type[FileOperations]] = {
+    "video": VideoFileOperations,
+    "music": MusicFileOperations,
+    "book": BookFileOperations,
+    "game": GameFileOperations,
+}
+
+# Search panel content type for each type detected from a filename
+TYPE_MAP = {
+    "series": "tv",
+    "movie": "movie",
+    "album": "album",
+    "artist": "artist",
+}
+
+# Preview controllers keep no per-page state, so pages of one media type
+# share a single instance
+_PREVIEW_CTL_CACHE: dict[str, OrganizePreviewController] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_cached(
+    controller: OrganizePreviewController, file_name: str, media_type: str
+) -> tuple[str, str | None]:
+    """Memoize query and type detection for repeated source drops.
+
+    Args:
+        controller: Preview controller parsing the filename.
+        file_name: Name of the first file found in the sources.
+        media_type: Media type of the page.
+
+    Returns:
+        Tuple of (detected query, detected content type).
+    """
+    return controller.detect_query_and_type(file_name, media_type)
+
+
+def _escape_format(text: str) -> str:
+    """Escape braces so text can be embedded in a str.format template."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+# API season names that only repeat the number, e.g. "Season 2" or "Saison 2"
+_GENERIC_SEASON_PREFIXES = ("season ", "saison ")
+_GENERIC_SEASON_PREFIX_LEN = len(_GENERIC_SEASON_PREFIXES[0])
+
+
+def _season_folders(
+    season_word: str, num_seasons: int, seasons_data: list
+) -> dict[str, int]:
+    """Build season folder names from API season data.
+
+    Args:
+        season_word: Translated word for "Season".
+        num_seasons: Number of seasons of the series.
+        seasons_data: Season dictionaries with 'season_number' and 'name'.
+
+    Returns:
+        Dictionary mapping folder name to season number.
+    """
+    names_by_number = {s.get("season_number"): s.get("name", "") for s in seasons_data}
+    seasons = {}
+    for i in range(1, num_seasons + 1):
+        season_name = names_by_number.get(i)
+        if season_name:
+            lower = season_name.lower()
+            if not (
+                lower.startswith(_GENERIC_SEASON_PREFIXES)
+                and lower[_GENERIC_SEASON_PREFIX_LEN:] == str(i)
+            ):
+                seasons[f"{season_word} {i} - {season_name}"] = i
+                continue
+        seasons[f"{season_word} {i}"] = i
+    return seasons
 
 
 class OrganizePage(QScrollArea):
@@ -79,41 +163,58 @@ class OrganizePage(QScrollArea):
         """
         super().__init__(parent)
         self._type = media_type
-        self._ops: FileOperations
-
-        if media_type == "video":
-            self._ops = VideoFileOperations()
-        elif media_type == "music":
-            self._ops = MusicFileOperations()
-        elif media_type == "book":
-            self._ops = BookFileOperations()
-        elif media_type == "game":
-            self._ops = GameFileOperations()
-        else:
-            self._ops = VideoFileOperations()
+        self._ops: FileOperations = OPS_MAP.get(media_type, VideoFileOperations)()
 
         self._manager = get_media_manager()
-        self._translations = get_config_manager().load_language()
+        self._cfg = get_config_manager()
+        self._translations = self._cfg.load_language()
         self._files: list[Path] = []
-        self._preview_controller = OrganizePreviewController(
-            self._ops, tr, MAX_PREVIEW_FILES
-        )
+        preview_controller = _PREVIEW_CTL_CACHE.get(media_type)
+        if preview_controller is None:
+            preview_controller = OrganizePreviewController(
+                self._ops, tr, MAX_PREVIEW_FILES
+            )
+            _PREVIEW_CTL_CACHE[media_type] = preview_controller
+        self._preview_controller = preview_controller
         self._worker_runner = WorkerRunner(self)
+        # Separate runner so a new source does not cancel search or organize
+        self._scan_runner = WorkerRunner(self)
+        self._scan_paths: list[Path] = []
+        # Bumped for every scan so results of a replaced scan are dropped
+        self._scan_token = 0
+        self._names_token = 0
+        self._names_runner = WorkerRunner(self)
+        # Inputs of the last preview names pass, see _preview_fingerprint
+        self._last_fp: tuple | None = None
+        # Details per (media id, content type, with episodes), see _fetch_details
+        self._details_cache: dict[tuple[str, str, bool], dict] = {}
+        self._search_cache: OrderedDict[tuple[str, str], list] = OrderedDict()
+
+        # Source, selection and details signals tend to fire in bursts;
+        # coalesce them into a single preview pass
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(30)
+        self._refresh_timer.timeout.connect(self._do_update_preview_and_actions)
 
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setObjectName("Page")
 
-        self._build()
+        self._built = False
+        self._build_shell()
 
     def showEvent(self, event):
         """Handle page show event.
 
-        Updates preview and actions when page becomes visible.
+        Builds the panels on first show, then updates preview and actions
+        when page becomes visible.
 
         Args:
             event: Show event.
         """
+        if not self._built:
+            self._build_content()
         super().showEvent(event)
         self._update_preview_and_actions()
 
@@ -128,21 +229,30 @@ class OrganizePage(QScrollArea):
         self.stop_workers()
         super().closeEvent(event)
 
-    def _build(self):
-        """Build the organize page layout.
+    def _build_shell(self):
+        """Build the page frame holding only the title.
 
-        Creates search panel, options panel, and preview panel.
+        The panels are added by _build_content when the page is first shown.
         """
         content = QWidget()
         content.setObjectName("PageContent")
-        layout = QVBoxLayout(content)
-        layout.setContentsMargins(24, 20, 24, 24)
-        layout.setSpacing(20)
+        self._content_layout = QVBoxLayout(content)
+        self._content_layout.setContentsMargins(24, 20, 24, 24)
+        self._content_layout.setSpacing(20)
 
         self.lbl_page_title = QLabel()
         self.lbl_page_title.setObjectName("PageTitle")
-        layout.addWidget(self.lbl_page_title)
+        self._content_layout.addWidget(self.lbl_page_title)
 
+        self.setWidget(content)
+        self.retranslateUi()
+
+    def _build_content(self):
+        """Build the page panels.
+
+        Creates search panel, options panel, and preview panel.
+        """
+        self._built = True
         main_h = QHBoxLayout()
         main_h.setSpacing(20)
 
@@ -150,6 +260,7 @@ class OrganizePage(QScrollArea):
         left.setSpacing(16)
 
         self._search_panel = SearchPanel(self._type)
+        self._search_panel.refresh_requested.connect(self._forget_search)
         self._search_panel.search_started.connect(self._do_search)
         self._search_panel.media_selected.connect(self._on_media_selected)
         self._search_panel.type_changed.connect(self._on_type_changed)
@@ -187,8 +298,7 @@ class OrganizePage(QScrollArea):
 
         main_h.addWidget(right_widget, 1)
 
-        layout.addLayout(main_h)
-        self.setWidget(content)
+        self._content_layout.addLayout(main_h)
         self.retranslateUi()
 
     def _set_progress(
@@ -210,6 +320,7 @@ class OrganizePage(QScrollArea):
             text: Message to display.
             height: Minimum height for the empty state.
         """
+        self._last_fp = None
         self._preview_panel.set_empty(text, height)
 
     def _populate_preview_rows(self):
@@ -217,7 +328,10 @@ class OrganizePage(QScrollArea):
 
         Creates preview rows for files up to MAX_PREVIEW_FILES limit.
         """
-        rows, more_label = self._preview_controller.build_preview(self._files)
+        rows, more_label = self._preview_controller.build_preview(
+            itertools.islice(self._files, MAX_PREVIEW_FILES), total=len(self._files)
+        )
+        self._last_fp = None
         self._preview_panel.render_preview(rows, more_label)
 
     def retranslateUi(self):
@@ -225,7 +339,10 @@ class OrganizePage(QScrollArea):
 
         Called after language changes to refresh UI strings.
         """
-        self._translations = get_config_manager().load_language()
+        self._translations = self._cfg.load_language()
+        # Details and search results are fetched in the configured language
+        self._details_cache.clear()
+        self._search_cache.clear()
 
         titles = {
             "video": tr("tv_shows", "TV Shows"),
@@ -234,6 +351,13 @@ class OrganizePage(QScrollArea):
             "game": tr("games", "Games"),
         }
         self.lbl_page_title.setText(titles.get(self._type, tr("files", "Files")))
+        # Only the counts change per scan
+        self._preview_title_tpl = (
+            f"{_escape_format(tr('preview_title', 'Preview'))} ({{count}} "
+            f"{_escape_format(tr('files_from', 'files from'))} {{sources}})"
+        )
+        if not self._built:
+            return
 
         self._search_panel.retranslate_ui()
         self._options_panel.retranslate_ui()
@@ -242,7 +366,10 @@ class OrganizePage(QScrollArea):
             self._set_empty_preview(tr("select_folder", "Select a folder"))
             self._preview_title_label.setText(tr("preview", "PREVIEW"))
         else:
-            self._on_source([f.parent for f in self._files])
+            # The file set did not change, only its labels need translating
+            self._update_preview_title()
+            self._populate_preview_rows()
+            self._update_preview_and_actions()
 
     def _reset_search_and_selection(self):
         """Reset search panel and selected media.
@@ -256,6 +383,8 @@ class OrganizePage(QScrollArea):
 
         Ensures proper cleanup of worker threads.
         """
+        self._scan_runner.stop()
+        self._names_runner.stop()
         self._worker_runner.stop()
 
     def _run_worker(self, worker, on_finished, on_error, on_progress=None):
@@ -272,6 +401,41 @@ class OrganizePage(QScrollArea):
         """
         return self._worker_runner.run(worker, on_finished, on_error, on_progress)
 
+    def _fetch_details(
+        self,
+        media_id: str,
+        content_type: str,
+        fetch_episodes: bool,
+        on_finished,
+        on_error,
+    ):
+        """Fetch media details, reusing a previous result when available.
+
+        Details fetched with episodes also answer requests without them.
+        Cached results are delivered on the next event loop iteration so
+        callers see the same ordering as with a worker.
+
+        Args:
+            media_id: API identifier for the media item.
+            content_type: Type string (tv, movie, etc.).
+            fetch_episodes: Whether the episode list is needed.
+            on_finished: Callback receiving the details dictionary.
+            on_error: Callback for errors.
+        """
+        cached = self._details_cache.get((media_id, content_type, fetch_episodes))
+        if cached is None and not fetch_episodes:
+            cached = self._details_cache.get((media_id, content_type, True))
+        if cached is not None:
+            QTimer.singleShot(0, lambda: on_finished(cached))
+            return
+
+        def _store(details: dict):
+            self._details_cache[(media_id, content_type, fetch_episodes)] = details
+            on_finished(details)
+
+        worker = DetailsWorker(media_id, content_type, fetch_episodes=fetch_episodes)
+        self._run_worker(worker, _store, on_error)
+
     def _on_type_changed(self, content_type: str):
         """Handle content type change in SearchPanel.
 
@@ -280,8 +444,18 @@ class OrganizePage(QScrollArea):
         """
         pass
 
+    def _forget_search(self, query: str) -> None:
+        """Drop cached results for a query so the next search refetches.
+
+        Args:
+            query: Search query string.
+        """
+        for key in [k for k in self._search_cache if k[0] == query]:
+            del self._search_cache[key]
+        SearchWorker.invalidate(query)
+
     def _do_search(self, query: str):
-        """Execute search via the media manager.
+        """Execute search via the media manager, reusing recent results.
 
         Args:
             query: Search query string.
@@ -290,8 +464,21 @@ class OrganizePage(QScrollArea):
             return
 
         content_type = self._search_panel.get_content_type()
+        key = (query, content_type)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            QTimer.singleShot(0, lambda: self._on_search_results(cached))
+            return
+
+        def _store(results: list):
+            self._search_cache[key] = results
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+            self._on_search_results(results)
+
         worker = SearchWorker(query, content_type)
-        self._run_worker(worker, self._on_search_results, self._on_search_error)
+        self._run_worker(worker, _store, self._on_search_error)
 
     def _on_search_results(self, results: list):
         """Handle search completion.
@@ -322,9 +509,12 @@ class OrganizePage(QScrollArea):
 
         if content_type == "tv" and data:
             self._search_panel.set_status(tr("loading_episodes", "Loading episodes..."))
-            worker = DetailsWorker(str(data["id"]), "tv", fetch_episodes=True)
-            self._run_worker(
-                worker, self._on_preview_details_received, self._on_details_error
+            self._fetch_details(
+                str(data["id"]),
+                "tv",
+                True,
+                self._on_preview_details_received,
+                self._on_details_error,
             )
 
         self._update_preview_and_actions()
@@ -341,17 +531,22 @@ class OrganizePage(QScrollArea):
         selected_media = self._search_panel.get_selected_media()
         if selected_media and str(selected_media.get("id")) == str(details.get("id")):
             self._search_panel.update_selected_media(details)
+            # Episode data is merged in place, so the fingerprint cannot see it
+            self._last_fp = None
             self._update_preview_and_actions()
 
     def _on_source(self, paths):
         """Handle source folder selection.
 
-        Scans selected folders for media files and updates preview.
+        Starts a background scan of the selected folders; the preview is
+        updated once it completes.
 
         Args:
             paths: List of source folder paths.
         """
+        self._scan_token += 1
         if not paths:
+            self._scan_runner.stop()
             self._files = []
             self._preview_title_label.setText(tr("preview_title", "Preview"))
 
@@ -361,37 +556,37 @@ class OrganizePage(QScrollArea):
             self._update_preview_and_actions()
             return
 
-        self._preview_panel.clear()
-        self._files = scan_sources(self._ops, paths)
+        self._scan_paths = list(paths)
+        self._set_empty_preview(tr("loading", "Loading..."), height=40)
+        worker = ScanSourcesWorker(self._ops, self._scan_paths, self._scan_token)
+        self._scan_runner.run(worker, self._on_scan_done, self._on_scan_error)
 
-        sources_text = (
-            f"{len(paths)} {tr('folders_count', 'folder(s)')}"
-            if len(paths) > 1
-            else paths[0].name
-        )
-        self._preview_title_label.setText(
-            f"{tr('preview_title', 'Preview')} ({len(self._files)} {tr('files_from', 'files from')} {sources_text})"
-        )
+    def _on_scan_done(self, token: int, files: list):
+        """Handle source scan completion.
+
+        Updates the preview title, detects the search query from the
+        first file and renders the preview rows.
+
+        Args:
+            token: Token of the scan that finished.
+            files: Media files found in the scanned folders.
+        """
+        if token != self._scan_token:
+            # A newer selection replaced this scan after it had finished
+            return
+        self._files = files
+        self._update_preview_title()
 
         if not self._files:
             self._set_empty_preview(tr("no_files_found", "No files found"), height=40)
         else:
-            first_file_name = self._files[0].name
-            (
-                detected_query,
-                detected_type,
-            ) = self._preview_controller.detect_query_and_type(
-                first_file_name, self._type
+            detected_query, detected_type = _detect_cached(
+                self._preview_controller, self._files[0].name, self._type
             )
 
-            if detected_type == "series":
-                self._search_panel.set_type_by_data("tv")
-            elif detected_type == "movie":
-                self._search_panel.set_type_by_data("movie")
-            elif detected_type == "album":
-                self._search_panel.set_type_by_data("album")
-            elif detected_type == "artist":
-                self._search_panel.set_type_by_data("artist")
+            mapped_type = TYPE_MAP.get(detected_type or "")
+            if mapped_type:
+                self._search_panel.set_type_by_data(mapped_type)
 
             if detected_query:
                 self._search_panel.set_search_text(detected_query, auto_select=True)
@@ -400,67 +595,171 @@ class OrganizePage(QScrollArea):
 
         self._update_preview_and_actions()
 
+    def _update_preview_title(self):
+        """Show the file count and scanned sources in the preview title."""
+        paths = self._scan_paths
+        sources_text = (
+            f"{len(paths)} {tr('folders_count', 'folder(s)')}"
+            if len(paths) > 1
+            else paths[0].name
+        )
+        self._preview_title_label.setText(
+            self._preview_title_tpl.format(count=len(self._files), sources=sources_text)
+        )
+
+    def _on_scan_error(self, error: str):
+        """Handle source scan error.
+
+        Args:
+            error: Error message string.
+        """
+        self._files = []
+        self._set_empty_preview(tr("no_files_found", "No files found"), height=40)
+        self._update_preview_and_actions()
+
     def _on_dest_dropped(self, dest_path: str):
         """Handle destination folder selection.
 
         Args:
             dest_path: Selected destination folder path.
         """
-        self._update_preview_and_actions()
+        # The destination does not affect the previewed names
+        self._update_action_btn(
+            self._search_panel.get_selected_media(),
+            self._search_panel.get_content_type(),
+        )
 
     def _update_preview_and_actions(self):
+        """Schedule a preview names and action button update.
+
+        Calls within the same 30 ms window are merged into one update.
+        """
+        self._refresh_timer.start()
+
+    def _do_update_preview_and_actions(self):
         """Update preview names and action button state.
 
-        Groups related interface updates for efficiency.
+        Groups related interface updates for efficiency. Names are only
+        recomputed when the preview fingerprint changed since the last pass.
         """
-        self._update_preview_names()
-        self._update_action_btn()
+        selected_media = self._search_panel.get_selected_media()
+        content_type = self._search_panel.get_content_type()
+        fp = self._preview_fingerprint(selected_media, content_type)
+        if not self._same_fingerprint(fp, self._last_fp):
+            self._update_preview_names(selected_media, content_type)
+            self._last_fp = fp
+        self._update_action_btn(selected_media, content_type)
+
+    def _preview_fingerprint(
+        self, selected_media: dict | None, content_type: str
+    ) -> tuple:
+        """Summarize the state the previewed names depend on.
+
+        Args:
+            selected_media: Selected media information dictionary.
+            content_type: Content type string.
 
-    def _compute_new_name(
-        self, file: Path, media_info: dict | None, content_type: str
-    ) -> str:
-        """Compute new filename for a media file.
+        Returns:
+            Tuple of the file list, its size, the selected media and the
+            content type. The objects themselves are held, not their ids,
+            so a new list or dict cannot reuse the address of the old one.
+        """
+        return (self._files, len(self._files), selected_media, content_type)
+
+    @staticmethod
+    def _same_fingerprint(fp: tuple, last: tuple | None) -> bool:
+        """Compare two preview fingerprints.
+
+        Args:
+            fp: Current fingerprint.
+            last: Fingerprint of the last names pass, or None.
+
+        Returns:
+            True if the same file list and media object are previewed
+            with the same size and content type.
+        """
+        return (
+            last is not None
+            and fp[0] is last[0]
+            and fp[1] == last[1]
+            and fp[2] is last[2]
+            and fp[3] == last[3]
+        )
 
-        Uses MediaItem factory and FileOperations to generate proper name.
+    def _build_media_item(self, media_info: dict | None, content_type: str):
+        """Build the MediaItem used to name every previewed file.
 
         Args:
-            file: Original file path.
             media_info: Selected media information dictionary.
             content_type: Content type string.
 
         Returns:
-            Generated new filename, or empty string if unavailable.
+            MediaItem for the selection, or None if nothing is selected or
+            the file operations cannot generate names.
         """
-        if not media_info:
-            return ""
-        lang = get_config_manager().get("language", "en")
-        media_item = create_media_item(
-            media_info, content_type, self._manager, language=lang
-        )
-        if media_item and hasattr(self._ops, "generate_new_filename"):
-            return self._ops.generate_new_filename(media_item, file.name)
-        return ""
+        if not media_info or not hasattr(self._ops, "generate_new_filename"):
+            return None
+        lang = self._cfg.get("language", "en")
+        return create_media_item(media_info, content_type, self._manager, language=lang)
 
-    def _update_preview_names(self):
+    def _update_preview_names(self, selected_media: dict | None, content_type: str):
         """Update computed new names in preview panel.
 
-        Recalculates names based on current media selection.
+        Recalculates names based on current media selection. The MediaItem
+        is built once per pass and shared by all rows.
+
+        Args:
+            selected_media: Selected media information dictionary.
+            content_type: Content type string.
         """
-        selected_media = self._search_panel.get_selected_media()
-        content_type = self._search_panel.get_content_type()
-        self._preview_panel.update_new_names(
-            lambda file: self._compute_new_name(file, selected_media, content_type)  # type: ignore[arg-type]
+        media_item = self._build_media_item(selected_media, content_type)
+        files = self._preview_panel.files
+        self._names_token += 1
+        if media_item is None or len(files) <= SYNC_PREVIEW_NAMES:
+            # Results of a pass for the previous selection must not land
+            self._names_runner.stop()
+        if media_item is None:
+            self._preview_panel.set_new_names([""] * len(files))
+            return
+
+        if len(files) <= SYNC_PREVIEW_NAMES:
+            generate = self._ops.generate_new_filename  # type: ignore[union-attr]
+            self._preview_panel.set_new_names(
+                [generate(media_item, file.name) for file in files]
+            )
+            return
+
+        self._preview_panel.set_new_names(["…"] * len(files))
+        worker = ComputeNamesWorker(files, media_item, self._ops, self._names_token)
+        self._names_runner.run(
+            worker,
+            self._on_names_done,
+            lambda e: logger.error("Preview names worker error: %s", e),
         )
 
-    def _update_action_btn(self):
+    def _on_names_done(self, token: int, names: dict):
+        """Apply names computed off the UI thread.
+
+        Args:
+            token: Token of the pass that finished.
+            names: Mapping of file path to new name.
+        """
+        if token != self._names_token:
+            # The selection changed after this pass had finished
+            return
+        self._preview_panel.apply_precomputed_names(names)
+
+    def _update_action_btn(self, selected_media: dict | None, content_type: str):
         """Update action button state in OptionsPanel.
 
         Enables or disables based on file and media selection.
+
+        Args:
+            selected_media: Selected media information dictionary.
+            content_type: Content type string.
         """
         has_files = len(self._files) > 0
-        selected_media = self._search_panel.get_selected_media()
         has_media = selected_media is not None
-        content_type = self._search_panel.get_content_type()
 
         self._options_panel.update_action_state(has_files, has_media)
         self._options_panel.update_create_folders_visibility(content_type, has_media)
@@ -497,8 +796,13 @@ class OrganizePage(QScrollArea):
         self._options_panel.set_create_folders_enabled(False)
         self._options_panel.set_create_folders_text(tr("loading", "Loading..."))
 
-        worker = DetailsWorker(str(series_id), "tv")
-        self._run_worker(worker, self._on_details_received, self._on_details_error)
+        self._fetch_details(
+            str(series_id),
+            "tv",
+            False,
+            self._on_details_received,
+            self._on_details_error,
+        )
 
     def _on_details_received(self, details: dict):
         """Handle received series details from API.
@@ -517,9 +821,9 @@ class OrganizePage(QScrollArea):
         num_seasons = details.get("number_of_seasons", 0)
 
         if not num_seasons or num_seasons < 1:
-            self._options_panel.set_create_folders_enabled(True)
-            self._options_panel.set_create_folders_text(
-                tr("create_series_folders", "Create series folders")
+            self._options_panel.reset_create_folders_ui(
+                tr("create_series_folders", "Create series folders"),
+                hide_progress=False,
             )
             QMessageBox.warning(
                 self,
@@ -533,31 +837,13 @@ class OrganizePage(QScrollArea):
         try:
             self._search_panel.update_selected_media(details)
 
-            season_word = tr("season", "Season")
-            seasons_data = details.get("seasons", [])
-            seasons = {}
-
-            for i in range(1, num_seasons + 1):
-                season_name = None
-                for s in seasons_data:
-                    if s.get("season_number") == i:
-                        season_name = s.get("name", "")
-                        break
-
-                if season_name and season_name.lower() not in [
-                    f"season {i}",
-                    f"saison {i}",
-                    "",
-                ]:
-                    folder_name = f"{season_word} {i} - {season_name}"
-                else:
-                    folder_name = f"{season_word} {i}"
-
-                seasons[folder_name] = i
+            seasons = _season_folders(
+                tr("season", "Season"), num_seasons, details.get("seasons", [])
+            )
 
             self._set_progress(True, tr("creating_folders", "Creating folders..."), 0)
 
-            worker = CreateFoldersWorker(str(dest), title, seasons)
+            worker = CreateFoldersWorker(dest, title, seasons)
             self._run_worker(
                 worker,
                 self._on_folders_created,
@@ -567,9 +853,9 @@ class OrganizePage(QScrollArea):
 
         except (OSError, ValueError, KeyError) as e:
             logger.exception("Folder creation flow failed", exc_info=e)
-            self._options_panel.set_create_folders_enabled(True)
-            self._options_panel.set_create_folders_text(
-                tr("create_series_folders", "Create series folders")
+            self._options_panel.reset_create_folders_ui(
+                tr("create_series_folders", "Create series folders"),
+                hide_progress=False,
             )
             QMessageBox.critical(
                 self,
@@ -585,9 +871,7 @@ class OrganizePage(QScrollArea):
         Args:
             report: Report dictionary with 'created' count and 'errors' list.
         """
-        self._set_progress(False)
-        self._options_panel.set_create_folders_enabled(True)
-        self._options_panel.set_create_folders_text(
+        self._options_panel.reset_create_folders_ui(
             tr("create_series_folders", "Create series folders")
         )
 
@@ -617,9 +901,7 @@ class OrganizePage(QScrollArea):
         Args:
             error: Error message string describing the failure.
         """
-        self._set_progress(False)
-        self._options_panel.set_create_folders_enabled(True)
-        self._options_panel.set_create_folders_text(
+        self._options_panel.reset_create_folders_ui(
             tr("create_series_folders", "Create series folders")
         )
         QMessageBox.critical(
@@ -636,9 +918,9 @@ class OrganizePage(QScrollArea):
         Args:
             error: Error message string from the API call.
         """
-        self._options_panel.set_create_folders_enabled(True)
-        self._options_panel.set_create_folders_text(
-            tr("create_series_folders", "Create series folders")
+        self._options_panel.reset_create_folders_ui(
+            tr("create_series_folders", "Create series folders"),
+            hide_progress=False,
         )
         QMessageBox.critical(
             self,
@@ -687,9 +969,12 @@ class OrganizePage(QScrollArea):
         if content_type == "tv" and selected_media:
             series_id = selected_media.get("id")
             if series_id:
-                worker = DetailsWorker(str(series_id), "tv", fetch_episodes=True)
-                self._run_worker(
-                    worker, self._on_episodes_received, self._on_organize_error
+                self._fetch_details(
+                    str(series_id),
+                    "tv",
+                    True,
+                    self._on_episodes_received,
+                    self._on_organize_error,
                 )
                 return
 
@@ -718,7 +1003,7 @@ class OrganizePage(QScrollArea):
         selected_media = self._search_panel.get_selected_media()
         content_type = self._search_panel.get_content_type()
 
-        lang = get_config_manager().get("language", "en")
+        lang = self._cfg.get("language", "en")
         media_item = create_media_item(
             selected_media or {}, content_type, self._manager, language=lang
         )
@@ -727,28 +1012,11 @@ class OrganizePage(QScrollArea):
             if isinstance(media_item, Series):
                 num_seasons = selected_media.get("number_of_seasons", 0)
                 if num_seasons:
-                    season_word = tr("season", "Season")
-                    seasons_data = selected_media.get("seasons", [])
-                    media_item.seasons = {}
-
-                    for i in range(1, num_seasons + 1):
-                        season_name = None
-                        for s in seasons_data:
-                            if s.get("season_number") == i:
-                                season_name = s.get("name", "")
-                                break
-
-                        i_padded = str(i)
-                        if season_name and season_name.lower() not in [
-                            f"season {i}",
-                            f"saison {i}",
-                            "",
-                        ]:
-                            folder_name = f"{season_word} {i_padded} - {season_name}"
-                        else:
-                            folder_name = f"{season_word} {i_padded}"
-
-                        media_item.seasons[folder_name] = i
+                    media_item.seasons = _season_folders(
+                        tr("season", "Season"),
+                        num_seasons,
+                        selected_media.get("seasons", []),
+                    )
 
                 episodes = selected_media.get("episodes", {})
                 if episodes:
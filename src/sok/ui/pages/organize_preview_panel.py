@@ -11,41 +11,36 @@
 """Preview panel widget extracted from OrganizePage."""
 
 from pathlib import Path
-from typing import Callable, Iterable, Protocol
+from typing import Callable, Iterable, Mapping, Sequence
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QFrame, QVBoxLayout, QWidget
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QFrame,
+    QListView,
+    QSizePolicy,
+    QVBoxLayout,
+    QWidget,
+)
 
 from sok.ui.components.base import Card
+from sok.ui.components.preview import FileRowDelegate, PreviewModel
 from sok.ui.components.window import StopPropagationScrollArea
 from sok.ui.controllers.ui_state import set_empty_state
 from sok.ui.theme import card_shadow
 
 
-class PreviewRow(Protocol):
-    """Protocol for preview row widgets.
-
-    Defines the interface for widgets that can display file preview
-    rows with editable new names.
-    """
-
-    def set_new_name(self, name: str) -> None:
-        """Set the computed new name for display.
-
-        Args:
-            name: The computed new filename.
-        """
-        ...
-
-
 class PreviewPanel(QWidget):
     """Widget for rendering file preview rows.
 
     Displays a scrollable list of file preview rows showing
-    original and computed new filenames.
+    original and computed new filenames. Rows live in a PreviewModel and
+    are painted by a delegate, so no widget is created per file.
 
     Attributes:
-        _file_rows: List of (file_path, row_widget) tuples.
+        _model: Previewed files and their computed new names.
+        _list: View painting the model rows.
+        _extra_layout: Holds the empty state or "more" label below the rows.
     """
 
     def __init__(self, parent: QWidget | None = None):
@@ -55,7 +50,6 @@ class PreviewPanel(QWidget):
             parent: Parent widget.
         """
         super().__init__(parent)
-        self._file_rows: list[tuple[Path, PreviewRow]] = []
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -78,6 +72,25 @@ class PreviewPanel(QWidget):
         self._preview_card = Card()
         self._preview_card.setObjectName("InnerCard")
 
+        self._model = PreviewModel(self)
+        self._list = QListView()
+        self._list.setModel(self._model)
+        self._list.setItemDelegate(FileRowDelegate(self._list))
+        self._list.setFrameShape(QFrame.Shape.NoFrame)
+        self._list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._list.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._list.setStyleSheet("background: transparent;")
+        self._list.hide()
+        self._preview_card._layout.addWidget(self._list)
+
+        self._extra_layout = QVBoxLayout()
+        self._extra_layout.setContentsMargins(0, 0, 0, 0)
+        self._extra_layout.setSpacing(0)
+        self._preview_card._layout.addLayout(self._extra_layout)
+
         preview_scroll.setWidget(self._preview_card)
         self._preview_container._layout.addWidget(preview_scroll)
 
@@ -87,10 +100,11 @@ class PreviewPanel(QWidget):
     def clear(self) -> None:
         """Remove all preview rows.
 
-        Clears the preview layout and file rows list.
+        Clears the preview model and any empty state or "more" label.
         """
-        _clear_layout(self._preview_card._layout)
-        self._file_rows.clear()
+        _clear_layout(self._extra_layout, self._preview_card)
+        self._model.set_files(())
+        self._list.hide()
 
     def set_empty(self, text: str, height: int = 200) -> None:
         """Display empty state message.
@@ -100,23 +114,25 @@ class PreviewPanel(QWidget):
             height: Minimum height for the empty state.
         """
         self.clear()
-        set_empty_state(self._preview_card._layout, text)
+        set_empty_state(self._extra_layout, text)
 
-    def render_preview(
-        self, rows: Iterable[tuple[Path, PreviewRow]], more_label: QWidget | None
-    ) -> None:
+    def render_preview(self, files: Iterable[Path], more_label: QWidget | None) -> None:
         """Render preview rows in the panel.
 
         Args:
-            rows: Iterable of (file_path, row_widget) tuples.
+            files: File paths to show, one row each.
             more_label: Optional label showing count of additional files.
         """
-        self.clear()
-        for file_path, row in rows:
-            self._file_rows.append((file_path, row))
-            self._preview_card.add(row)  # type: ignore[arg-type]
+        _clear_layout(self._extra_layout, self._preview_card)
+        self._model.set_files(files)
+        count = self._model.rowCount()
+        # The outer scroll area scrolls, so the view shows every row
+        self._list.setFixedHeight(
+            sum(self._list.sizeHintForRow(row) for row in range(count))
+        )
+        self._list.setVisible(count > 0)
         if more_label:
-            self._preview_card.add(more_label, last=True)
+            self._extra_layout.addWidget(more_label)
 
     def update_new_names(self, compute_new_name: Callable[[Path], str]) -> None:
         """Update computed new names for all preview rows.
@@ -124,26 +140,65 @@ class PreviewPanel(QWidget):
         Args:
             compute_new_name: Function to compute new name from file path.
         """
-        for file_path, row in self._file_rows:
-            row.set_new_name(compute_new_name(file_path))
+        self._model.set_new_names(
+            [compute_new_name(file_path) for file_path in self._model.files]
+        )
+
+    def set_new_names(self, names: Sequence[str]) -> None:
+        """Set precomputed new names on the preview rows in display order.
+
+        Args:
+            names: One name per row; rows beyond the sequence are left as is.
+        """
+        self._model.set_new_names(names)
+
+    def apply_precomputed_names(self, names: Mapping[Path, str]) -> None:
+        """Apply names computed off the UI thread in a single pass.
+
+        Rows whose file is not in the mapping keep their current name, so
+        results that arrive after the rows were rebuilt are harmless.
+
+        Args:
+            names: Mapping of file path to new name.
+        """
+        self._model.apply_names(names)
 
     @property
-    def file_rows(self) -> list[tuple[Path, PreviewRow]]:
-        """Get the list of file preview rows.
+    def files(self) -> tuple[Path, ...]:
+        """Get the previewed file paths without building row tuples.
 
         Returns:
-            List of (file_path, row_widget) tuples.
+            Tuple of file paths in row order.
         """
-        return list(self._file_rows)
+        return self._model.files
+
+    @property
+    def file_rows(self) -> list[tuple[Path, str]]:
+        """Get the file preview rows.
+
+        Returns:
+            List of (file_path, new_name) tuples.
+        """
+        return list(zip(self._model.files, self._model.new_names))
 
 
-def _clear_layout(layout) -> None:
+def _clear_layout(layout, parent: QWidget) -> None:
     """Remove all items from a layout.
 
+    Items are detached first and their widgets hidden and scheduled for
+    deletion with updates suspended, so the parent repaints once.
+
     Args:
         layout: Qt layout to clear.
+        parent: Widget owning the layout.
     """
-    while layout.count() > 0:
-        item = layout.takeAt(0)
-        if item.widget():
-            item.widget().deleteLater()
+    parent.setUpdatesEnabled(False)
+    try:
+        items = [layout.takeAt(0) for _ in range(layout.count())]
+        for item in items:
+            widget = item.widget()
+            if widget is not None:
+                widget.hide()
+                widget.deleteLater()
+    finally:
+        parent.setUpdatesEnabled(True)
@@ -10,7 +10,7 @@
 # ===----------------------------------------------------------------------=== #
 """Settings Page orchestrator that composes section components."""
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QPoint, QRect, Qt, QTimer, Signal
 from PySide6.QtWidgets import QScrollArea, QWidget, QVBoxLayout, QLabel, QMessageBox
 
 from sok.config.config_manager import get_config_manager
@@ -29,7 +29,8 @@ class SettingsPage(QScrollArea):
     """Settings page with reusable configuration sections.
 
     Composes API, paths, formats, appearance, and behavior settings
-    into a unified configuration interface.
+    into a unified configuration interface. Each section is built, then
+    translated and loaded, the first time its placeholder scrolls into view.
 
     Attributes:
         language_changed: Signal emitted with new language code.
@@ -39,6 +40,19 @@ class SettingsPage(QScrollArea):
     language_changed = Signal(str)
     theme_changed = Signal(bool)
 
+    # Section attribute names in display order
+    _SECTION_NAMES = (
+        "api_section",
+        "api_pref_section",
+        "paths_section",
+        "formats_section",
+        "appearance_section",
+        "behavior_section",
+        "about_section",
+    )
+    # Height reserved for a section until it is built
+    _PLACEHOLDER_HEIGHT = 200
+
     def __init__(self, on_toggle, parent=None):
         """Initialize the settings page.
 
@@ -51,17 +65,58 @@ class SettingsPage(QScrollArea):
         self._config = get_config_manager()
         self._oauth = OAuthManager()
 
+        self.api_section: ApiSection | None = None
+        self.api_pref_section: ApiPreferencesSection | None = None
+        self.paths_section: PathsSection | None = None
+        self.formats_section: FormatsSection | None = None
+        self.appearance_section: AppearanceSection | None = None
+        self.behavior_section: BehaviorSection | None = None
+        self.about_section: AboutSection | None = None
+        self._section_factories = {
+            "api_section": lambda: ApiSection(self._config, self._oauth),
+            "api_pref_section": lambda: ApiPreferencesSection(self._config),
+            "paths_section": lambda: PathsSection(self._config),
+            "formats_section": lambda: FormatsSection(self._config),
+            "appearance_section": lambda: AppearanceSection(self._config),
+            "behavior_section": lambda: BehaviorSection(self._config),
+            "about_section": lambda: AboutSection(self._config),
+        }
+        self._placeholders: dict[str, QWidget] = {}
+
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setObjectName("Page")
 
         self._build()
-        self._load_settings()
+        self.verticalScrollBar().valueChanged.connect(self._build_visible_sections)
+
+    def showEvent(self, event):
+        """Handle page show event.
+
+        Builds the sections visible once the layout has settled.
+
+        Args:
+            event: Show event.
+        """
+        super().showEvent(event)
+        QTimer.singleShot(0, self._build_visible_sections)
+
+    def resizeEvent(self, event):
+        """Handle page resize event.
+
+        A taller viewport can reveal more placeholders.
+
+        Args:
+            event: Resize event.
+        """
+        super().resizeEvent(event)
+        if self._placeholders:
+            QTimer.singleShot(0, self._build_visible_sections)
 
     def _build(self):
         """Build the settings page layout.
 
-        Creates all setting sections and adds them to the layout.
+        Adds a fixed-height placeholder for every setting section.
         """
         content = QWidget()
         content.setObjectName("PageContent")
@@ -73,65 +128,94 @@ class SettingsPage(QScrollArea):
         self.lbl_title.setObjectName("PageTitle")
         self._main_layout.addWidget(self.lbl_title)
 
-        self.api_section = ApiSection(self._config, self._oauth)
-        self.api_pref_section = ApiPreferencesSection(self._config)
-        self.paths_section = PathsSection(self._config)
-        self.formats_section = FormatsSection(self._config)
-        self.appearance_section = AppearanceSection(self._config)
-        self.behavior_section = BehaviorSection(self._config)
-        self.about_section = AboutSection(self._config)
-
-        self.appearance_section.theme_changed.connect(self._on_theme_change)
-        self.appearance_section.language_changed.connect(self._on_language_change)
-        self.about_section.reset_requested.connect(self._on_reset)
-
-        for section in [
-            self.api_section,
-            self.api_pref_section,
-            self.paths_section,
-            self.formats_section,
-            self.appearance_section,
-            self.behavior_section,
-            self.about_section,
-        ]:
-            self._main_layout.addWidget(section)
+        for name in self._SECTION_NAMES:
+            placeholder = QWidget()
+            placeholder.setFixedHeight(self._PLACEHOLDER_HEIGHT)
+            self._placeholders[name] = placeholder
+            self._main_layout.addWidget(placeholder)
 
         self._main_layout.addStretch()
         self.setWidget(content)
         self.retranslateUi()
 
+    def _built_sections(self) -> list[QWidget]:
+        """Return the sections built so far, in display order.
+
+        Returns:
+            List of section widgets.
+        """
+        return [
+            section
+            for name in self._SECTION_NAMES
+            if (section := getattr(self, name)) is not None
+        ]
+
+    def _build_visible_sections(self):
+        """Build every section whose placeholder intersects the viewport."""
+        if not self._placeholders or not self.isVisible():
+            return
+        viewport = self.viewport()
+        visible = viewport.rect()
+        built = False
+        for name, placeholder in list(self._placeholders.items()):
+            top_left = placeholder.mapTo(viewport, QPoint(0, 0))
+            if QRect(top_left, placeholder.size()).intersects(visible):
+                self._build_section(name)
+                built = True
+        if built:
+            # Built sections rarely match the placeholder height; check again
+            # once the layout has been updated
+            QTimer.singleShot(0, self._build_visible_sections)
+
+    def _build_section(self, name: str):
+        """Replace a placeholder with its section, then translate and load it.
+
+        Args:
+            name: Section attribute name from _SECTION_NAMES.
+        """
+        section = self._section_factories[name]()
+        if isinstance(section, AppearanceSection):
+            section.theme_changed.connect(self._on_theme_change)
+            section.language_changed.connect(self._on_language_change)
+        elif isinstance(section, AboutSection):
+            section.reset_requested.connect(self._on_reset)
+        setattr(self, name, section)
+
+        placeholder = self._placeholders.pop(name)
+        self._main_layout.replaceWidget(placeholder, section)
+        placeholder.deleteLater()
+        section.retranslate()
+        section.load()
+
+    def is_busy(self) -> bool:
+        """Check whether the page has background work in progress.
+
+        The OAuth flow blocks its thread until the user answers, so it
+        cannot be stopped; the page must stay alive until it ends.
+
+        Returns:
+            True while an OAuth authentication is running.
+        """
+        return self._oauth.is_busy()
+
     def retranslateUi(self):
         """Update all translatable text.
 
-        Called after language changes to refresh UI strings.
+        Called after language changes to refresh UI strings. Sections not
+        built yet are translated when they are built.
         """
         self.lbl_title.setText(tr("settings", "Settings"))
-        for section in [
-            self.api_section,
-            self.api_pref_section,
-            self.paths_section,
-            self.formats_section,
-            self.appearance_section,
-            self.behavior_section,
-            self.about_section,
-        ]:
-            section.retranslate()
+        for section in self._built_sections():
+            section.retranslate()  # type: ignore[attr-defined]
 
     def _load_settings(self):
-        """Load settings into all sections.
+        """Load settings into the built sections.
 
-        Populates UI with current configuration values.
+        Populates UI with current configuration values; the remaining
+        sections load them when they are built.
         """
-        for section in [
-            self.api_section,
-            self.api_pref_section,
-            self.paths_section,
-            self.formats_section,
-            self.appearance_section,
-            self.behavior_section,
-            self.about_section,
-        ]:
-            section.load()
+        for section in self._built_sections():
+            section.load()  # type: ignore[attr-defined]
 
     def _on_theme_change(self, is_dark: bool):
         """Handle theme toggle from appearance section.
@@ -12,12 +12,20 @@
 Design Tokens and Theme Utilities for S.O.K
 """
 
+import functools
 import sys
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 from PySide6.QtGui import QColor, QPainter, QPixmap
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QGraphicsDropShadowEffect
+from PySide6.QtCore import Qt, QRect, QRectF
+from PySide6.QtWidgets import (
+    QGraphicsBlurEffect,
+    QGraphicsDropShadowEffect,
+    QGraphicsPixmapItem,
+    QGraphicsScene,
+)
 from PySide6.QtSvg import QSvgRenderer
 import re
 
@@ -43,8 +51,9 @@ class Theme:
 
     Attributes:
         FONT: System font name (SF Pro, Segoe UI, or Inter).
-        LIGHT: Orange theme color dictionary.
-        DARK: Dark theme color dictionary.
+        LIGHT: Orange theme color mapping (read-only).
+        DARK: Dark theme color mapping (read-only).
+        current_palette: Palette of the active theme, set by MainWindow.
     """
 
     FONT = (
@@ -93,10 +102,377 @@ class Theme:
 
     R = 10
 
+    current_palette: Mapping[str, str]
+
+
+def _normalize_theme(colors: dict) -> dict:
+    """Fill in optional theme keys so consumers can index them directly.
+
+    Args:
+        colors: Theme color dictionary, updated in place.
+
+    Returns:
+        The same dictionary, with every optional key present.
+    """
+    colors.setdefault("card_bg", colors["card"])
+    colors.setdefault("input_bg", colors["card"])
+    colors.setdefault("dropdown_bg", colors["card"])
+    colors.setdefault("tertiary", "rgba(255,255,255,0.3)")
+    colors.setdefault("secondary", "rgba(255,255,255,0.5)")
+    colors.setdefault("red", "#FF5555")
+    return colors
+
+
+def _freeze_theme(colors: dict) -> Mapping[str, str]:
+    """Normalize a theme and wrap it in a read-only mapping.
+
+    Values are interned so the same color strings are shared by every
+    stylesheet built from the theme.
+
+    Args:
+        colors: Theme color dictionary.
+
+    Returns:
+        Read-only view of the normalized colors.
+    """
+    _normalize_theme(colors)
+    return MappingProxyType(
+        {k: sys.intern(v) if isinstance(v, str) else v for k, v in colors.items()}
+    )
+
+
+Theme.LIGHT = _freeze_theme(Theme.LIGHT)  # type: ignore[assignment]
+Theme.DARK = _freeze_theme(Theme.DARK)  # type: ignore[assignment]
+# Matches the Theme.DARK fallback widgets use outside a MainWindow
+Theme.current_palette = Theme.DARK
+
+
+@functools.lru_cache(maxsize=4)
+def build_app_qss(is_dark: bool, outer_radius: int = 12) -> str:
+    """Render the application stylesheet for a theme.
+
+    The stylesheet is applied once on the main window and cached per theme
+    and corner radius, so toggling themes or maximizing reuses it.
+
+    Args:
+        is_dark: True for the dark theme, False for the orange one.
+        outer_radius: Corner radius of the window frame in pixels.
+
+    Returns:
+        Stylesheet text.
+    """
+    c = Theme.DARK if is_dark else Theme.LIGHT
+    dark = Theme.DARK
+    font = Theme.FONT
+    return f"""
+        QWidget {{
+            font-family: '{font}';
+            outline: none;
+        }}
+
+        QMainWindow, #Central {{
+            background: transparent;
+        }}
+
+        /* Sidebar */
+        #Sidebar {{
+            background: {c["card"]};
+            border-right: 1px solid {c["separator"]};
+            border-top-left-radius: {outer_radius}px;
+            border-bottom-left-radius: {outer_radius}px;
+        }}
+
+        #SidebarSection {{
+            font-size: 11px;
+            font-weight: 600;
+            color: {c["secondary"]};
+            padding: 16px 20px 6px 20px;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }}
+
+        /* Right Column (Background + Radius) */
+        #RightCol {{
+            background: {c["bg"]};
+            border-top-right-radius: {outer_radius}px;
+            border-bottom-right-radius: {outer_radius}px;
+        }}
+
+        /* Header */
+        #Header {{
+            background: transparent;
+            /* Optional bottom border */
+            /* border-bottom: 1px solid {c["separator"]}; */
+        }}
+
+        #AppTitle {{
+            font-size: 13px;
+            font-weight: 600;
+            color: {c["text"]};
+            padding-left: 4px;
+        }}
+
+        /* Content Area (Transparent to show RightCol background) */
+        #Content {{
+            background: transparent;
+        }}
+
+        #Page {{
+            background: transparent;
+            border: none;
+        }}
+
+        #PageContent {{
+            background: transparent;
+        }}
+
+        #PageTitle {{
+            font-size: 28px;
+            font-weight: 700;
+            color: {c["text"]};
+            margin-bottom: 10px;
+        }}
+
+        #SectionLabel, #CategoryLabel {{
+            font-size: 11px;
+            font-weight: 600;
+            color: {c["secondary"]};
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            margin-top: 10px;
+            margin-bottom: 4px;
+        }}
+
+        #EmptyState {{
+            color: {c["secondary"]};
+            font-size: 13px;
+        }}
+
+        /* Common Widgets Stylesheet overrides for Card/Input */
+
+        #Card {{
+            background: {c["card_bg"]};
+            border: 1px solid {c["separator"]};
+            border-radius: {Theme.R}px;
+        }}
+
+        #Separator {{
+            background: {c["separator"]};
+            margin-left: 12px;
+        }}
+
+        /* Inputs */
+        #SearchBar, #SettingsInput, #SettingsFormatInput {{
+            background: {c["input_bg"]};
+            border: 1px solid {c["separator"]};
+            border-radius: 8px;
+            padding: 4px 12px;
+            color: {c["text"]};
+            font-size: 13px;
+        }}
+
+        #SearchBar:focus, #SettingsInput:focus {{
+            border-color: {c["accent"]};
+        }}
+
+        /* Combos */
+        QComboBox {{
+            background: {c["input_bg"]};
+            border: 1px solid {c["separator"]};
+            border-radius: 8px;
+            padding: 4px 12px;
+            color: {c["text"]};
+        }}
+
+        QComboBox:hover {{
+            border-color: {c["accent"]};
+        }}
+
+        QComboBox::drop-down {{
+            border: none;
+            width: 24px;
+        }}
+
+        QComboBox QAbstractItemView {{
+            background: {c["dropdown_bg"]};
+            border: 1px solid {c["separator"]};
+            border-radius: 12px;
+            padding: 4px;
+            outline: none;
+
+            /* Force palette colors for Fusion style */
+            selection-background-color: {c["accent"]};
+            selection-color: {c["accent_text"]};
+        }}
+
+        QComboBox QAbstractItemView::item {{
+            min-height: 32px;
+            padding-left: 10px;
+            border-radius: 6px;
+            margin: 2px 0;
+            color: {c["text"]};
+        }}
+
+        QComboBox QAbstractItemView::item:selected,
+        QComboBox QAbstractItemView::item:hover {{
+            background: {c["accent"]};
+            color: {c["accent_text"]};
+        }}
+
+        /* Buttons */
+        #ActionBtn {{
+            background: {c["accent"]};
+            border-radius: 16px;
+            color: {c["accent_text"]};
+            font-weight: 600;
+            font-size: 13px;
+            padding: 0 16px;
+            border: none;
+        }}
+
+        #ActionBtn:hover {{
+            background: {c["accent"]};
+            opacity: 0.9;
+        }}
+
+        #ActionBtn:pressed {{
+            background: {c["accent"]};
+            margin-top: 1px;
+            margin-bottom: -1px;
+        }}
+
+        #ActionBtn:disabled {{
+            background: {c["separator"]};
+            color: {c["secondary"]};
+        }}
+
+        #SmallBtn {{
+            background: {c["accent"]};
+            border-radius: 6px;
+            color: {c["accent_text"]};
+            font-weight: 600;
+        }}
+
+        #SmallBtn:hover {{
+            background: {c["accent"]};
+            opacity: 0.9;
+        }}
+
+        #SmallBtn:pressed {{
+            background: {c["accent"]};
+        }}
+
+        #DestructiveBtn {{
+            background: {c["red"]};
+            border-radius: 16px;
+            color: white;
+            font-weight: 600;
+        }}
+
+        #DestructiveBtn:hover {{
+            background: #FF6B6B;
+        }}
+
+        #DestructiveBtn:pressed {{
+            background: #EE4444;
+            margin-top: 1px;
+            margin-bottom: -1px;
+        }}
+
+        /* Movie batch rows keep the dark palette in both themes */
+        #MovieOriginalName {{
+            color: {dark["secondary"]};
+            font-size: 11px;
+        }}
+
+        #MovieMatchCombo {{
+            background: {dark["input_bg"]};
+            border: 1px solid {dark["separator"]};
+            border-radius: 6px;
+            padding: 2px 8px;
+            color: {dark["text"]};
+        }}
+
+        #MovieMatchCombo QAbstractItemView {{
+            background: {dark["dropdown_bg"]};
+            border: 1px solid {dark["separator"]};
+            border-radius: 6px;
+            padding: 4px;
+            color: {dark["text"]};
+            outline: none;
+            selection-background-color: {dark["accent"]};
+            selection-color: {dark["accent_text"]};
+        }}
+
+        #MovieMatchCombo QAbstractItemView::item {{
+            min-height: 24px;
+            padding-left: 8px;
+            color: {dark["text"]};
+        }}
+
+        /* ScrollBar */
+        QScrollBar:vertical {{
+            background: transparent;
+            width: 14px;
+            margin: 0;
+        }}
+
+        QScrollBar::handle:vertical {{
+            background: {c["tertiary"]};
+            border-radius: 4px;
+            min-height: 40px;
+            margin: 2px 3px; /* Handle width = 14 - 6 = 8px. Radius 4px makes it fully round */
+        }}
+
+        QScrollBar::handle:vertical:hover {{
+            background: {c["secondary"]};
+        }}
+
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+            height: 0;
+            background: none;
+        }}
+
+        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
+            background: none;
+        }}
+    """
+
+
+# Stroke and fill attributes recolored by svg_icon, except explicit "none"
+_ATTR_RE = re.compile(r'(stroke|fill)=(["\'])(?!none\2).*?\2', re.IGNORECASE)
+
+
+# Bundled icon names, listed once: the asset set is fixed at install time
+_AVAILABLE_ICONS = (
+    frozenset(p.stem for p in ASSETS_DIR.glob("*.svg"))
+    if ASSETS_DIR.exists()
+    else frozenset()
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_svg(name: str) -> str | None:
+    """Read the source of a bundled SVG icon.
+
+    Args:
+        name: Icon name (without .svg extension).
+
+    Returns:
+        SVG text, or None if the icon does not exist.
+    """
+    if name not in _AVAILABLE_ICONS:
+        return None
+    with open(ASSETS_DIR / f"{name}.svg", "r", encoding="utf-8") as f:
+        return f.read()
+
 
 def svg_icon(name: str, color: str, size: int = 22) -> QPixmap:
     """Load SVG icon with custom color.
 
+    Rendered icons are cached per (name, color, size); the returned pixmap
+    is shared and must not be painted on.
+
     Args:
         name: Icon name (without .svg extension).
         color: Color to apply to stroke and fill.
@@ -105,23 +481,28 @@ def svg_icon(name: str, color: str, size: int = 22) -> QPixmap:
     Returns:
         QPixmap with the colored icon.
     """
-    path = ASSETS_DIR / f"{name}.svg"
-    if not path.exists():
+    if name not in _AVAILABLE_ICONS:
         pm = QPixmap(size, size)
         pm.fill(Qt.GlobalColor.transparent)
         return pm
+    return _render_svg_icon(name, color, size)
 
-    with open(path, "r", encoding="utf-8") as f:
-        svg = f.read()
 
-    svg = re.sub(
-        r'stroke=(["\'])(?!none\1).*?\1',
-        f"stroke=\\1{color}\\1",
-        svg,
-        flags=re.IGNORECASE,
-    )
-    svg = re.sub(
-        r'fill=(["\'])(?!none\1).*?\1', f"fill=\\1{color}\\1", svg, flags=re.IGNORECASE
+@functools.lru_cache(maxsize=512)
+def _render_svg_icon(name: str, color: str, size: int) -> QPixmap:
+    """Recolor and rasterize an existing SVG icon.
+
+    Args:
+        name: Icon name (without .svg extension).
+        color: Color to apply to stroke and fill.
+        size: Icon size in pixels.
+
+    Returns:
+        QPixmap with the colored icon.
+    """
+    svg = _ATTR_RE.sub(
+        lambda m: f"{m.group(1).lower()}={m.group(2)}{color}{m.group(2)}",
+        _read_svg(name) or "",
     )
 
     renderer = QSvgRenderer(svg.encode("utf-8"))
@@ -144,3 +525,78 @@ def card_shadow() -> QGraphicsDropShadowEffect:
     shadow.setOffset(0, 2)
     shadow.setColor(QColor(0, 0, 0, 15))
     return shadow
+
+
+# Painted equivalent of card_shadow(), drawn by the parent instead of an effect
+_SHADOW_BLUR = 20
+_SHADOW_OFFSET = 2
+# Slice size: the shadow fades across the blur radius on both sides of the edge
+_SHADOW_CORNER = 2 * _SHADOW_BLUR + Theme.R
+_SHADOW_TILE_CORE = 4
+
+
+@functools.lru_cache(maxsize=1)
+def _card_shadow_tile() -> QPixmap:
+    """Blur a rounded rect once to serve as a 9-slice shadow source.
+
+    Returns:
+        Shadow tile with _SHADOW_CORNER wide borders around a flat core.
+    """
+    size = 2 * _SHADOW_CORNER + _SHADOW_TILE_CORE
+    shape = QPixmap(size, size)
+    shape.fill(Qt.GlobalColor.transparent)
+    p = QPainter(shape)
+    p.setRenderHint(QPainter.RenderHint.Antialiasing)
+    p.setPen(Qt.PenStyle.NoPen)
+    p.setBrush(QColor(0, 0, 0, 15))
+    inner = size - 2 * _SHADOW_BLUR
+    p.drawRoundedRect(_SHADOW_BLUR, _SHADOW_BLUR, inner, inner, Theme.R, Theme.R)
+    p.end()
+
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(shape)
+    blur = QGraphicsBlurEffect()
+    blur.setBlurRadius(_SHADOW_BLUR)
+    item.setGraphicsEffect(blur)
+    scene.addItem(item)
+
+    tile = QPixmap(size, size)
+    tile.fill(Qt.GlobalColor.transparent)
+    p = QPainter(tile)
+    scene.render(p, QRectF(0, 0, size, size), QRectF(0, 0, size, size))
+    p.end()
+    return tile
+
+
+def paint_card_shadow(p: QPainter, rect: QRect) -> None:
+    """Paint the cached card shadow behind a widget rectangle.
+
+    Args:
+        p: Painter of the widget that hosts the card.
+        rect: Card geometry in the painter's coordinates.
+    """
+    tile = _card_shadow_tile()
+    corner = _SHADOW_CORNER
+    target = rect.adjusted(
+        -_SHADOW_BLUR, -_SHADOW_BLUR, _SHADOW_BLUR, _SHADOW_BLUR
+    ).translated(0, _SHADOW_OFFSET)
+    if target.width() < 2 * corner or target.height() < 2 * corner:
+        p.drawPixmap(target, tile)
+        return
+
+    tw, th = tile.width(), tile.height()
+    xs = (target.left(), target.left() + corner, target.right() + 1 - corner)
+    ys = (target.top(), target.top() + corner, target.bottom() + 1 - corner)
+    ws = (corner, target.width() - 2 * corner, corner)
+    hs = (corner, target.height() - 2 * corner, corner)
+    sxs = (0, corner, tw - corner)
+    sys_ = (0, corner, th - corner)
+    sws = (corner, tw - 2 * corner, corner)
+    shs = (corner, th - 2 * corner, corner)
+    for i in range(3):
+        for j in range(3):
+            p.drawPixmap(
+                QRect(xs[i], ys[j], ws[i], hs[j]),
+                tile,
+                QRect(sxs[i], sys_[j], sws[i], shs[j]),
+            )
@@ -17,6 +17,8 @@ from sok.ui.workers.search_worker import SearchWorker
 from sok.ui.workers.details_worker import DetailsWorker
 from sok.ui.workers.organize_worker import OrganizeWorker
 from sok.ui.workers.folder_worker import CreateFoldersWorker
+from sok.ui.workers.scan_worker import ScanSourcesWorker
+from sok.ui.workers.names_worker import ComputeNamesWorker
 from sok.ui.workers.movie_batch_worker import (
     MovieBatchSearchWorker,
     MovieBatchOrganizeWorker,
@@ -28,6 +30,8 @@ __all__ = [
     "DetailsWorker",
     "OrganizeWorker",
     "CreateFoldersWorker",
+    "ScanSourcesWorker",
+    "ComputeNamesWorker",
     "MovieBatchSearchWorker",
     "MovieBatchOrganizeWorker",
 ]
@@ -14,25 +14,92 @@ Base Worker definitions for S.O.K
 
 import asyncio
 import logging
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import Any, Coroutine, Optional, TypeVar
 from PySide6.QtCore import QObject, Signal
 from sok.config.config_manager import ConfigManager, get_config_manager
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=16)
+def to_api_lang(lang: str) -> str:
+    """Turn an interface language into the tag sent to media APIs.
+
+    Args:
+        lang: Language code from the configuration (e.g. 'fr').
+
+    Returns:
+        Region-qualified tag for two-letter codes (e.g. 'fr-FR'), else lang.
+    """
+    return f"{lang}-{lang.upper()}" if len(lang) == 2 else lang
+
+
+class AsyncioService:
+    """Event loop shared by every worker, run on a daemon thread.
+
+    API clients bind their aiohttp session to the loop that created it,
+    so running all requests on one long-lived loop keeps connections
+    alive across workers instead of reopening them for each search.
+
+    Attributes:
+        loop: Event loop running forever on the service thread.
+    """
+
+    def __init__(self) -> None:
+        """Start the loop on a new daemon thread."""
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="sok-asyncio", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the shared loop and wait for its result.
+
+        Must be called from a thread other than the service thread.
+
+        Args:
+            coro: Coroutine to schedule.
+
+        Returns:
+            The coroutine result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+_service: Optional[AsyncioService] = None
+_service_lock = threading.Lock()
+
+
+def get_asyncio_service() -> AsyncioService:
+    """Get the shared asyncio service, starting it on first use.
+
+    Returns:
+        Singleton AsyncioService.
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = AsyncioService()
+        return _service
+
 
 class BaseWorker(QObject):
     """Abstract base worker for async operations in QThread.
 
-    Manages asyncio event loop lifecycle and provides error handling.
-    Subclasses must implement the execute() method.
+    Async operations run on the shared AsyncioService loop while the
+    worker thread waits for them, and errors are reported through a
+    signal. Subclasses must implement the execute() method.
 
     Signals:
         error (str): Emitted when execution fails.
 
     Attributes:
         _config: Application configuration manager.
-        _loop: Asyncio event loop for the worker thread.
     """
 
     error = Signal(str)
@@ -45,30 +112,33 @@ class BaseWorker(QObject):
         """
         super().__init__()
         self._config = config or get_config_manager()
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
-    def run(self):
-        """Execute the worker in a new event loop.
+    def run(self) -> None:
+        """Execute the worker.
 
-        Creates an async event loop, runs execute(), and ensures cleanup.
         Emits error signal on failure.
         """
         try:
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-
-            try:
-                self.execute()
-            finally:
-                self._loop.close()
+            self.execute()
         except (asyncio.CancelledError, RuntimeError, OSError) as exc:
             logger.exception("Worker execution failed", exc_info=exc)
             self.error.emit(str(exc))
 
-    def execute(self):
+    def _run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the shared loop, blocking the worker thread.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            The coroutine result.
+        """
+        return get_asyncio_service().run(coro)
+
+    def execute(self) -> None:
         """Execute worker logic (must be implemented by subclasses).
 
-        Use self._loop.run_until_complete() for async operations.
+        Use self._run_async() for async operations.
 
         Raises:
             NotImplementedError: If not overridden by subclass.
@@ -12,15 +12,23 @@
 Details Worker for fetching deep media metadata.
 """
 
+import asyncio
 import logging
 from PySide6.QtCore import Signal
-from sok.ui.workers.base import BaseWorker
+from sok.ui.workers.base import BaseWorker, to_api_lang
 from sok.core.interfaces import ContentType, MediaType
-from sok.core.media_manager import get_media_manager
+from sok.core.media_manager import (
+    cache_details,
+    get_cached_details,
+    get_media_manager,
+)
 from sok.core.exceptions import APIError
 
 logger = logging.getLogger(__name__)
 
+# Season episode lists requested at once, to stay within API rate limits
+_EPISODE_FETCH_CONCURRENCY = 4
+
 
 class DetailsWorker(BaseWorker):
     """Worker for fetching detailed media metadata.
@@ -65,20 +73,22 @@ class DetailsWorker(BaseWorker):
         self._type_str = content_type
         self._fetch_episodes = fetch_episodes
         self._manager = get_media_manager()
+        self._api_lang = to_api_lang(self._config.get("language", "en"))
 
     def execute(self):
         """Execute details fetch operation.
 
         Runs async fetch and emits result via finished signal.
         """
-        if not self._loop:
-            return
-        details = self._loop.run_until_complete(self._get_details())
+        details = self._run_async(self._get_details())
         self.finished.emit(details)
 
     async def _get_details(self) -> dict:
         """Fetch detailed media metadata.
 
+        Results are cached per (id, type, language, episodes); a cached
+        response with episodes also serves a request without them.
+
         Returns:
             Metadata dictionary with optional episodes.
 
@@ -86,13 +96,18 @@ class DetailsWorker(BaseWorker):
             APIError: If fetch request fails.
         """
         content_type = self.TYPE_MAP.get(self._type_str, ContentType.MOVIE)
+        with_episodes = self._fetch_episodes and self._type_str == "tv"
+        key = (self._media_id, content_type, self._api_lang, with_episodes)
 
-        lang = self._config.get("language", "en")
-        api_lang = f"{lang}-{lang.upper()}" if len(lang) == 2 else lang
+        cached = get_cached_details(key)
+        if cached is None and not with_episodes:
+            cached = get_cached_details(key[:-1] + (True,))
+        if cached is not None:
+            return cached
 
         try:
             details = await self._manager.get_details(
-                self._media_id, content_type, language=api_lang
+                self._media_id, content_type, language=self._api_lang
             )
         except APIError as exc:
             logger.error(
@@ -103,14 +118,18 @@ class DetailsWorker(BaseWorker):
             )
             raise
 
-        if self._fetch_episodes and self._type_str == "tv":
+        if with_episodes:
             details["episodes"] = await self._fetch_all_episodes(details)
 
+        cache_details(key, details)
         return details
 
     async def _fetch_all_episodes(self, details: dict) -> dict:
         """Fetch episode information for all seasons.
 
+        Seasons are requested concurrently, at most
+        _EPISODE_FETCH_CONCURRENCY at a time; a failed season is skipped.
+
         Args:
             details: Series details containing season count.
 
@@ -127,15 +146,32 @@ class DetailsWorker(BaseWorker):
             )
             return episodes
 
-        for season_num in range(1, num_seasons + 1):
+        semaphore = asyncio.Semaphore(_EPISODE_FETCH_CONCURRENCY)
+
+        async def fetch_season(season_num: int) -> list:
+            async with semaphore:
+                return await api.get_tv_episodes(  # type: ignore[attr-defined]
+                    self._media_id, season_num, self._api_lang
+                )
+
+        season_nums = range(1, num_seasons + 1)
+        add_episodes = episodes.update
+        results = await asyncio.gather(
+            *(fetch_season(season_num) for season_num in season_nums),
+            return_exceptions=True,
+        )
+
+        for season_num, season_episodes in zip(season_nums, results):
             try:
-                season_episodes = await api.get_tv_episodes(
-                    self._media_id, season_num, "fr-FR"
-                )  # type: ignore[attr-defined]
-                for ep in season_episodes:
-                    s_str = str(ep.get("season_number", season_num)).zfill(2)
-                    e_str = str(ep.get("episode_number", 0)).zfill(2)
-                    episodes[f"S{s_str}E{e_str}"] = ep.get("name", "")
+                if isinstance(season_episodes, BaseException):
+                    raise season_episodes
+                add_episodes(
+                    {
+                        f"S{int(ep.get('season_number', season_num)):02d}"
+                        f"E{int(ep.get('episode_number', 0)):02d}": ep.get("name", "")
+                        for ep in season_episodes
+                    }
+                )
             except (APIError, ValueError, KeyError, TypeError) as exc:
                 logger.warning(
                     "Episode fetch failed for %s season %s",
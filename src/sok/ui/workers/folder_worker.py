@@ -12,14 +12,18 @@
 Folder Creation Worker for structural organization.
 """
 
-import os
 import logging
+from functools import lru_cache
+from pathlib import Path
 from PySide6.QtCore import Signal
 from sok.ui.workers.base import BaseWorker
 from sok.core.utils import format_name
 
 logger = logging.getLogger(__name__)
 
+# format_name is pure; series and season labels repeat across runs
+_format_name = lru_cache(maxsize=1024)(format_name)
+
 
 class CreateFoldersWorker(BaseWorker):
     """Worker for creating directory structures.
@@ -34,7 +38,9 @@ class CreateFoldersWorker(BaseWorker):
     progress = Signal(int, str)
     finished = Signal(dict)
 
-    def __init__(self, dest_path: str, series_title: str, seasons: dict, config=None):
+    def __init__(
+        self, dest_path: str | Path, series_title: str, seasons: dict, config=None
+    ):
         """Initialize the folder creation worker.
 
         Args:
@@ -44,34 +50,44 @@ class CreateFoldersWorker(BaseWorker):
             config: Configuration manager (uses default if None).
         """
         super().__init__(config)
-        self._dest_path = dest_path
+        self._dest_path = Path(dest_path)
         self._series_title = series_title
         self._seasons = seasons
 
     def execute(self):
         """Execute folder creation.
 
-        Creates series folder and season subfolders.
+        Creates series folder and season subfolders. A folder that already
+        exists is detected from the mkdir error rather than checked first,
+        and progress is reported about every 2% rather than per folder.
         """
         total = len(self._seasons) + 1
         created, errors = [], []
 
         self.progress.emit(0, f"Creating folder: {self._series_title}")
-        series_path = os.path.join(self._dest_path, format_name(self._series_title))
+        series_path = self._dest_path / _format_name(self._series_title)
 
-        if not os.path.exists(series_path):
-            os.makedirs(series_path, exist_ok=True)
+        try:
+            series_path.mkdir(parents=True)
             created.append(series_path)
+        except FileExistsError:
+            pass
+
+        folders = [
+            (season_name, series_path / _format_name(season_name))
+            for season_name in self._seasons
+        ]
+        step = max(1, total // 50)
+        for idx, (season_name, season_path) in enumerate(folders, start=1):
+            if idx % step == 0 or idx == len(folders):
+                percent = int((idx / total) * 100)
+                self.progress.emit(percent, f"Creating: {season_name}")
 
-        for idx, (season_name, season_num) in enumerate(self._seasons.items(), start=1):
-            percent = int((idx / total) * 100)
-            self.progress.emit(percent, f"Creating: {season_name}")
-
-            season_path = os.path.join(series_path, format_name(season_name))
             try:
-                if not os.path.exists(season_path):
-                    os.makedirs(season_path, exist_ok=True)
-                    created.append(season_path)
+                season_path.mkdir()
+                created.append(season_path)
+            except FileExistsError:
+                pass
             except OSError as exc:
                 logger.exception(
                     "Failed to create season folder %s", season_path, exc_info=exc
@@ -84,6 +100,6 @@ class CreateFoldersWorker(BaseWorker):
                 "total": total,
                 "created": len(created),
                 "errors": errors,
-                "series_path": series_path,
+                "series_path": str(series_path),
             }
         )
@@ -18,10 +18,10 @@ from typing import Any, Dict, List, Tuple
 from PySide6.QtCore import Signal
 
 from sok.core.interfaces import ContentType, MediaType
-from sok.core.media_manager import get_media_manager
+from sok.core.media_manager import SEARCH_TIMEOUT, get_media_manager
 from sok.core.exceptions import APIError, APINotFoundError, UnsupportedMediaTypeError
 from sok.file_operations.video_operations import VideoFileOperations
-from sok.ui.workers.base import BaseWorker
+from sok.ui.workers.base import BaseWorker, to_api_lang
 
 logger = logging.getLogger(__name__)
 
@@ -34,11 +34,13 @@ class MovieBatchSearchWorker(BaseWorker):
 
     Signals:
         progress (int, str): Percent complete and current filename.
+        partial (dict): One per-file result, emitted as soon as it is found.
         finished (list): List of per-file result dicts with keys:
             file (Path), query (str), year (int|None), candidates (list[dict]).
     """
 
     progress = Signal(int, str)
+    partial = Signal(dict)
     finished = Signal(list)
 
     def __init__(self, files: List[Path], config=None):
@@ -55,9 +57,7 @@ class MovieBatchSearchWorker(BaseWorker):
 
     def execute(self):
         """Run the async batch search."""
-        if not self._loop:
-            return
-        results = self._loop.run_until_complete(self._search_all())
+        results = self._run_async(self._search_all())
         self.finished.emit(results)
 
     async def _search_all(self) -> List[Dict[str, Any]]:
@@ -68,8 +68,7 @@ class MovieBatchSearchWorker(BaseWorker):
             logger.error("No video API configured", exc_info=exc)
             raise RuntimeError("No API configured for video.") from exc
 
-        lang = self._config.get("language", "en")
-        api_lang = f"{lang}-{lang.upper()}" if len(lang) == 2 else lang
+        api_lang = to_api_lang(self._config.get("language", "en"))
 
         semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
         total = len(self._files)
@@ -83,6 +82,7 @@ class MovieBatchSearchWorker(BaseWorker):
             async with lock:
                 done += 1
                 pct = int((done / total) * 100) if total else 100
+                self.partial.emit(result)
                 self.progress.emit(pct, file.name)
             return result
 
@@ -98,7 +98,11 @@ class MovieBatchSearchWorker(BaseWorker):
         candidates: List[Dict[str, Any]] = []
         try:
             result = await self._manager.search(
-                title, ContentType.MOVIE, language=api_lang
+                title,
+                ContentType.MOVIE,
+                timeout=self._config.get("search_timeout", SEARCH_TIMEOUT),
+                language=api_lang,
+                max_results=MAX_CANDIDATES_PER_FILE,
             )
             raw = (
                 result.get("results", []) if isinstance(result, dict) else result or []
@@ -0,0 +1,65 @@
+# ===----------------------------------------------------------------------=== #
+#
+# This source file is part of the S.O.K open source project
+#
+# Copyright (c) 2026 S.O.K Team
+# Licensed under the MIT License
+#
+# See LICENSE for license information
+#
+# ===----------------------------------------------------------------------=== #
+"""
+Preview Names Worker for the organize pages.
+"""
+
+from pathlib import Path
+from typing import Iterable
+
+from PySide6.QtCore import Signal
+from sok.ui.workers.base import BaseWorker
+
+
+class ComputeNamesWorker(BaseWorker):
+    """Worker for computing new file names for preview rows.
+
+    stop() ends the pass at the next file.
+
+    Signals:
+        finished (int, dict): Pass token and mapping of file path to
+            generated new name. Not emitted when the pass was stopped.
+    """
+
+    finished = Signal(int, object)
+
+    def __init__(
+        self, files: Iterable[Path], media_item, ops, token: int = 0, config=None
+    ):
+        """Initialize the names worker.
+
+        Args:
+            files: Files to compute names for.
+            media_item: MediaItem describing the selected media.
+            ops: File operations handler with generate_new_filename.
+            token: Identifies this pass in the finished signal.
+            config: Configuration manager (uses default if None).
+        """
+        super().__init__(config)
+        self._files = list(files)
+        self._media_item = media_item
+        self._ops = ops
+        self._token = token
+        self._stopped = False
+
+    def stop(self):
+        """Request the pass to stop; called from the UI thread."""
+        self._stopped = True
+
+    def execute(self):
+        """Execute name generation and emit the results."""
+        generate = self._ops.generate_new_filename
+        names = {}
+        for file in self._files:
+            if self._stopped:
+                return
+            names[file] = generate(self._media_item, file.name)
+        self.finished.emit(self._token, names)
@@ -12,23 +12,29 @@
 Organize Worker for file moving and renaming.
 """
 
+import time
 from pathlib import Path
 from typing import List
 from PySide6.QtCore import Signal
 from sok.ui.workers.base import BaseWorker
 
+# Minimum seconds between two progress ticks
+_PROGRESS_INTERVAL = 0.033
+
 
 class OrganizeWorker(BaseWorker):
     """Worker for file organization operations.
 
-    Moves and renames files in a background thread.
+    Moves and renames files in a background thread. Progress is not sent
+    per file: the worker keeps only the latest state and emits a tick at
+    most every _PROGRESS_INTERVAL; the GUI reads latest_progress() on tick.
 
     Signals:
-        progress (int, str): Percent complete and status message.
+        progress_tick: A newer state is available from latest_progress().
         finished (dict): Final report with total, success, errors.
     """
 
-    progress = Signal(int, str)
+    progress_tick = Signal()
     finished = Signal(dict)
 
     def __init__(
@@ -48,6 +54,33 @@ class OrganizeWorker(BaseWorker):
         self._dest = dest
         self._media_item = media_item
         self._ops = ops
+        self._latest: tuple[int, str] | None = None
+        self._last_emit_ts = 0.0
+
+    def latest_progress(self) -> tuple[int, str] | None:
+        """Get the most recent progress state.
+
+        Safe to call from the GUI thread: the state is replaced as a whole
+        tuple, never mutated.
+
+        Returns:
+            (percent, message) tuple, or None before the first update.
+        """
+        return self._latest
+
+    def _publish(self, percent: int, message: str, force: bool = False):
+        """Record a progress state and tick if the interval has elapsed.
+
+        Args:
+            percent: Progress percentage (0-100).
+            message: Status message.
+            force: Tick even if the last tick was less than an interval ago.
+        """
+        self._latest = (percent, message)
+        now = time.monotonic()
+        if force or now - self._last_emit_ts >= _PROGRESS_INTERVAL:
+            self._last_emit_ts = now
+            self.progress_tick.emit()
 
     def _on_progress(self, current: int, total: int, filename: str):
         """Handle progress updates from file operations.
@@ -59,7 +92,9 @@ class OrganizeWorker(BaseWorker):
         """
         if total > 0:
             percent = int((current / total) * 100)
-            self.progress.emit(percent, f"({current}/{total}) {filename}")
+            self._publish(
+                percent, f"({current}/{total}) {filename}", force=current >= total
+            )
 
     def execute(self):
         """Execute file organization.
@@ -70,7 +105,7 @@ class OrganizeWorker(BaseWorker):
             self.finished.emit({"total": 0, "success": 0, "errors": []})
             return
 
-        self.progress.emit(0, "Analyzing files...")
+        self._publish(0, "Analyzing files...", force=True)
 
         report = self._ops.organize_files_list(
             files=self._files,
@@ -80,7 +115,7 @@ class OrganizeWorker(BaseWorker):
             progress_callback=self._on_progress,
         )
 
-        self.progress.emit(100, "Done!")
+        self._publish(100, "Done!", force=True)
         self.finished.emit(
             {
                 "total": report.get("total_files", 0),
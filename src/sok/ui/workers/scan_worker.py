@@ -0,0 +1,59 @@
+# ===----------------------------------------------------------------------=== #
+#
+# This source file is part of the S.O.K open source project
+#
+# Copyright (c) 2026 S.O.K Team
+# Licensed under the MIT License
+#
+# See LICENSE for license information
+#
+# ===----------------------------------------------------------------------=== #
+"""
+Source Scanning Worker for the organize pages.
+"""
+
+from pathlib import Path
+from typing import Iterable
+
+from PySide6.QtCore import Signal
+from sok.ui.workers.base import BaseWorker
+from sok.ui.controllers.source_scanner import scan_sources
+
+
+class ScanSourcesWorker(BaseWorker):
+    """Worker for listing media files in source folders.
+
+    Walks the selected folders off the UI thread so large trees do not
+    freeze the page. stop() ends the walk at the next directory.
+
+    Signals:
+        finished (int, list): Scan token and matching file paths, in
+            discovery order. Not emitted when the scan was stopped.
+    """
+
+    finished = Signal(int, list)
+
+    def __init__(self, ops, paths: Iterable[Path], token: int = 0, config=None):
+        """Initialize the scan worker.
+
+        Args:
+            ops: File operations handler for the media type.
+            paths: Source folder paths to scan.
+            token: Identifies this scan in the finished signal.
+            config: Configuration manager (uses default if None).
+        """
+        super().__init__(config)
+        self._ops = ops
+        self._paths = list(paths)
+        self._token = token
+        self._stopped = False
+
+    def stop(self):
+        """Request the scan to stop; called from the UI thread."""
+        self._stopped = True
+
+    def execute(self):
+        """Execute the scan and emit the files found."""
+        files = scan_sources(self._ops, self._paths, lambda: self._stopped)
+        if not self._stopped:
+            self.finished.emit(self._token, files)
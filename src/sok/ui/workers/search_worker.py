@@ -12,52 +12,112 @@
 Search Worker for multi-API media lookup.
 """
 
-from typing import List, Any
+from concurrent.futures import Future
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Any, Optional, Tuple
+import asyncio
 import logging
+import threading
 from PySide6.QtCore import Signal
 
-from sok.ui.workers.base import BaseWorker
+from sok.config.config_manager import ConfigManager
+from sok.ui.workers.base import BaseWorker, to_api_lang
 from sok.core.interfaces import ContentType, MediaType
-from sok.core.media_manager import get_media_manager
+from sok.core.media_manager import (
+    SEARCH_TIMEOUT,
+    get_media_manager,
+    get_search_cache,
+)
 from sok.core.exceptions import UnsupportedMediaTypeError, APINotFoundError, APIError
 
 logger = logging.getLogger(__name__)
 
+# Results requested from the API and shown to the user
+MAX_RESULTS = 10
+
+
+def _copy_results(results: List[Any]) -> List[Any]:
+    """Copy cached results so the UI can enrich them without touching the cache.
+
+    Args:
+        results: Result list as stored in the search cache.
+
+    Returns:
+        New list holding a shallow copy of every dict result.
+    """
+    return [dict(item) if isinstance(item, dict) else item for item in results]
+
+
+def _unique_results(results: List[Any]) -> List[Any]:
+    """Drop results whose id was already seen, keeping the API ranking.
+
+    Args:
+        results: Search results in API order.
+
+    Returns:
+        Results with the first occurrence of each id.
+    """
+    seen = set()
+    unique = []
+    for item in results:
+        item_id = item.get("id") if isinstance(item, dict) else None
+        if item_id is not None:
+            if item_id in seen:
+                continue
+            seen.add(item_id)
+        unique.append(item)
+    return unique
+
 
 class SearchWorker(BaseWorker):
     """Worker for searching media across different APIs.
 
-    Performs async media searches in a background thread.
+    Performs async media searches in a background thread. Results are
+    cached per (query, content type, language, API) in memory and on disk,
+    and identical searches running at the same time share one request.
 
     Signals:
         finished (list): Emitted with search results on completion.
 
     Attributes:
-        TYPE_MAP: Content type string to enum mapping.
-        MEDIA_TYPE_MAP: Media type string to enum mapping.
+        TYPE_MAP: Content type string to enum mapping (read-only).
+        MEDIA_TYPE_MAP: Media type string to enum mapping (read-only).
     """
 
     finished = Signal(list)
 
-    TYPE_MAP = {
-        "tv": ContentType.TV_SERIES,
-        "movie": ContentType.MOVIE,
-        "artist": ContentType.ARTIST,
-        "album": ContentType.ALBUM,
-        "book": ContentType.BOOK,
-        "game": ContentType.GAME,
-    }
-
-    MEDIA_TYPE_MAP = {
-        "tv": MediaType.VIDEO,
-        "movie": MediaType.VIDEO,
-        "artist": MediaType.MUSIC,
-        "album": MediaType.MUSIC,
-        "book": MediaType.BOOK,
-        "game": MediaType.GAME,
-    }
-
-    def __init__(self, query: str, content_type: str = "tv", config=None):
+    TYPE_MAP = MappingProxyType(
+        {
+            "tv": ContentType.TV_SERIES,
+            "movie": ContentType.MOVIE,
+            "artist": ContentType.ARTIST,
+            "album": ContentType.ALBUM,
+            "book": ContentType.BOOK,
+            "game": ContentType.GAME,
+        }
+    )
+
+    MEDIA_TYPE_MAP = MappingProxyType(
+        {
+            "tv": MediaType.VIDEO,
+            "movie": MediaType.VIDEO,
+            "artist": MediaType.MUSIC,
+            "album": MediaType.MUSIC,
+            "book": MediaType.BOOK,
+            "game": MediaType.GAME,
+        }
+    )
+
+    # Searches running on any worker thread, keyed like the search cache
+    _inflight: ClassVar[Dict[Tuple[str, ...], Future]] = {}
+    _inflight_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        query: str,
+        content_type: str = "tv",
+        config: Optional[ConfigManager] = None,
+    ):
         """Initialize the search worker.
 
         Args:
@@ -67,17 +127,27 @@ class SearchWorker(BaseWorker):
         """
         super().__init__(config)
         self._query = query
-        self._type_str = content_type
+        self._content_type = self.TYPE_MAP.get(content_type, ContentType.MOVIE)
+        self._media_type = self.MEDIA_TYPE_MAP.get(content_type, MediaType.VIDEO)
         self._manager = get_media_manager()
+        self._api_lang = to_api_lang(self._config.get("language", "en"))
+        self._timeout = self._config.get("search_timeout", SEARCH_TIMEOUT)
 
-    def execute(self):
+    @staticmethod
+    def invalidate(query: str) -> None:
+        """Forget cached results for a query so the next search refetches.
+
+        Args:
+            query: Search query string.
+        """
+        get_search_cache().invalidate(query)
+
+    def execute(self) -> None:
         """Execute the search operation.
 
         Runs async search and emits results via finished signal.
         """
-        if not self._loop:
-            return
-        results = self._loop.run_until_complete(self._search())
+        results = self._run_async(self._search())
         self.finished.emit(results)
 
     async def _search(self) -> List[Any]:
@@ -90,8 +160,8 @@ class SearchWorker(BaseWorker):
             RuntimeError: If no API is configured.
             APIError: If search request fails.
         """
-        content_type = self.TYPE_MAP.get(self._type_str, ContentType.MOVIE)
-        media_type = self.MEDIA_TYPE_MAP.get(self._type_str, MediaType.VIDEO)
+        content_type = self._content_type
+        media_type = self._media_type
 
         try:
             self._manager.get_current_api(media_type)
@@ -99,22 +169,69 @@ class SearchWorker(BaseWorker):
             logger.error("No API configured for %s", media_type.value, exc_info=exc)
             raise RuntimeError(f"No API configured for {media_type.value}.") from exc
 
-        lang = self._config.get("language", "en")
-        api_lang = f"{lang}-{lang.upper()}" if len(lang) == 2 else lang
+        cache = get_search_cache()
+        key = (
+            self._query,
+            content_type.value,
+            self._api_lang,
+            self._manager.current_apis.get(media_type, ""),
+        )
+        cached = await cache.aget(key)
+        if cached is not None:
+            return _copy_results(cached)
+
+        # Identical searches share a thread-safe future, so waiting on it
+        # works from the shared loop or any other
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                owned = self._inflight[key] = Future()
+        if pending is not None:
+            return _copy_results(await asyncio.wrap_future(pending))
 
+        try:
+            results = await self._fetch(content_type)
+            await cache.aset(key, results)
+            owned.set_result(results)
+        except BaseException as exc:
+            owned.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        return _copy_results(results)
+
+    async def _fetch(self, content_type: ContentType) -> List[Any]:
+        """Query the current API for the search results.
+
+        Args:
+            content_type: Content type to search for.
+
+        Returns:
+            List of unique search results (max 10).
+
+        Raises:
+            APIError: If search request fails or exceeds the search timeout.
+        """
         try:
             result = await self._manager.search(
-                self._query, content_type, language=api_lang
+                self._query,
+                content_type,
+                timeout=self._timeout,
+                language=self._api_lang,
+                max_results=MAX_RESULTS,
             )
         except APIError as exc:
+            # The manager already logged the traceback; formatting it a
+            # second time would only slow down the failure path
             logger.error(
-                "Search failed for query '%s' (%s)",
+                "Search failed for query '%s' (%s): %s",
                 self._query,
                 content_type.value,
-                exc_info=exc,
+                exc,
             )
             raise
 
         if isinstance(result, dict):
-            return result.get("results", [])[:10]
-        return result[:10] if isinstance(result, list) else []
+            result = result.get("results", [])
+        return _unique_results(result)[:MAX_RESULTS] if isinstance(result, list) else []
@@ -10,7 +10,6 @@
 # ===----------------------------------------------------------------------=== #
 import os
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 
 from sok.core.media_manager import UniversalMediaManager
 from sok.core.interfaces import ContentType, MediaType
@@ -20,7 +19,7 @@ from sok.file_operations.base_operations import BaseFileOperations
 
 class TestAcceptanceMusicAndBookOrganization:
     @pytest.mark.asyncio
-    async def test_organize_music_track(self, tmp_path):
+    async def test_organize_music_track(self, tmp_path, make_fake_api):
         """Acceptance flow: search track metadata then rename with artist-title."""
         workspace = tmp_path / "music"
         workspace.mkdir()
@@ -30,10 +29,6 @@ class TestAcceptanceMusicAndBookOrganization:
 
         manager = UniversalMediaManager(load_defaults=False)
 
-        mock_api = MagicMock()
-        mock_api.supported_media_types = [MediaType.MUSIC]
-        mock_api.supported_content_types = [ContentType.TRACK]
-
         mock_search_result = {
             "results": [
                 {
@@ -44,7 +39,6 @@ class TestAcceptanceMusicAndBookOrganization:
                 }
             ]
         }
-        mock_api.search = AsyncMock(return_value=mock_search_result)
 
         mock_details = {
             "id": "track1",
@@ -52,7 +46,12 @@ class TestAcceptanceMusicAndBookOrganization:
             "artist": "Queen",
             "release_date": "1975-10-31",
         }
-        mock_api.get_details = AsyncMock(return_value=mock_details)
+        mock_api = make_fake_api(
+            [MediaType.MUSIC],
+            [ContentType.TRACK],
+            search_result=mock_search_result,
+            details=mock_details,
+        )
 
         manager.register_api("music_mock", mock_api)
         manager.set_current_api_for_media_type(MediaType.MUSIC, "music_mock")
@@ -64,6 +63,10 @@ class TestAcceptanceMusicAndBookOrganization:
         assert track["artist"] == "Queen"
 
         details = await manager.get_details(track["id"], ContentType.TRACK)
+        assert mock_api.calls == [
+            ("search", "bohemian", ContentType.TRACK),
+            ("get_details", "track1", ContentType.TRACK),
+        ]
         ext = os.path.splitext(filename)[1]
         new_name = f"{details['artist']} - {details['title']}{ext}"
         new_path = workspace / new_name
@@ -76,7 +79,7 @@ class TestAcceptanceMusicAndBookOrganization:
         assert new_path.name == "Queen - Bohemian Rhapsody.mp3"
 
     @pytest.mark.asyncio
-    async def test_organize_book_workflow(self, tmp_path):
+    async def test_organize_book_workflow(self, tmp_path, make_fake_api):
         """Acceptance flow: search book metadata then rename with title-author-year."""
         workspace = tmp_path / "books"
         workspace.mkdir()
@@ -86,10 +89,6 @@ class TestAcceptanceMusicAndBookOrganization:
 
         manager = UniversalMediaManager(load_defaults=False)
 
-        mock_api = MagicMock()
-        mock_api.supported_media_types = [MediaType.BOOK]
-        mock_api.supported_content_types = [ContentType.BOOK]
-
         mock_search_result = {
             "results": [
                 {
@@ -100,7 +99,6 @@ class TestAcceptanceMusicAndBookOrganization:
                 }
             ]
         }
-        mock_api.search = AsyncMock(return_value=mock_search_result)
 
         mock_details = {
             "id": "book1",
@@ -108,7 +106,12 @@ class TestAcceptanceMusicAndBookOrganization:
             "authors": ["Andrew Hunt", "David Thomas"],
             "published_date": "1999",
         }
-        mock_api.get_details = AsyncMock(return_value=mock_details)
+        mock_api = make_fake_api(
+            [MediaType.BOOK],
+            [ContentType.BOOK],
+            search_result=mock_search_result,
+            details=mock_details,
+        )
 
         manager.register_api("books_mock", mock_api)
         manager.set_current_api_for_media_type(MediaType.BOOK, "books_mock")
@@ -10,7 +10,6 @@
 # ===----------------------------------------------------------------------=== #
 import pytest
 import os
-from unittest.mock import AsyncMock, MagicMock
 from sok.core.media_manager import UniversalMediaManager
 from sok.core.interfaces import ContentType, MediaType
 from sok.file_operations.base_operations import BaseFileOperations
@@ -18,7 +17,7 @@ from sok.file_operations.base_operations import BaseFileOperations
 
 class TestAcceptanceVideoOrganization:
     @pytest.mark.asyncio
-    async def test_organize_movie_workflow(self, tmp_path):
+    async def test_organize_movie_workflow(self, tmp_path, make_fake_api):
         """
         Scenario: User organizes a movie file.
         1. Setup: A messy file exists.
@@ -37,21 +36,20 @@ class TestAcceptanceVideoOrganization:
         # Initialize Core Logic
         manager = UniversalMediaManager()
 
-        # Mock the TMDB API
-        mock_api = MagicMock()
-        mock_api.supported_media_types = [MediaType.VIDEO]
-
         # Mock Search Result
         mock_search_result = {
             "results": [
                 {"id": 603, "title": "The Matrix", "release_date": "1999-03-30"}
             ]
         }
-        mock_api.search = AsyncMock(return_value=mock_search_result)
 
         # Mock Details Result
         mock_details = {"id": 603, "title": "The Matrix", "release_date": "1999-03-30"}
-        mock_api.get_details = AsyncMock(return_value=mock_details)
+
+        # Mock the TMDB API
+        mock_api = make_fake_api(
+            [MediaType.VIDEO], search_result=mock_search_result, details=mock_details
+        )
 
         # Register API
         manager.register_api("tmdb_mock", mock_api)
@@ -65,6 +63,7 @@ class TestAcceptanceVideoOrganization:
         assert len(results["results"]) > 0
         selected_movie = results["results"][0]
         assert selected_movie["title"] == "The Matrix"
+        assert mock_api.calls == [("search", "matrix", ContentType.MOVIE)]
 
         # 3. User Action: Generate New Name and Rename
         # Logic: Title + (Year) + Extension
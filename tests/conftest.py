@@ -0,0 +1,58 @@
+# ===----------------------------------------------------------------------=== #
+#
+# This source file is part of the S.O.K open source project
+#
+# Copyright (c) 2026 S.O.K Team
+# Licensed under the MIT License
+#
+# See LICENSE for license information
+#
+# ===----------------------------------------------------------------------=== #
+"""
+Fixtures partagées par toutes les suites de tests.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pytest
+
+from sok.core.interfaces import ContentType, MediaType
+
+
+class FakeAPI:
+    """MediaAPI stand-in returning canned responses.
+
+    Plain async methods are much cheaper to await than AsyncMock, and
+    every call is recorded in `calls` for assertions.
+    """
+
+    def __init__(
+        self,
+        media_types: Iterable[MediaType],
+        content_types: Iterable[ContentType] = (),
+        search_result: Optional[Dict[str, Any]] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        self.supported_media_types = list(media_types)
+        self.supported_content_types = list(content_types)
+        self.calls: List[Tuple[str, str, ContentType]] = []
+        self._search_result = search_result or {"results": []}
+        self._details = details or {}
+
+    async def search(
+        self, query: str, content_type: ContentType, **_kwargs: Any
+    ) -> Dict[str, Any]:
+        self.calls.append(("search", query, content_type))
+        return self._search_result
+
+    async def get_details(
+        self, item_id: str, content_type: ContentType, **_kwargs: Any
+    ) -> Dict[str, Any]:
+        self.calls.append(("get_details", item_id, content_type))
+        return self._details
+
+
+@pytest.fixture
+def make_fake_api():
+    """Factory building FakeAPI instances."""
+    return FakeAPI
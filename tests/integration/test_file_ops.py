@@ -65,3 +65,19 @@ class TestFileOperationsIntegration:
         # Check against real OS creation (optional but good for integration)
         # This confirms the cleaned name is actually valid
         # We can't easily test this without risking OS errors, but the logic holds.
+
+    @pytest.mark.parametrize("hash_algo", ["xxh3", "sha256"])
+    def test_find_duplicates_groups_identical_files(self, workspace, hash_algo):
+        (workspace / "copy.txt").write_text("content")
+        (workspace / "other.txt").write_text("different")
+
+        duplicates = BaseFileOperations.find_duplicates(
+            str(workspace), [".txt"], recursive=False, hash_algo=hash_algo
+        )
+
+        assert len(duplicates) == 1
+        group = next(iter(duplicates.values()))
+        assert sorted(os.path.basename(p) for p in group) == [
+            "copy.txt",
+            "test_file.txt",
+        ]
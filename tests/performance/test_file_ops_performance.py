@@ -10,24 +10,29 @@
 # ===----------------------------------------------------------------------=== #
 import pytest
 import time
+from concurrent.futures import ThreadPoolExecutor
 from sok.file_operations.base_operations import BaseFileOperations
 
 
 class TestFileOperationsPerformance:
-    @pytest.fixture
-    def large_dataset(self, tmp_path):
-        """Creates a dataset with many files to simulate a large library."""
-        base_dir = tmp_path / "large_library"
-        base_dir.mkdir()
+    @pytest.fixture(scope="session")
+    def large_dataset(self, tmp_path_factory):
+        """Creates a dataset with many files to simulate a large library.
+
+        Built once per session: the benchmarks only read it.
+        """
+        base_dir = tmp_path_factory.mktemp("large_library")
 
         file_count = 1000  # Adjustable load
 
-        # Create dummy files
-        for i in range(file_count):
-            # Create some duplicates every 10 files
-            content = f"content_{i % (file_count // 10)}"
-            p = base_dir / f"file_{i}.txt"
-            p.write_text(content)
+        # Create dummy files, with some duplicates every 10 files
+        pairs = [
+            (base_dir / f"file_{i}.txt", f"content_{i % (file_count // 10)}".encode())
+            for i in range(file_count)
+        ]
+        # Overlap the create/write syscalls across threads
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            list(pool.map(lambda pair: pair[0].write_bytes(pair[1]), pairs))
 
         return str(base_dir)
 
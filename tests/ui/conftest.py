@@ -0,0 +1,63 @@
+# ===----------------------------------------------------------------------=== #
+#
+# This source file is part of the S.O.K open source project
+#
+# Copyright (c) 2026 S.O.K Team
+# Licensed under the MIT License
+#
+# See LICENSE for license information
+#
+# ===----------------------------------------------------------------------=== #
+"""
+Fixtures partagées par les tests d'interface.
+"""
+
+from pathlib import Path
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from sok.ui.controllers.worker_runner import WorkerRunner
+
+_UI_TESTS = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items):
+    """Keep UI tests in one xdist worker under ``--dist loadgroup``.
+
+    Each worker has its own QApplication, but the module-scoped widget
+    fixtures and WorkerRunner stub would otherwise be rebuilt in every
+    worker that receives part of a module.
+    """
+    for item in items:
+        if _UI_TESTS in item.path.parents:
+            item.add_marker(pytest.mark.xdist_group("qt"))
+
+
+def _run_stub(self, worker, on_finished, on_error, on_progress=None):
+    """Finish immediately instead of starting a QThread."""
+    try:
+        if on_finished:
+            on_finished(None)
+    finally:
+        self._thread = None
+        self._current_worker = None
+    return worker
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stub_worker_runner():
+    """Avoid spinning real QThreads in tests to prevent teardown warnings.
+
+    Patched once per UI test module rather than around every test, and
+    restored before tests outside tests/ui run.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(WorkerRunner, "run", _run_stub)
+        yield
+
+
+@pytest.fixture(scope="session")
+def qapp_singleton():
+    """QApplication for state-only tests that do not need qtbot."""
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,69 @@
+# ===----------------------------------------------------------------------=== #
+#
+# This source file is part of the S.O.K open source project
+#
+# Copyright (c) 2026 S.O.K Team
+# Licensed under the MIT License
+#
+# See LICENSE for license information
+#
+# ===----------------------------------------------------------------------=== #
+"""
+Tests unitaires pour le modèle de prévisualisation de l'organisation.
+"""
+
+from pathlib import Path
+
+from PySide6.QtCore import Qt
+
+from sok.ui.components.preview import PreviewModel
+
+
+class TestPreviewModel:
+    """Tests du PreviewModel."""
+
+    def test_set_files_resets_names(self, qtbot):
+        """Rows expose the filename and start without a new name."""
+        model = PreviewModel()
+        model.set_files([Path("/a/one.mkv"), Path("/a/two.mkv")])
+
+        assert model.rowCount() == 2
+        assert model.data(model.index(1), Qt.ItemDataRole.DisplayRole) == "two.mkv"
+        assert model.data(model.index(0), PreviewModel.NewNameRole) == ""
+
+    def test_set_new_names_emits_once(self, qtbot):
+        """Names are applied in row order with a single dataChanged."""
+        model = PreviewModel()
+        model.set_files([Path("one.mkv"), Path("two.mkv")])
+
+        with qtbot.waitSignal(model.dataChanged) as blocker:
+            model.set_new_names(["A.mkv", "B.mkv"])
+
+        assert blocker.args[0].row() == 0
+        assert blocker.args[1].row() == 1
+        assert model.new_names == ["A.mkv", "B.mkv"]
+
+    def test_apply_names_keeps_unknown_rows(self, qtbot):
+        """Rows missing from the mapping keep their current name."""
+        model = PreviewModel()
+        model.set_files([Path("one.mkv"), Path("two.mkv")])
+        model.set_new_names(["A.mkv", "B.mkv"])
+
+        model.apply_names({Path("two.mkv"): "C.mkv", Path("gone.mkv"): "X"})
+
+        assert model.new_names == ["A.mkv", "C.mkv"]
+
+    def test_unchanged_names_do_not_emit(self, qtbot):
+        """Reapplying the same names leaves the view untouched."""
+        model = PreviewModel()
+        model.set_files([Path("one.mkv"), Path("two.mkv"), Path("three.mkv")])
+        model.set_new_names(["A.mkv", "B.mkv", "C.mkv"])
+
+        with qtbot.assertNotEmitted(model.dataChanged):
+            model.set_new_names(["A.mkv", "B.mkv", "C.mkv"])
+
+        with qtbot.waitSignal(model.dataChanged) as blocker:
+            model.apply_names({Path("two.mkv"): "D.mkv"})
+
+        assert blocker.args[0].row() == 1
+        assert blocker.args[1].row() == 1
@@ -14,13 +14,69 @@ Tests unitaires pour le composant SearchPanel.
 Ces tests vérifient le comportement isolé du panel de recherche,
 indépendamment de la page d'organisation.
 """
+import pytest
+from PySide6.QtCore import QMetaMethod
+
 from sok.ui.components.organize import SearchPanel
+from sok.ui.components.search import SearchResultRow
+
+
+def _reset_panel(panel):
+    """Remet un panel partagé dans son état initial."""
+    panel._search_timer.stop()
+    panel.reset()
+    panel._selected_media = None
+    panel._auto_select = False
+    panel.set_type_by_data(panel._get_default_content_type())
+
+
+def _disconnect_test_slots(panel):
+    """Détache les slots connectés par un test."""
+    for signal in (panel.media_selected, panel.search_started, panel.type_changed):
+        if panel.isSignalConnected(QMetaMethod.fromSignal(signal)):
+            signal.disconnect()
+
+
+@pytest.fixture(scope="module")
+def _shared_video_panel(qapp_singleton):
+    """Panel vidéo construit une seule fois pour le module."""
+    panel = SearchPanel("video")
+    yield panel
+    panel.deleteLater()
+
+
+@pytest.fixture(scope="module")
+def _shared_music_panel(qapp_singleton):
+    """Panel musique construit une seule fois pour le module."""
+    panel = SearchPanel("music")
+    # Combo items are fixed for the panel's lifetime
+    panel._cached_indices = {
+        data: panel._type_combo.findData(data) for data in ("album", "artist")
+    }
+    yield panel
+    panel.deleteLater()
+
+
+@pytest.fixture
+def video_panel(_shared_video_panel):
+    """Panel vidéo partagé, réinitialisé pour chaque test."""
+    _reset_panel(_shared_video_panel)
+    yield _shared_video_panel
+    _disconnect_test_slots(_shared_video_panel)
+
+
+@pytest.fixture
+def music_panel(_shared_music_panel):
+    """Panel musique partagé, réinitialisé pour chaque test."""
+    _reset_panel(_shared_music_panel)
+    yield _shared_music_panel
+    _disconnect_test_slots(_shared_music_panel)
 
 
 class TestSearchPanelInitialization:
     """Tests d'initialisation du SearchPanel."""
 
-    def test_init_video_type(self, qtbot):
+    def test_init_video_type(self, qapp_singleton):
         """Test initialization with video media type."""
         panel = SearchPanel("video")
 
@@ -29,21 +85,21 @@ class TestSearchPanelInitialization:
         assert panel._selected_media is None
         assert panel._auto_select is False
 
-    def test_init_music_type(self, qtbot):
+    def test_init_music_type(self, qapp_singleton):
         """Test initialization with music media type."""
         panel = SearchPanel("music")
 
         assert panel._media_type == "music"
         assert panel._content_type == "album"  # Default for music
 
-    def test_init_book_type(self, qtbot):
+    def test_init_book_type(self, qapp_singleton):
         """Test initialization with book media type."""
         panel = SearchPanel("book")
 
         assert panel._media_type == "book"
         assert panel._content_type == "book"
 
-    def test_init_game_type(self, qtbot):
+    def test_init_game_type(self, qapp_singleton):
         """Test initialization with game media type."""
         panel = SearchPanel("game")
 
@@ -54,26 +110,26 @@ class TestSearchPanelInitialization:
 class TestSearchPanelPublicAPI:
     """Tests de l'API publique du SearchPanel."""
 
-    def test_get_content_type_returns_current_type(self, qtbot):
+    def test_get_content_type_returns_current_type(self, video_panel):
         """Test that get_content_type returns the current selection."""
-        panel = SearchPanel("video")
+        panel = video_panel
 
         assert panel.get_content_type() == "tv"
 
-    def test_get_selected_media_returns_none_initially(self, qtbot):
+    def test_get_selected_media_returns_none_initially(self, video_panel):
         """Test that get_selected_media returns None when nothing selected."""
-        panel = SearchPanel("video")
+        panel = video_panel
 
         assert panel.get_selected_media() is None
 
-    def test_set_type_by_data_changes_content_type(self, qtbot):
+    def test_set_type_by_data_changes_content_type(self, music_panel):
         """Test setting content type by data value.
 
         Uses the music panel because it is the only one with multiple
         content types (album/artist) since movies were moved to their
         own dedicated page.
         """
-        panel = SearchPanel("music")
+        panel = music_panel
 
         panel.set_type_by_data("artist")
         assert panel._content_type == "artist"
@@ -81,31 +137,31 @@ class TestSearchPanelPublicAPI:
         panel.set_type_by_data("album")
         assert panel._content_type == "album"
 
-    def test_set_type_by_data_ignores_invalid_value(self, qtbot):
+    def test_set_type_by_data_ignores_invalid_value(self, video_panel):
         """Test that invalid type values are ignored."""
-        panel = SearchPanel("video")
+        panel = video_panel
         original_type = panel._content_type
 
         panel.set_type_by_data("invalid_type")
         assert panel._content_type == original_type
 
-    def test_set_search_text_updates_input(self, qtbot):
+    def test_set_search_text_updates_input(self, video_panel):
         """Test setting search text programmatically."""
-        panel = SearchPanel("video")
+        panel = video_panel
 
         panel.set_search_text("Breaking Bad")
         assert panel._search_input.text() == "Breaking Bad"
 
-    def test_set_status_updates_label(self, qtbot):
+    def test_set_status_updates_label(self, video_panel):
         """Test setting status message."""
-        panel = SearchPanel("video")
+        panel = video_panel
 
         panel.set_status("Recherche en cours...")
         assert panel._status_label.text() == "Recherche en cours..."
 
-    def test_update_selected_media_merges_details(self, qtbot):
+    def test_update_selected_media_merges_details(self, video_panel):
         """Test that update_selected_media merges new details."""
-        panel = SearchPanel("video")
+        panel = video_panel
         panel._selected_media = {"id": 123, "name": "Test"}
 
         panel.update_selected_media({"episodes": {"1x01": "Pilot"}})
@@ -114,9 +170,9 @@ class TestSearchPanelPublicAPI:
         assert panel._selected_media["name"] == "Test"
         assert panel._selected_media["episodes"] == {"1x01": "Pilot"}
 
-    def test_update_selected_media_does_nothing_if_none(self, qtbot):
+    def test_update_selected_media_does_nothing_if_none(self, video_panel):
         """Test that update_selected_media is safe when nothing selected."""
-        panel = SearchPanel("video")
+        panel = video_panel
 
         # Should not raise
         panel.update_selected_media({"episodes": {}})
@@ -126,27 +182,27 @@ class TestSearchPanelPublicAPI:
 class TestSearchPanelReset:
     """SearchPanel reset tests."""
 
-    def test_reset_clears_search_input(self, qtbot):
+    def test_reset_clears_search_input(self, video_panel):
         """Test that reset clears the search input."""
-        panel = SearchPanel("video")
+        panel = video_panel
         panel._search_input.setText("Some query")
 
         panel.reset()
 
         assert panel._search_input.text() == ""
 
-    def test_reset_clears_selected_media(self, qtbot):
+    def test_reset_clears_selected_media(self, video_panel):
         """Test that reset clears selected media."""
-        panel = SearchPanel("video")
+        panel = video_panel
         panel._selected_media = {"id": 123}
 
         panel.reset()
 
         assert panel._selected_media is None
 
-    def test_reset_clears_status(self, qtbot):
+    def test_reset_clears_status(self, video_panel):
         """Test that reset clears status label."""
-        panel = SearchPanel("video")
+        panel = video_panel
         panel._status_label.setText("Some status")
 
         panel.reset()
@@ -157,9 +213,9 @@ class TestSearchPanelReset:
 class TestSearchPanelResults:
     """Results display tests."""
 
-    def test_display_results_empty_shows_no_results(self, qtbot):
+    def test_display_results_empty_shows_no_results(self, video_panel):
         """Test that empty results show appropriate message."""
-        panel = SearchPanel("video")
+        panel = video_panel
 
         panel.display_results([])
 
@@ -172,9 +228,9 @@ class TestSearchPanelResults:
             or "result" in text
         )
 
-    def test_display_results_shows_count(self, qtbot):
+    def test_display_results_shows_count(self, video_panel):
         """Test that results count is displayed."""
-        panel = SearchPanel("video")
+        panel = video_panel
         results = [
             {"id": 1, "name": "Show 1"},
             {"id": 2, "name": "Show 2"},
@@ -183,11 +239,14 @@ class TestSearchPanelResults:
 
         panel.display_results(results)
 
+        layout = panel._results_layout
+        rows = [layout.itemAt(i).widget() for i in range(layout.count())]
+        assert sum(isinstance(row, SearchResultRow) for row in rows) == 3
         assert "3" in panel._status_label.text()
 
-    def test_display_results_makes_container_visible(self, qtbot):
+    def test_display_results_makes_container_visible(self, video_panel):
         """Test that results container becomes visible (internal state)."""
-        panel = SearchPanel("video")
+        panel = video_panel
         results = [{"id": 1, "name": "Test Show"}]
 
         panel.display_results(results)
@@ -198,18 +257,18 @@ class TestSearchPanelResults:
             or not panel._results_container.isHidden()
         )
 
-    def test_clear_results_hides_container(self, qtbot):
+    def test_clear_results_hides_container(self, video_panel):
         """Test that clear_results hides the results container."""
-        panel = SearchPanel("video")
+        panel = video_panel
         panel._results_container.setVisible(True)
 
         panel.clear_results()
 
         assert not panel._results_container.isVisible()
 
-    def test_display_error_updates_status(self, qtbot):
+    def test_display_error_updates_status(self, video_panel):
         """Test that display_error shows error message."""
-        panel = SearchPanel("video")
+        panel = video_panel
 
         panel.display_error("Connection failed")
 
@@ -220,27 +279,27 @@ class TestSearchPanelResults:
 class TestSearchPanelSignals:
     """SearchPanel signals tests."""
 
-    def test_type_changed_signal_emitted(self, qtbot):
+    def test_type_changed_signal_emitted(self, music_panel):
         """Test that type_changed signal is emitted when type changes.
 
         Uses the music panel because the video panel now only exposes
         the TV Series option (movies have their own dedicated page).
         """
-        panel = SearchPanel("music")
+        panel = music_panel
         signal_received = []
 
         panel.type_changed.connect(lambda t: signal_received.append(t))
 
         # Change type from album (default) to artist
-        idx = panel._type_combo.findData("artist")
+        idx = panel._cached_indices["artist"]
         if idx >= 0:
             panel._type_combo.setCurrentIndex(idx)
 
         assert "artist" in signal_received
 
-    def test_search_started_signal_emitted(self, qtbot):
+    def test_search_started_signal_emitted(self, video_panel):
         """Test that search_started signal is emitted."""
-        panel = SearchPanel("video")
+        panel = video_panel
         signal_received = []
 
         panel.search_started.connect(lambda q: signal_received.append(q))
@@ -255,9 +314,9 @@ class TestSearchPanelSignals:
 class TestSearchPanelAutoSelect:
     """Tests du comportement auto-select."""
 
-    def test_auto_select_flag_set_by_set_search_text(self, qtbot):
+    def test_auto_select_flag_set_by_set_search_text(self, video_panel):
         """Test that auto_select flag is set correctly."""
-        panel = SearchPanel("video")
+        panel = video_panel
 
         # Track if search was emitted
         search_emitted = []
@@ -269,9 +328,9 @@ class TestSearchPanelAutoSelect:
         assert len(search_emitted) == 1
         assert search_emitted[0] == "Test"
 
-    def test_display_results_with_auto_select_emits_media_selected(self, qtbot):
+    def test_display_results_with_auto_select_emits_media_selected(self, video_panel):
         """Test that auto_select triggers media_selected on first result."""
-        panel = SearchPanel("video")
+        panel = video_panel
         panel._auto_select = True
 
         signal_received = []
@@ -288,9 +347,9 @@ class TestSearchPanelAutoSelect:
 class TestSearchPanelRetranslate:
     """Tests de la traduction dynamique."""
 
-    def test_retranslate_ui_preserves_selection(self, qtbot):
+    def test_retranslate_ui_preserves_selection(self, video_panel):
         """Test that retranslate_ui preserves the current type selection."""
-        panel = SearchPanel("video")
+        panel = video_panel
 
         # Select "movie"
         panel.set_type_by_data("movie")
@@ -8,28 +8,9 @@
 # See LICENSE for license information
 #
 # ===----------------------------------------------------------------------=== #
-import pytest
-from unittest.mock import patch
 
 # Import the widget to test
 from sok.ui.components.search import SelectedMediaWidget
-from sok.ui.controllers.worker_runner import WorkerRunner
-
-
-@pytest.fixture(autouse=True)
-def no_threads(monkeypatch):
-    """Avoid spinning real QThreads in tests to prevent teardown warnings."""
-
-    def _run_stub(self, worker, on_finished, on_error, on_progress=None):
-        try:
-            if on_finished:
-                on_finished(None)
-        finally:
-            self._thread = None
-            self._current_worker = None
-        return worker
-
-    monkeypatch.setattr(WorkerRunner, "run", _run_stub)
 
 
 class TestSearchWidgets:
@@ -42,9 +23,12 @@ class TestSearchWidgets:
         assert widget._type is None
         assert widget._empty is True
 
-    @patch("urllib.request.urlopen")  # Mock network call for poster
-    def test_selected_media_widget_set_media(self, mock_urlopen, qtbot):
+    def test_selected_media_widget_set_media(self, qtbot, monkeypatch):
         """Test setting media data updates the widget state."""
+        # Skip the poster download and decoding entirely
+        monkeypatch.setattr(
+            SelectedMediaWidget, "_start_image_loading", lambda self, url: None
+        )
         widget = SelectedMediaWidget()
 
         # Mock data
@@ -54,13 +38,6 @@ class TestSearchWidgets:
             "poster_path": "/path.jpg",
         }
 
-        # Setup mock for image download
-        # We simulate a small valid image response (not strictly necessary if we mock _load_poster,
-        # but mocking urlopen is closer to integration)
-        # However, to be safe and avoid QPixmap errors with garbage data,
-        # let's just mock _load_poster directly if possible, OR just check the data state.
-
-        # Let's verify data state logic first.
         widget.set_media(movie_data, "movie")
 
         assert widget._data == movie_data
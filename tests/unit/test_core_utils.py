@@ -8,31 +8,67 @@
 # See LICENSE for license information
 #
 # ===----------------------------------------------------------------------=== #
+import pytest
+
 from sok.core.utils import format_name, extract_episode_info, is_video_file
 
 
 class TestCoreUtils:
-    def test_format_name(self):
-        # Test removing forbidden characters
-        assert format_name("file/with|forbidden*chars?") == "filewithforbiddenchars"
-        # Test replacing multiple spaces
-        assert format_name("file  with   spaces") == "file with spaces"
-        # Test mixed
-        assert format_name(" cool < file > name ") == " cool file name "
-
-    def test_extract_episode_info(self):
-        # Standard format S01E01
-        info = extract_episode_info("MyShow.S01E05.720p.mkv")
-        assert info is not None
-        assert info["name"] == "MyShow."
-        assert info["season"] == 1
-        assert info["episode"] == 5
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            # Removing forbidden characters
+            ("file/with|forbidden*chars?", "filewithforbiddenchars"),
+            # Replacing multiple spaces
+            ("file  with   spaces", "file with spaces"),
+            # Mixed
+            (" cool < file > name ", " cool file name "),
+        ],
+    )
+    def test_format_name(self, raw, expected):
+        assert format_name(raw) == expected
 
-        # No match
-        assert extract_episode_info("MyMovie.2023.mkv") is None
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            # Standard format S01E01
+            ("MyShow.S01E05.720p.mkv", {"name": "MyShow.", "season": 1, "episode": 5}),
+            ("Show S1E2.mkv", {"name": "Show", "season": 1, "episode": 2}),
+            ("Show.S10E100.mkv", {"name": "Show.", "season": 10, "episode": 100}),
+            (
+                "Show - S02E03 - Title.mp4",
+                {"name": "Show -", "season": 2, "episode": 3, "rest": " - Title.mp4"},
+            ),
+            (
+                "The.Office.US.S09E23.Finale.mkv",
+                {"name": "The.Office.US.", "season": 9, "episode": 23},
+            ),
+            ("S01E01.mkv", {"name": "", "season": 1, "episode": 1, "rest": ".mkv"}),
+            # No match
+            ("MyMovie.2023.mkv", None),
+            ("Show.S01.mkv", None),
+            ("Show.1x05.mkv", None),
+            ("Show.SxxE01.mkv", None),
+            ("show.s01e05.mkv", None),
+        ],
+    )
+    def test_extract_episode_info(self, filename, expected):
+        info = extract_episode_info(filename)
+        if expected is None:
+            assert info is None
+        else:
+            assert info is not None
+            for key, value in expected.items():
+                assert info[key] == value
 
-    def test_is_video_file(self):
-        assert is_video_file("movie.mkv") is True
-        assert is_video_file("video.mp4") is True
-        assert is_video_file("image.jpg") is False
-        assert is_video_file("document.txt") is False
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            ("movie.mkv", True),
+            ("video.mp4", True),
+            ("image.jpg", False),
+            ("document.txt", False),
+        ],
+    )
+    def test_is_video_file(self, filename, expected):
+        assert is_video_file(filename) is expected
@@ -9,52 +9,79 @@
 #
 # ===----------------------------------------------------------------------=== #
 
+import pytest
+
 from sok.core.adapters.media_adapters import adapt_search_results, adapt_details
 from sok.core.interfaces import ContentType
 
+_MOVIE = ContentType.MOVIE
+_TV = ContentType.TV_SERIES
+_ALBUM = ContentType.ALBUM
 
-def test_adapt_search_results_movie_fields_preserved():
-    raw = [
-        {
-            "id": "123",
-            "title": "Inception",
-            "poster_path": "/poster.jpg",
-            "release_date": "2010-07-16",
-        }
-    ]
-
-    out = adapt_search_results(ContentType.MOVIE, raw)
-
-    assert out["results"][0]["id"] == "123"
-    assert out["results"][0]["title"] == "Inception"
-    assert out["results"][0]["poster_path"] == "/poster.jpg"
-    assert out["results"][0]["release_date"] == "2010-07-16"
-    assert out["results"][0]["media_type"] == "movie"
-
-
-def test_adapt_search_results_series_defaults():
-    raw = [
-        {
-            "id": "abc",
-            "name": "Dark",
-        }
-    ]
-
-    out = adapt_search_results(ContentType.TV_SERIES, raw)
+# Adapters copy their input, so payloads are shared between cases
+_INCEPTION_RAW = (
+    {
+        "id": "123",
+        "title": "Inception",
+        "poster_path": "/poster.jpg",
+        "release_date": "2010-07-16",
+    },
+)
+_DARK_RAW = ({"id": "abc", "name": "Dark"},)
+_DARK_DETAILS = {"name": "Dark"}
+_ALBUM_DETAILS = {"name": "Album", "tracks": [{"title": "t1"}]}
 
-    assert out["results"][0]["name"] == "Dark"
-    assert out["results"][0]["media_type"] == "tv"
 
+@pytest.mark.parametrize(
+    "content_type, raw, expected",
+    [
+        pytest.param(
+            _MOVIE,
+            _INCEPTION_RAW,
+            {
+                "id": "123",
+                "title": "Inception",
+                "poster_path": "/poster.jpg",
+                "release_date": "2010-07-16",
+                "media_type": "movie",
+            },
+            id="movie_fields_preserved",
+        ),
+        pytest.param(
+            _TV,
+            _DARK_RAW,
+            {"name": "Dark", "media_type": "tv"},
+            id="series_defaults",
+        ),
+    ],
+)
+def test_adapt_search_results(content_type, raw, expected):
+    out = adapt_search_results(content_type, list(raw))
 
-def test_adapt_details_adds_defaults_for_series():
-    payload = {"name": "Dark"}
-    out = adapt_details(ContentType.TV_SERIES, payload)
+    first = out["results"][0]
+    for key, value in expected.items():
+        assert first[key] == value
 
-    assert out["name"] == "Dark"
-    assert out.get("seasons") == []
 
+@pytest.mark.parametrize(
+    "content_type, payload, expected",
+    [
+        pytest.param(
+            _TV,
+            _DARK_DETAILS,
+            {"name": "Dark", "seasons": []},
+            id="adds_defaults_for_series",
+        ),
+        pytest.param(
+            _ALBUM,
+            _ALBUM_DETAILS,
+            {"tracks": [{"title": "t1"}]},
+            id="keeps_tracks_for_album",
+        ),
+    ],
+)
+def test_adapt_details(content_type, payload, expected):
+    out = adapt_details(content_type, payload)
 
-def test_adapt_details_keeps_tracks_for_album():
-    payload = {"name": "Album", "tracks": [{"title": "t1"}]}
-    out = adapt_details(ContentType.ALBUM, payload)
-    assert out["tracks"] == [{"title": "t1"}]
+    for key, value in expected.items():
+        assert out.get(key) == value
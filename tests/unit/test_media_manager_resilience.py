@@ -8,47 +8,73 @@
 # See LICENSE for license information
 #
 # ===----------------------------------------------------------------------=== #
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from sok.core.media_manager import UniversalMediaManager
+from sok.core import response_cache
+from sok.core.media_manager import (
+    UniversalMediaManager,
+    cache_details,
+    clear_details_cache,
+    get_cached_details,
+)
 from sok.core.interfaces import ContentType, MediaType
-from sok.core.exceptions import APIError, UnsupportedMediaTypeError
+from sok.core.exceptions import APIError, APITimeoutError, UnsupportedMediaTypeError
 
 
-@pytest.mark.asyncio
-async def test_search_wraps_api_errors_with_context():
+# Failing API method -> arguments the manager is called with
+_FAILING_CALLS = {
+    "search": ("matrix", ContentType.MOVIE),
+    "get_details": ("123", ContentType.TV_SERIES),
+}
+
+
+@pytest.fixture(params=sorted(_FAILING_CALLS))
+def failing_manager(request):
+    """Manager whose only video API fails on the parametrized method."""
     manager = UniversalMediaManager(load_defaults=False)
     failing_api = MagicMock()
     failing_api.supported_media_types = [MediaType.VIDEO]
-    failing_api.search = AsyncMock(side_effect=RuntimeError("network down"))
+    setattr(
+        failing_api,
+        request.param,
+        AsyncMock(side_effect=RuntimeError(f"{request.param} network down")),
+    )
 
-    manager.register_api("tmdb_mock", failing_api)
-    manager.set_current_api_for_media_type(MediaType.VIDEO, "tmdb_mock")
+    manager.register_api("failing_mock", failing_api)
+    manager.set_current_api_for_media_type(MediaType.VIDEO, "failing_mock")
+    return manager, request.param
+
+
+@pytest.mark.asyncio
+async def test_api_errors_are_wrapped_with_context(failing_manager):
+    manager, method = failing_manager
 
     with pytest.raises(APIError) as excinfo:
-        await manager.search("matrix", ContentType.MOVIE)
+        await getattr(manager, method)(*_FAILING_CALLS[method])
 
     message = str(excinfo.value)
-    assert "tmdb_mock" in message
-    assert "network down" in message
+    assert "failing_mock" in message
+    assert f"{method} network down" in message
 
 
 @pytest.mark.asyncio
-async def test_get_details_wraps_api_errors_with_context():
-    manager = UniversalMediaManager(load_defaults=False)
-    failing_api = MagicMock()
-    failing_api.supported_media_types = [MediaType.VIDEO]
-    failing_api.get_details = AsyncMock(side_effect=RuntimeError("timeout"))
+async def test_search_timeout_raises_api_timeout():
+    async def slow_search(*_args, **_kwargs):
+        await asyncio.sleep(1)
+        return {"results": []}
 
-    manager.register_api("tvdb_mock", failing_api)
-    manager.set_current_api_for_media_type(MediaType.VIDEO, "tvdb_mock")
+    manager = UniversalMediaManager(load_defaults=False)
+    slow_api = MagicMock()
+    slow_api.supported_media_types = [MediaType.VIDEO]
+    slow_api.search = slow_search
 
-    with pytest.raises(APIError) as excinfo:
-        await manager.get_details("123", ContentType.TV_SERIES)
+    manager.register_api("slow_mock", slow_api)
+    manager.set_current_api_for_media_type(MediaType.VIDEO, "slow_mock")
 
-    message = str(excinfo.value)
-    assert "tvdb_mock" in message
-    assert "timeout" in message
+    with pytest.raises(APITimeoutError):
+        await manager.search("matrix", ContentType.MOVIE, timeout=0.01)
 
 
 def test_get_current_api_falls_back_to_first_available():
@@ -81,3 +107,47 @@ def test_init_can_skip_default_loading():
     manager = UniversalMediaManager(load_defaults=False)
     assert manager.apis == {}
     assert manager.current_apis == {}
+
+
+def test_details_cache_returns_copies_until_expiry(monkeypatch):
+    clear_details_cache()
+    now = [100.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    key = ("1", ContentType.MOVIE, "en-EN", False)
+
+    cache_details(key, {"title": "Matrix"}, ttl=10)
+    cached = get_cached_details(key)
+    cached["title"] = "changed"
+
+    assert get_cached_details(key) == {"title": "Matrix"}
+    now[0] = 110.0
+    assert get_cached_details(key) is None
+
+
+def test_response_cache_persists_to_sqlite(tmp_path):
+    db_path = tmp_path / "cache.sqlite3"
+    key = ("matrix", "movie", "en-EN", "tmdb")
+
+    response_cache.ResponseCache(4, 60, db_path).set(key, [{"title": "Matrix"}])
+    reopened = response_cache.ResponseCache(4, 60, db_path)
+
+    assert reopened.get(key) == [{"title": "Matrix"}]
+    reopened.invalidate("matrix")
+    assert response_cache.ResponseCache(4, 60, db_path).get(key) is None
+
+
+def test_response_cache_async_tier_and_purge_on_open(tmp_path):
+    db_path = tmp_path / "cache.sqlite3"
+    key = ("matrix", "movie", "en-EN", "tmdb")
+    writer = response_cache.ResponseCache(4, 60, db_path)
+
+    asyncio.run(writer.aset(key, [{"title": "Matrix"}]))
+    writer.set(("old",), [], ttl=-1)
+    writer.close()
+    reopened = response_cache.ResponseCache(4, 60, db_path)
+
+    assert asyncio.run(reopened.aget(key)) == [{"title": "Matrix"}]
+    assert reopened._db_execute("SELECT key FROM responses", ()) == [
+        (reopened._db_key(key),)
+    ]
+    reopened.close()
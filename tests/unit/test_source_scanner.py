@@ -0,0 +1,64 @@
+# ===----------------------------------------------------------------------=== #
+#
+# This source file is part of the S.O.K open source project
+#
+# Copyright (c) 2026 S.O.K Team
+# Licensed under the MIT License
+#
+# See LICENSE for license information
+#
+# ===----------------------------------------------------------------------=== #
+from pathlib import Path
+
+from sok.file_operations.music_operations import MusicFileOperations
+from sok.file_operations.video_operations import VideoFileOperations
+from sok.ui.controllers.source_scanner import scan_sources, scan_sources_multi
+
+
+class TestScanSourcesMulti:
+    def test_single_walk_buckets_by_extension(self, tmp_path):
+        (tmp_path / "season").mkdir()
+        (tmp_path / "season" / "Show.S01E01.mkv").write_bytes(b"")
+        (tmp_path / "Movie.2020.MP4").write_bytes(b"")
+        (tmp_path / "track.mp3").write_bytes(b"")
+        (tmp_path / "notes.txt").write_bytes(b"")
+
+        ops = {"video": VideoFileOperations(), "music": MusicFileOperations()}
+        result = scan_sources_multi(ops, [tmp_path, tmp_path])
+
+        assert sorted(p.name for p in result["video"]) == [
+            "Movie.2020.MP4",
+            "Show.S01E01.mkv",
+        ]
+        assert [p.name for p in result["music"]] == ["track.mp3"]
+
+    def test_media_types_restricts_buckets(self, tmp_path):
+        (tmp_path / "track.mp3").write_bytes(b"")
+        (tmp_path / "movie.mkv").write_bytes(b"")
+
+        ops = {"video": VideoFileOperations(), "music": MusicFileOperations()}
+        result = scan_sources_multi(ops, [tmp_path], media_types=["music"])
+
+        assert list(result) == ["music"]
+        assert [p.name for p in result["music"]] == ["track.mp3"]
+
+
+class TestScanSources:
+    def test_matches_find_files_once_per_file(self, tmp_path):
+        (tmp_path / "album").mkdir()
+        (tmp_path / "album" / "01.FLAC").write_bytes(b"")
+        (tmp_path / "track.mp3").write_bytes(b"")
+        (tmp_path / "cover.jpg").write_bytes(b"")
+
+        ops = MusicFileOperations()
+        result = scan_sources(ops, [tmp_path, tmp_path])
+
+        assert sorted(result) == sorted(Path(f) for f in ops.find_files(str(tmp_path)))
+        assert len(result) == 2
+
+    def test_should_stop_ends_the_walk(self, tmp_path):
+        (tmp_path / "track.mp3").write_bytes(b"")
+
+        result = scan_sources(MusicFileOperations(), [tmp_path], lambda: True)
+
+        assert result == []
@@ -14,40 +14,113 @@ Verify i18n keys consistency.
 Scans source code for tr("key", ...) calls and compares with JSON translation files.
 """
 
+import os
 import re
+import sys
 import json
+import mmap
+import tempfile
 from pathlib import Path
-from typing import Set, Dict
+from typing import FrozenSet, Set, Dict, Tuple
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # Optional speedup
+    json_loads = json.loads
+
+# tr("key", ...) calls; a bytes pattern so files can be matched in place
+_TR_PATTERN = re.compile(rb'\btr\(\s*([\'"])(.+?)\1\s*[,)]')
+# Keys of each translation file, reused while its mtime and size are unchanged
+_KEYS_MEMO_PATH = Path(__file__).resolve().parent / ".cache" / "i18n_keys.json"
+
+KeysMemo = Dict[str, Tuple[int, int, FrozenSet[str]]]
+
+
+def _scan_one(path: Path) -> Set[str]:
+    """Returns the tr() keys used in one Python file."""
+    try:
+        with open(path, "rb") as f:
+            # mmap rejects empty files
+            if f.seek(0, 2) == 0:
+                return set()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return {
+                    m.group(2).decode("utf-8") for m in _TR_PATTERN.finditer(content)
+                }
+    except Exception as e:
+        print(f"Error reading {path}: {e}")
+        return set()
 
 
 def scan_code_for_keys(src_dir: Path) -> Set[str]:
     """Scans Python files for tr("key", ...) patterns."""
-    keys = set()
-    pattern = re.compile(r'tr([\'"])(.+?)\1\s*[,)]')
+    keys: Set[str] = set()
+    keys.update(*map(_scan_one, src_dir.rglob("*.py")))
+    return keys
 
-    for path in src_dir.rglob("*.py"):
-        try:
-            content = path.read_text(encoding="utf-8")
-            matches = pattern.findall(content)
-            for match in matches:
-                keys.add(match[1])
-        except Exception as e:
-            print(f"Error reading {path}: {e}")
 
-    return keys
+def _load_keys_memo() -> KeysMemo:
+    """Returns the keys memo from previous runs, or an empty one."""
+    try:
+        raw = json.loads(_KEYS_MEMO_PATH.read_bytes())
+        return {
+            path: (int(mtime_ns), int(size), frozenset(keys))
+            for path, (mtime_ns, size, keys) in raw.items()
+        }
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def _save_keys_memo(memo: KeysMemo) -> None:
+    """Writes the keys memo atomically; failures only cost the next run."""
+    try:
+        _KEYS_MEMO_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_KEYS_MEMO_PATH.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        path: [mtime_ns, size, sorted(keys)]
+                        for path, (mtime_ns, size, keys) in memo.items()
+                    },
+                    f,
+                )
+            os.replace(tmp_path, _KEYS_MEMO_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"Could not write {_KEYS_MEMO_PATH}: {e}")
 
 
 def load_translation_files(i18n_dir: Path) -> Dict[str, Set[str]]:
-    """Loads all JSON files and returns keys for each language."""
+    """Loads all JSON files and returns keys for each language.
+
+    Files whose mtime and size match the memo of a previous run are not
+    parsed again.
+    """
     translations = {}
+    memo = _load_keys_memo()
+    changed = False
     for json_file in i18n_dir.glob("*.json"):
         try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                translations[json_file.name] = set(data.keys())
+            st = json_file.stat()
+            cached = memo.get(str(json_file))
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                translations[json_file.name] = set(cached[2])
+                continue
+            # Parsed from bytes: both parsers decode UTF-8 themselves
+            data = json_loads(json_file.read_bytes())
+            translations[json_file.name] = set(data.keys())
+            memo[str(json_file)] = (st.st_mtime_ns, st.st_size, frozenset(data))
+            changed = True
         except Exception as e:
             print(f"Error reading {json_file}: {e}")
 
+    if changed:
+        _save_keys_memo(memo)
     return translations
 
 
@@ -68,31 +141,32 @@ def main():
         return
 
     all_ok = True
+    # The report can list hundreds of keys: build it, then write it once
+    lines = []
 
     for lang_file, keys in lang_keys.items():
         missing = code_keys - keys
         extra = keys - code_keys
 
-        print(f"[{lang_file}]")
+        lines.append(f"[{lang_file}]")
         if not missing and not extra:
-            print("All keys matched.")
+            lines.append("All keys matched.")
         else:
             if missing:
                 all_ok = False
-                print(f"Missing keys ({len(missing)}):")
-                for k in sorted(missing):
-                    print(f"    - {k}")
+                lines.append(f"Missing keys ({len(missing)}):")
+                lines.extend(f"    - {k}" for k in sorted(missing))
 
             if extra:
-                print(f"Unused/Extra keys ({len(extra)}):")
-                for k in sorted(extra):
-                    print(f"    - {k}")
-        print()
+                lines.append(f"Unused/Extra keys ({len(extra)}):")
+                lines.extend(f"    - {k}" for k in sorted(extra))
+        lines.append("")
 
     if all_ok:
-        print("Perfect! All code keys are translated in all languages.")
+        lines.append("Perfect! All code keys are translated in all languages.")
     else:
-        print("Some translations are missing. Please update your JSON files.")
+        lines.append("Some translations are missing. Please update your JSON files.")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":